@@ -1,3 +1,4 @@
+import asyncio
 import re
 import shutil
 import subprocess
@@ -111,12 +112,19 @@ class Agent(BaseAgent):
         default=None,
         description="Embedder configuration for the agent.",
     )
+    native_tool_calling: bool = Field(
+        default=False,
+        description="Use the LLM's native function calling for tools instead of ReAct text parsing, when the model supports it.",
+    )
 
     @model_validator(mode="after")
     def post_init_setup(self):
         self.agent_ops_agent_name = self.role
 
         self.llm = create_llm(self.llm)
+        if self.max_rpm and self._rpm_controller and not self._rpm_controller.key:
+            # The model is only known once the default LLM has been resolved.
+            self._rpm_controller = self._create_rpm_controller()
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
 
@@ -169,6 +177,102 @@ class Agent(BaseAgent):
         Returns:
             Output of the agent
         """
+        task_prompt = self._prepare_task_prompt(task, context, tools)
+
+        try:
+            self._emit_execution_started(task, task_prompt)
+            result = self.agent_executor.invoke(
+                self._executor_inputs(task, task_prompt)
+            )["output"]
+        except Exception as e:
+            self._handle_execution_error(task, e)
+            result = self.execute_task(task, context, tools)
+
+        return self._finalize_task_result(task, result)
+
+    async def aexecute_task(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task with the agent without blocking the event loop.
+
+        LLM calls are awaited through ``LLM.acall``; memory and knowledge
+        retrieval run in a worker thread.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+        """
+        task_prompt = await asyncio.to_thread(
+            self._prepare_task_prompt, task, context, tools
+        )
+
+        try:
+            self._emit_execution_started(task, task_prompt)
+            result = (
+                await self.agent_executor.ainvoke(
+                    self._executor_inputs(task, task_prompt)
+                )
+            )["output"]
+        except Exception as e:
+            self._handle_execution_error(task, e)
+            result = await self.aexecute_task(task, context, tools)
+
+        return self._finalize_task_result(task, result)
+
+    def _emit_execution_started(self, task: Task, task_prompt: str) -> None:
+        crewai_event_bus.emit(
+            self,
+            event=AgentExecutionStartedEvent(
+                agent=self,
+                tools=self.tools,
+                task_prompt=task_prompt,
+                task=task,
+            ),
+        )
+
+    def _executor_inputs(self, task: Task, task_prompt: str) -> Dict[str, Any]:
+        return {
+            "input": task_prompt,
+            "tool_names": self.agent_executor.tools_names,
+            "tools": self.agent_executor.tools_description,
+            "ask_for_human_input": task.human_input,
+        }
+
+    def _handle_execution_error(self, task: Task, error: Exception) -> None:
+        """Raise ``error`` unless the task may be executed again.
+
+        litellm errors are never retried and other errors at most
+        ``max_retry_limit`` times; an error that is raised is reported with an
+        ``AgentExecutionErrorEvent``.
+        """
+        if not error.__class__.__module__.startswith("litellm"):
+            self._times_executed += 1
+            if self._times_executed <= self.max_retry_limit:
+                return
+        crewai_event_bus.emit(
+            self,
+            event=AgentExecutionErrorEvent(
+                agent=self,
+                task=task,
+                error=str(error),
+            ),
+        )
+        raise error
+
+    def _prepare_task_prompt(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Build the task prompt with memory and knowledge and create the executor."""
         if self.tools_handler:
             self.tools_handler.last_used_tool = {}  # type: ignore # Incompatible types in assignment (expression has type "dict[Never, Never]", variable has type "ToolCalling")
 
@@ -204,6 +308,7 @@ class Agent(BaseAgent):
                 self.crew._long_term_memory,
                 self.crew._entity_memory,
                 self.crew._user_memory,
+                cache=getattr(self.crew, "_memory_context_cache", None),
             )
             memory = contextual_memory.build_context_for_task(task, context)
             if memory.strip() != "":
@@ -233,49 +338,10 @@ class Agent(BaseAgent):
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
-        try:
-            crewai_event_bus.emit(
-                self,
-                event=AgentExecutionStartedEvent(
-                    agent=self,
-                    tools=self.tools,
-                    task_prompt=task_prompt,
-                    task=task,
-                ),
-            )
-            result = self.agent_executor.invoke(
-                {
-                    "input": task_prompt,
-                    "tool_names": self.agent_executor.tools_names,
-                    "tools": self.agent_executor.tools_description,
-                    "ask_for_human_input": task.human_input,
-                }
-            )["output"]
-        except Exception as e:
-            if e.__class__.__module__.startswith("litellm"):
-                # Do not retry on litellm errors
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            result = self.execute_task(task, context, tools)
+        return task_prompt
 
+    def _finalize_task_result(self, task: Task, result: Any) -> Any:
+        """Apply result_as_answer tool overrides and emit the completion event."""
         if self.max_rpm and self._rpm_controller:
             self._rpm_controller.stop_rpm_counter()
 
@@ -301,10 +367,12 @@ class Agent(BaseAgent):
         """
         tools = tools or self.tools or []
         parsed_tools = self._parse_tools(tools)
+        native_tool_calling = self._use_native_tool_calling(parsed_tools)
 
         prompt = Prompts(
             agent=self,
             tools=tools,
+            native_tool_calling=native_tool_calling,
             i18n=self.i18n,
             use_system_prompt=self.use_system_prompt,
             system_template=self.system_template,
@@ -339,8 +407,18 @@ class Agent(BaseAgent):
                 self._rpm_controller.check_or_wait if self._rpm_controller else None
             ),
             callbacks=[TokenCalcHandler(self._token_process)],
+            native_tool_calling=native_tool_calling,
         )
 
+    def _use_native_tool_calling(self, parsed_tools: List[Any]) -> bool:
+        """Whether tools can be passed to the LLM as function schemas."""
+        if not self.native_tool_calling or not parsed_tools:
+            return False
+        if not all(hasattr(tool, "to_function_schema") for tool in parsed_tools):
+            return False
+        supports_function_calling = getattr(self.llm, "supports_function_calling", None)
+        return bool(supports_function_calling and supports_function_calling())
+
     def get_delegation_tools(self, agents: List[BaseAgent]):
         agent_tools = AgentTools(agents=agents)
         tools = agent_tools.tools()
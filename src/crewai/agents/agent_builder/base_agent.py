@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from copy import copy as shallow_copy
@@ -193,9 +194,7 @@ class BaseAgent(ABC, BaseModel):
         # Set private attributes
         self._logger = Logger(verbose=self.verbose)
         if self.max_rpm and not self._rpm_controller:
-            self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
-            )
+            self._rpm_controller = self._create_rpm_controller()
         if not self._token_process:
             self._token_process = TokenProcess()
 
@@ -214,13 +213,18 @@ class BaseAgent(ABC, BaseModel):
         """Set private attributes."""
         self._logger = Logger(verbose=self.verbose)
         if self.max_rpm and not self._rpm_controller:
-            self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
-            )
+            self._rpm_controller = self._create_rpm_controller()
         if not self._token_process:
             self._token_process = TokenProcess()
         return self
 
+    def _create_rpm_controller(self) -> RPMController:
+        return RPMController(
+            max_rpm=self.max_rpm,
+            key=RPMController.key_for("agent", [self.llm]),
+            logger=self._logger,
+        )
+
     @property
     def key(self):
         source = [
@@ -239,6 +243,15 @@ class BaseAgent(ABC, BaseModel):
     ) -> str:
         pass
 
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task asynchronously. Defaults to running execute_task in a thread."""
+        return await asyncio.to_thread(self.execute_task, task, context, tools)
+
     @abstractmethod
     def create_agent_executor(self, tools=None) -> None:
         pass
@@ -310,6 +323,9 @@ class BaseAgent(ABC, BaseModel):
             knowledge=copied_knowledge,
             knowledge_storage=copied_knowledge_storage,
         )
+        # Copies draw from the same request budget as the original.
+        if self._rpm_controller:
+            copied_agent._rpm_controller = self._rpm_controller
 
         return copied_agent
 
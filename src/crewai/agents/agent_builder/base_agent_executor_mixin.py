@@ -1,3 +1,5 @@
+import logging
+import random
 import time
 from typing import TYPE_CHECKING, Optional
 
@@ -48,7 +50,12 @@ class CrewAgentExecutorMixin:
                 pass
 
     def _create_long_term_memory(self, output) -> None:
-        """Create and save long-term and entity memory items based on evaluation."""
+        """Evaluate the task for long-term and entity memory.
+
+        Only a ``memory_sample_rate`` share of the tasks is evaluated. The
+        evaluation runs on the crew's memory job queue when it has one, so
+        the next task does not wait for it.
+        """
         if (
             self.crew
             and self.crew.memory
@@ -57,25 +64,47 @@ class CrewAgentExecutorMixin:
             and self.task
             and self.agent
         ):
+            if random.random() >= self.crew.memory_sample_rate:
+                return
+            memory_jobs = getattr(self.crew, "_memory_jobs", None)
+            if memory_jobs is not None:
+                memory_jobs.submit(
+                    self._save_long_term_memory,
+                    self.crew,
+                    self.agent,
+                    self.task,
+                    output.text,
+                )
+            else:
+                self._save_long_term_memory(
+                    self.crew, self.agent, self.task, output.text
+                )
+
+    @staticmethod
+    def _save_long_term_memory(
+        crew: "Crew", agent: "BaseAgent", task: "Task", output_text: str
+    ) -> None:
+        """Create and save long-term and entity memory items based on evaluation."""
+        if crew._long_term_memory and crew._entity_memory:
             try:
-                ltm_agent = TaskEvaluator(self.agent)
-                evaluation = ltm_agent.evaluate(self.task, output.text)
+                ltm_agent = TaskEvaluator(agent, llm=crew.memory_llm)
+                evaluation = ltm_agent.evaluate(task, output_text)
 
                 if isinstance(evaluation, ConverterError):
                     return
 
                 long_term_memory = LongTermMemoryItem(
-                    task=self.task.description,
-                    agent=self.agent.role,
+                    task=task.description,
+                    agent=agent.role,
                     quality=evaluation.quality,
                     datetime=str(time.time()),
-                    expected_output=self.task.expected_output,
+                    expected_output=task.expected_output,
                     metadata={
                         "suggestions": evaluation.suggestions,
                         "quality": evaluation.quality,
                     },
                 )
-                self.crew._long_term_memory.save(long_term_memory)
+                crew._long_term_memory.save(long_term_memory)
 
                 for entity in evaluation.entities:
                     entity_memory = EntityMemoryItem(
@@ -86,13 +115,11 @@ class CrewAgentExecutorMixin:
                             [f"- {r}" for r in entity.relationships]
                         ),
                     )
-                    self.crew._entity_memory.save(entity_memory)
+                    crew._entity_memory.save(entity_memory)
             except AttributeError as e:
-                print(f"Missing attributes for long term memory: {e}")
-                pass
+                logging.error(f"Missing attributes for long term memory: {e}")
             except Exception as e:
-                print(f"Failed to add to long term memory: {e}")
-                pass
+                logging.error(f"Failed to add to long term memory: {e}")
 
     def _ask_human_input(self, final_answer: str) -> str:
         """Prompt human input with mode-appropriate messaging."""
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import re
 from dataclasses import dataclass
@@ -10,11 +11,14 @@ from crewai.agents.parser import (
     AgentAction,
     AgentFinish,
     CrewAgentParser,
+    IncrementalCrewAgentParser,
     OutputParserException,
 )
 from crewai.agents.tools_handler import ToolsHandler
 from crewai.llm import LLM
 from crewai.tools.base_tool import BaseTool
+from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_calling import ToolCalling
 from crewai.tools.tool_usage import ToolUsage, ToolUsageErrorException
 from crewai.utilities import I18N, Printer
 from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
@@ -59,6 +63,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         respect_context_window: bool = False,
         request_within_rpm_limit: Optional[Callable[[], bool]] = None,
         callbacks: List[Any] = [],
+        native_tool_calling: bool = False,
     ):
         self._i18n: I18N = I18N()
         self.llm: LLM = llm
@@ -81,7 +86,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.respect_context_window = respect_context_window
         self.request_within_rpm_limit = request_within_rpm_limit
         self.ask_for_human_input = False
-        self.messages: List[Dict[str, str]] = []
+        self.messages: List[Dict[str, Any]] = []
         self.iterations = 0
         self.log_error_after = 3
         self.tool_name_to_tool_map: Dict[str, BaseTool] = {
@@ -89,16 +94,28 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         }
         self.stop = stop_words
         self.llm.stop = list(set(self.llm.stop + self.stop))
+        # Native mode sends tool schemas through ``tools=`` and reads the
+        # structured tool calls back instead of parsing ReAct text.
+        self.native_tool_calling = native_tool_calling and bool(self.tools)
+        self.function_name_to_tool_map: Dict[str, BaseTool] = {}
+        self.tool_schemas: List[Dict[str, Any]] = []
+        # Parser of the completion being streamed, when the stream can stop early.
+        self._stream_parser: Optional[IncrementalCrewAgentParser] = None
+        if self.native_tool_calling:
+            for tool in self.tools:
+                structured_tool = (
+                    tool
+                    if isinstance(tool, CrewStructuredTool)
+                    else tool.to_structured_tool()
+                )
+                function_name = self._unique_function_name(tool.name)
+                self.function_name_to_tool_map[function_name] = tool
+                self.tool_schemas.append(
+                    structured_tool.to_function_schema(function_name)
+                )
 
     def invoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
-        if "system" in self.prompt:
-            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
-            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
-            self.messages.append(self._format_msg(system_prompt, role="system"))
-            self.messages.append(self._format_msg(user_prompt))
-        else:
-            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
-            self.messages.append(self._format_msg(user_prompt))
+        self._setup_messages(inputs)
 
         self._show_start_logs()
 
@@ -127,6 +144,51 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._create_long_term_memory(formatted_answer)
         return {"output": formatted_answer.output}
 
+    async def ainvoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
+        """Asynchronous counterpart of :meth:`invoke`.
+
+        LLM calls are awaited through ``LLM.acall``; tools, human input and
+        memory writes are still synchronous and are offloaded to a worker
+        thread so they never block the event loop.
+        """
+        self._setup_messages(inputs)
+
+        self._show_start_logs()
+
+        self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
+
+        try:
+            formatted_answer = await self._ainvoke_loop()
+        except AssertionError:
+            self._printer.print(
+                content="Agent failed to reach a final answer. This is likely a bug - please report it.",
+                color="red",
+            )
+            raise
+        except Exception as e:
+            self._handle_unknown_error(e)
+            raise e
+
+        if self.ask_for_human_input:
+            formatted_answer = await asyncio.to_thread(
+                self._handle_human_feedback, formatted_answer
+            )
+
+        await asyncio.to_thread(self._create_short_term_memory, formatted_answer)
+        await asyncio.to_thread(self._create_long_term_memory, formatted_answer)
+        return {"output": formatted_answer.output}
+
+    def _setup_messages(self, inputs: Dict[str, str]) -> None:
+        """Format the prompt templates with the inputs and seed the message list."""
+        if "system" in self.prompt:
+            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
+            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
+            self.messages.append(self._format_msg(system_prompt, role="system"))
+            self.messages.append(self._format_msg(user_prompt))
+        else:
+            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
+            self.messages.append(self._format_msg(user_prompt))
+
     def _invoke_loop(self) -> AgentFinish:
         """
         Main loop to invoke the agent's thought process until it reaches a conclusion
@@ -144,6 +206,10 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                 self._enforce_rpm_limit()
 
                 answer = self._get_llm_response()
+                if self.native_tool_calling:
+                    formatted_answer = self._handle_native_response(answer)
+                    continue
+
                 formatted_answer = self._process_llm_response(answer)
 
                 if isinstance(formatted_answer, AgentAction):
@@ -181,6 +247,62 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._show_logs(formatted_answer)
         return formatted_answer
 
+    async def _ainvoke_loop(self) -> AgentFinish:
+        """
+        Asynchronous version of the main loop. Mirrors :meth:`_invoke_loop` but
+        awaits LLM calls so many agent loops can share a single event loop.
+        """
+        formatted_answer = None
+        while not isinstance(formatted_answer, AgentFinish):
+            try:
+                if self._has_reached_max_iterations():
+                    formatted_answer = await self._ahandle_max_iterations_exceeded(
+                        formatted_answer
+                    )
+                    break
+
+                await asyncio.to_thread(self._enforce_rpm_limit)
+
+                answer = await self._aget_llm_response()
+                if self.native_tool_calling:
+                    formatted_answer = await asyncio.to_thread(
+                        self._handle_native_response, answer
+                    )
+                    continue
+
+                formatted_answer = self._process_llm_response(answer)
+
+                if isinstance(formatted_answer, AgentAction):
+                    tool_result = await asyncio.to_thread(
+                        self._execute_tool_and_check_finality, formatted_answer
+                    )
+                    formatted_answer = self._handle_agent_action(
+                        formatted_answer, tool_result
+                    )
+
+                self._invoke_step_callback(formatted_answer)
+                self._append_message(formatted_answer.text, role="assistant")
+
+            except OutputParserException as e:
+                formatted_answer = self._handle_output_parser_exception(e)
+
+            except Exception as e:
+                if e.__class__.__module__.startswith("litellm"):
+                    # Do not retry on litellm errors
+                    raise e
+                if self._is_context_length_exceeded(e):
+                    await asyncio.to_thread(self._handle_context_length)
+                    continue
+                else:
+                    self._handle_unknown_error(e)
+                    raise e
+            finally:
+                self.iterations += 1
+
+        assert isinstance(formatted_answer, AgentFinish)
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
     def _handle_unknown_error(self, exception: Exception) -> None:
         """Handle unknown errors by informing the user."""
         self._printer.print(
@@ -207,6 +329,24 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             answer = self.llm.call(
                 self.messages,
                 callbacks=self.callbacks,
+                **self._llm_call_kwargs(),
+            )
+        except Exception as e:
+            self._printer.print(
+                content=f"Error during LLM call: {e}",
+                color="red",
+            )
+            raise e
+
+        return self._validate_llm_response(self._trim_streamed_answer(answer))
+
+    async def _aget_llm_response(self) -> str:
+        """Await the LLM and return the response, handling any invalid responses."""
+        try:
+            answer = await self.llm.acall(
+                self.messages,
+                callbacks=self.callbacks,
+                **self._llm_call_kwargs(),
             )
         except Exception as e:
             self._printer.print(
@@ -215,6 +355,148 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             )
             raise e
 
+        return self._validate_llm_response(self._trim_streamed_answer(answer))
+
+    def _llm_call_kwargs(self) -> Dict[str, Any]:
+        """Extra arguments for the agent's LLM calls.
+
+        Native mode passes the tool schemas and asks for the tool calls back.
+        In ReAct mode streamed completions stop as soon as a full step was
+        received.
+        """
+        if self.native_tool_calling:
+            return {"tools": self.tool_schemas, "execute_tools": False}
+        if not getattr(self.llm, "stream", False):
+            self._stream_parser = None
+            return {}
+        self._stream_parser = IncrementalCrewAgentParser(agent=self.agent)
+        return {"stop_condition": self._stream_parser.feed}
+
+    def _trim_streamed_answer(self, answer: Any) -> Any:
+        """Return the parser's text when it stopped the stream.
+
+        The completion then ends with the ``Observation:`` the model started
+        to write itself, which the parser already cut off; stop words alone
+        do not, e.g. for models that do not support them.
+        """
+        parser, self._stream_parser = self._stream_parser, None
+        if parser is not None and parser.is_complete and isinstance(answer, str):
+            return parser.text
+        return answer
+
+    @staticmethod
+    def _function_name(tool_name: str) -> str:
+        """Turn a tool name into a valid function name for tool schemas."""
+        return re.sub(r"[^a-zA-Z0-9_-]", "_", tool_name.strip())[:64]
+
+    def _unique_function_name(self, tool_name: str) -> str:
+        """Return the function name of a tool, numbered if another tool has it."""
+        function_name = self._function_name(tool_name)
+        candidate, number = function_name, 2
+        while candidate in self.function_name_to_tool_map:
+            suffix = f"_{number}"
+            candidate = function_name[: 64 - len(suffix)] + suffix
+            number += 1
+        return candidate
+
+    def _handle_native_response(self, answer: Any) -> Union[AgentAction, AgentFinish]:
+        """Run the tool calls of a native function-calling response.
+
+        A plain text response is the final answer. Otherwise the assistant
+        tool-call message and one ``tool`` message per call are appended to the
+        conversation, and the last action is returned so the loop continues.
+        """
+        formatted_answer: Union[AgentAction, AgentFinish]
+        if not isinstance(answer, list):
+            formatted_answer = AgentFinish(
+                thought="", output=str(answer), text=str(answer)
+            )
+            self._invoke_step_callback(formatted_answer)
+            self._append_message(formatted_answer.text, role="assistant")
+            return formatted_answer
+
+        self.messages.append(
+            {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [
+                    {
+                        "id": call.tool_call_id,
+                        "type": "function",
+                        "function": {
+                            "name": call.function_name,
+                            "arguments": json.dumps(call.arguments),
+                        },
+                    }
+                    for call in answer
+                ],
+            }
+        )
+
+        formatted_answer = AgentAction(thought="", tool="", tool_input="", text="")
+        extra_messages = []
+        for call in answer:
+            tool = self.function_name_to_tool_map.get(call.function_name)
+            tool_name = tool.name if tool else call.function_name
+            tool_input = json.dumps(call.arguments, ensure_ascii=False)
+            agent_action = AgentAction(
+                thought="",
+                tool=tool_name,
+                tool_input=tool_input,
+                text=f"Action: {tool_name}\nAction Input: {tool_input}",
+            )
+
+            if call.error is not None:
+                tool_result = ToolResult(
+                    result=self._i18n.errors("tool_usage_error").format(
+                        error=call.error
+                    ),
+                    result_as_answer=False,
+                )
+            else:
+                tool_result = self._execute_tool_and_check_finality(
+                    agent_action,
+                    tool_calling=ToolCalling(
+                        tool_name=tool_name, arguments=call.arguments
+                    ),
+                )
+
+            if isinstance(tool_result.result, dict):
+                # Multimodal tools return a message to add to the conversation.
+                extra_messages.append(tool_result.result)
+                observation = ""
+            else:
+                observation = str(tool_result.result)
+            self.messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": call.tool_call_id,
+                    "content": observation,
+                }
+            )
+
+            if self.step_callback:
+                self.step_callback(tool_result)
+            agent_action.text += f"\nObservation: {observation}"
+            agent_action.result = observation
+            formatted_answer = agent_action
+
+            if tool_result.result_as_answer:
+                formatted_answer = AgentFinish(
+                    thought="",
+                    output=tool_result.result,
+                    text=agent_action.text,
+                )
+                break
+
+            self._show_logs(agent_action)
+
+        self.messages.extend(extra_messages)
+        self._invoke_step_callback(formatted_answer)
+        return formatted_answer
+
+    def _validate_llm_response(self, answer: Any) -> str:
+        """Raise if the LLM returned an empty response."""
         if not answer:
             self._printer.print(
                 content="Received None or empty response from LLM call.",
@@ -354,7 +636,11 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     content=f"\033[95m## Final Answer:\033[00m \033[92m\n{formatted_answer.output}\033[00m\n\n"
                 )
 
-    def _execute_tool_and_check_finality(self, agent_action: AgentAction) -> ToolResult:
+    def _execute_tool_and_check_finality(
+        self,
+        agent_action: AgentAction,
+        tool_calling: Optional[ToolCalling] = None,
+    ) -> ToolResult:
         try:
             if self.agent:
                 crewai_event_bus.emit(
@@ -377,8 +663,10 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                 task=self.task,  # type: ignore[arg-type]
                 agent=self.agent,
                 action=agent_action,
+                native_tool_calling=self.native_tool_calling,
             )
-            tool_calling = tool_usage.parse_tool_calling(agent_action.text)
+            if tool_calling is None:
+                tool_calling = tool_usage.parse_tool_calling(agent_action.text)
 
             if isinstance(tool_calling, ToolUsageErrorException):
                 tool_result = tool_calling.message
@@ -616,11 +904,70 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         Returns:
             The final formatted answer after exceeding max iterations.
         """
+        self._append_force_final_answer_message(formatted_answer)
+
+        # Perform one more LLM call to get the final answer
+        answer = self.llm.call(
+            self.messages,
+            callbacks=self.callbacks,
+            **self._forced_answer_call_kwargs(),
+        )
+
+        # Return the formatted answer, regardless of its type
+        return self._format_forced_answer(
+            self._validate_llm_response(answer), formatted_answer
+        )
+
+    async def _ahandle_max_iterations_exceeded(self, formatted_answer):
+        """Asynchronous version of :meth:`_handle_max_iterations_exceeded`."""
+        self._append_force_final_answer_message(formatted_answer)
+
+        answer = await self.llm.acall(
+            self.messages,
+            callbacks=self.callbacks,
+            **self._forced_answer_call_kwargs(),
+        )
+
+        return self._format_forced_answer(
+            self._validate_llm_response(answer), formatted_answer
+        )
+
+    def _forced_answer_call_kwargs(self) -> Dict[str, Any]:
+        """Tool schemas must still be sent once the history holds tool calls."""
+        if self.native_tool_calling:
+            return {"tools": self.tool_schemas, "execute_tools": False}
+        return {}
+
+    def _format_forced_answer(
+        self, answer: Any, formatted_answer: Any
+    ) -> Union[AgentAction, AgentFinish]:
+        """Format the answer requested after the iteration budget is spent."""
+        if not self.native_tool_calling:
+            return self._format_answer(answer)
+
+        if isinstance(answer, list):
+            # The model insisted on more tool calls, settle for the last result.
+            last_result = getattr(formatted_answer, "result", "") or ""
+            output = self._i18n.errors("force_final_answer_error").format(
+                formatted_answer=last_result
+            )
+            return AgentFinish(thought="", output=output, text=output)
+        return AgentFinish(thought="", output=str(answer), text=str(answer))
+
+    def _append_force_final_answer_message(self, formatted_answer) -> None:
+        """Ask the LLM for a final answer after the iteration budget is spent."""
         self._printer.print(
             content="Maximum iterations reached. Requesting final answer.",
             color="yellow",
         )
 
+        if self.native_tool_calling:
+            # Tool results are already in the history as ``tool`` messages.
+            self.messages.append(
+                self._format_msg(self._i18n.errors("force_final_answer"))
+            )
+            return
+
         if formatted_answer and hasattr(formatted_answer, "text"):
             assistant_message = (
                 formatted_answer.text + f'\n{self._i18n.errors("force_final_answer")}'
@@ -629,20 +976,3 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             assistant_message = self._i18n.errors("force_final_answer")
 
         self.messages.append(self._format_msg(assistant_message, role="assistant"))
-
-        # Perform one more LLM call to get the final answer
-        answer = self.llm.call(
-            self.messages,
-            callbacks=self.callbacks,
-        )
-
-        if answer is None or answer == "":
-            self._printer.print(
-                content="Received None or empty response from LLM call.",
-                color="red",
-            )
-            raise ValueError("Invalid response from LLM call - None or empty.")
-
-        formatted_answer = self._format_answer(answer)
-        # Return the formatted answer, regardless of its type
-        return formatted_answer
@@ -1,3 +1,4 @@
+import json
 import re
 from typing import Any, Union
 
@@ -160,3 +161,76 @@ class CrewAgentParser:
             return tool_input
 
         return str(result)
+
+
+class IncrementalCrewAgentParser:
+    """Consumes a streamed ReAct completion chunk by chunk.
+
+    ``feed`` returns True as soon as a complete ``Action:``/``Action Input:``
+    block has been seen, either because the model moved on to an
+    ``Observation:`` it should not write itself or because the action input
+    is already a complete JSON object. The caller can then cancel the stream
+    and hand ``text`` to :class:`CrewAgentParser`.
+
+    ``Final Answer:`` is detected as soon as it appears (``has_final_answer``)
+    but never stops the stream, since the answer itself is still being written.
+    """
+
+    ACTION_INPUT_REGEX = re.compile(r"Action\s*\d*\s*Input\s*\d*\s*:")
+    OBSERVATION = "Observation:"
+
+    def __init__(self, agent: Any = None):
+        self.agent = agent
+        self.has_final_answer = False
+        self.is_complete = False
+        self._text = ""
+        self._action_input_start: int | None = None
+
+    @property
+    def text(self) -> str:
+        """Text received so far, trimmed right before a hallucinated Observation."""
+        return self._text
+
+    def feed(self, chunk: str) -> bool:
+        """Add a streamed chunk and return True once the step is complete."""
+        if self.is_complete:
+            return True
+
+        tail_start = max(0, len(self._text) - len(FINAL_ANSWER_ACTION))
+        self._text += chunk
+        if FINAL_ANSWER_ACTION in self._text[tail_start:]:
+            self.has_final_answer = True
+        if self.has_final_answer:
+            return False
+
+        if self._action_input_start is None:
+            match = self.ACTION_INPUT_REGEX.search(self._text)
+            if match is None:
+                return False
+            self._action_input_start = match.end()
+
+        action_input = self._text[self._action_input_start :]
+        observation_index = action_input.find(self.OBSERVATION)
+        if observation_index != -1:
+            self._text = self._text[
+                : self._action_input_start + observation_index
+            ].rstrip()
+            self.is_complete = True
+        elif self._is_complete_json(action_input):
+            self.is_complete = True
+        return self.is_complete
+
+    def parse(self) -> Union[AgentAction, AgentFinish]:
+        """Parse the text received so far with :class:`CrewAgentParser`."""
+        return CrewAgentParser(agent=self.agent).parse(self._text)
+
+    @staticmethod
+    def _is_complete_json(action_input: str) -> bool:
+        candidate = action_input.strip()
+        if not (candidate.startswith("{") and candidate.endswith("}")):
+            return False
+        try:
+            json.loads(candidate)
+        except ValueError:
+            return False
+        return True
@@ -245,6 +245,9 @@ def handle_user_input(
         tools=[crew_tool_schema],
         available_functions=available_functions,
     )
+    if isinstance(final_response, list):
+        # The model ran several crew calls at once; show every result in order.
+        final_response = "\n\n".join(str(result) for result in final_response)
 
     messages.append({"role": "assistant", "content": final_response})
     click.secho(f"\nAssistant: {final_response}\n", fg="green")
@@ -283,7 +286,11 @@ def generate_crew_tool_schema(crew_inputs: ChatInputs) -> dict:
 
 def run_crew_tool(crew: Crew, messages: List[Dict[str, str]], **kwargs):
     """
-    Runs the crew using crew.kickoff(inputs=kwargs) and returns the output.
+    Runs a copy of the crew using kickoff(inputs=kwargs) and returns the output.
+
+    The model may request several crew runs in one response, which are then
+    executed in parallel; each runs on its own copy so that they never share
+    the tasks and agents of the crew.
 
     Args:
         crew (Crew): The crew instance to run.
@@ -300,8 +307,8 @@ def run_crew_tool(crew: Crew, messages: List[Dict[str, str]], **kwargs):
         # Serialize 'messages' to JSON string before adding to kwargs
         kwargs["crew_chat_messages"] = json.dumps(messages)
 
-        # Run the crew with the provided inputs
-        crew_output = crew.kickoff(inputs=kwargs)
+        # Run a copy of the crew with the provided inputs
+        crew_output = crew.copy().kickoff(inputs=kwargs)
 
         # Convert CrewOutput to a string to send back to the user
         result = str(crew_output)
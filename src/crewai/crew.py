@@ -3,10 +3,28 @@ import json
 import re
 import uuid
 import warnings
-from concurrent.futures import Future
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from copy import copy as shallow_copy
 from hashlib import md5
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from pydantic import (
     UUID4,
@@ -23,12 +41,14 @@ from pydantic_core import PydanticCustomError
 from crewai.agent import Agent
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.cache import CacheHandler
+from crewai.crews.crew_factory import CrewFactory
 from crewai.crews.crew_output import CrewOutput
 from crewai.knowledge.knowledge import Knowledge
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.llm import LLM
 from crewai.memory.entity.entity_memory import EntityMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
+from crewai.memory.memory_job_queue import MemoryJobQueue
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
 from crewai.memory.user.user_memory import UserMemory
 from crewai.process import Process
@@ -36,9 +56,10 @@ from crewai.task import Task
 from crewai.tasks.conditional_task import ConditionalTask
 from crewai.tasks.task_output import TaskOutput
 from crewai.tools.agent_tools.agent_tools import AgentTools
-from crewai.tools.base_tool import Tool
+from crewai.tools.base_tool import BaseTool, Tool
 from crewai.types.usage_metrics import UsageMetrics
 from crewai.utilities import I18N, FileHandler, Logger, RPMController
+from crewai.utilities.concurrency import TaskExecutor, create_task_executor
 from crewai.utilities.constants import TRAINING_DATA_FILE
 from crewai.utilities.evaluators.crew_evaluator_handler import CrewEvaluator
 from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
@@ -77,6 +98,10 @@ class Crew(BaseModel):
         manager_agent: Custom agent that will be used as manager.
         memory: Whether the crew should use memory to store memories of it's execution.
         memory_config: Configuration for the memory to be used for the crew.
+        memory_llm: The language model that evaluates finished tasks for long-term memory.
+        memory_sample_rate: Share of the tasks evaluated for long-term memory.
+        memory_max_concurrency: Maximum number of memory evaluations running in the background.
+        memory_drain_on_exit: Let kickoff return before memory evaluations finish and drain them at exit.
         cache: Whether the crew should use a cache to store the results of the tools execution.
         function_calling_llm: The language model that will run the tool calling for all the agents.
         process: The process flow that the crew will follow (e.g., sequential, hierarchical).
@@ -111,6 +136,11 @@ class Crew(BaseModel):
     _task_output_handler: TaskOutputStorageHandler = PrivateAttr(
         default_factory=TaskOutputStorageHandler
     )
+    _factory: Optional[CrewFactory] = PrivateAttr(default=None)
+    _memory_jobs: Optional[MemoryJobQueue] = PrivateAttr(default=None)
+    _memory_context_cache: Dict[Tuple[str, str], Optional[str]] = PrivateAttr(
+        default_factory=dict
+    )
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
@@ -126,6 +156,25 @@ class Crew(BaseModel):
         default=None,
         description="Configuration for the memory to be used for the crew.",
     )
+    memory_llm: Optional[Union[str, InstanceOf[LLM], Any]] = Field(
+        default=None,
+        description="Language model that evaluates finished tasks for long-term memory. Defaults to the agent's llm.",
+    )
+    memory_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Share of the tasks evaluated for long-term and entity memory.",
+    )
+    memory_max_concurrency: int = Field(
+        default=2,
+        ge=1,
+        description="Maximum number of long-term memory evaluations running in the background at once.",
+    )
+    memory_drain_on_exit: bool = Field(
+        default=False,
+        description="Return from kickoff without waiting for pending memory evaluations and finish them when the interpreter exits.",
+    )
     short_term_memory: Optional[InstanceOf[ShortTermMemory]] = Field(
         default=None,
         description="An Instance of the ShortTermMemory to be used by the Crew",
@@ -220,6 +269,14 @@ class Crew(BaseModel):
         default=None,
         description="Knowledge for the crew.",
     )
+    max_parallel_tasks: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tasks the crew runs at the same time, for async tasks and the graph process. Unlimited by default, within the shared worker pool.",
+    )
+    task_execution_backend: Literal["thread", "async"] = Field(
+        default="thread",
+        description="Where concurrent tasks run: the shared thread pool or a shared asyncio event loop.",
+    )
 
     @field_validator("id", mode="before")
     @classmethod
@@ -252,9 +309,19 @@ class Crew(BaseModel):
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        self._rpm_controller = RPMController(
+            max_rpm=self.max_rpm,
+            key=RPMController.key_for(
+                "crew",
+                [agent.llm for agent in self.agents]
+                + ([self.manager_llm] if self.manager_llm else [])
+            ),
+            logger=self._logger,
+        )
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
+        if self.memory_llm and not isinstance(self.memory_llm, LLM):
+            self.memory_llm = create_llm(self.memory_llm)
 
         return self
 
@@ -263,7 +330,11 @@ class Crew(BaseModel):
         """Set private attributes."""
         if self.memory:
             self._long_term_memory = (
-                self.long_term_memory if self.long_term_memory else LongTermMemory()
+                self.long_term_memory
+                if self.long_term_memory
+                else LongTermMemory(
+                    **(self.memory_config or {}).get("long_term_memory", {})
+                )
             )
             self._short_term_memory = (
                 self.short_term_memory
@@ -278,6 +349,10 @@ class Crew(BaseModel):
                 if self.entity_memory
                 else EntityMemory(crew=self, embedder_config=self.embedder)
             )
+            self._memory_jobs = MemoryJobQueue(
+                max_concurrency=self.memory_max_concurrency,
+                drain_on_exit=self.memory_drain_on_exit,
+            )
             if (
                 self.memory_config and "user_memory" in self.memory_config
             ):  # Check for user_memory in config
@@ -365,12 +440,12 @@ class Crew(BaseModel):
 
     @model_validator(mode="after")
     def validate_tasks(self):
-        if self.process == Process.sequential:
+        if self.process in (Process.sequential, Process.graph):
             for task in self.tasks:
                 if task.agent is None:
                     raise PydanticCustomError(
                         "missing_agent_in_task",
-                        f"Sequential process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
+                        f"{self.process.value.capitalize()} process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
                         {},
                     )
 
@@ -587,6 +662,7 @@ class Crew(BaseModel):
 
             # Starts the crew to work on its assigned tasks.
             self._task_output_handler.reset()
+            self._memory_context_cache.clear()
             self._logging_color = "bold_purple"
 
             if inputs is not None:
@@ -619,6 +695,8 @@ class Crew(BaseModel):
                 result = self._run_sequential_process()
             elif self.process == Process.hierarchical:
                 result = self._run_hierarchical_process()
+            elif self.process == Process.graph:
+                result = self._run_graph_process()
             else:
                 raise NotImplementedError(
                     f"The process '{self.process}' is not implemented yet."
@@ -639,44 +717,171 @@ class Crew(BaseModel):
                 CrewKickoffFailedEvent(error=str(e), crew_name=self.name or "crew"),
             )
             raise
+        finally:
+            if self._memory_jobs is not None and not self.memory_drain_on_exit:
+                self._memory_jobs.drain()
+            self._flush_memories()
 
-    def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
-        """Executes the Crew's workflow for each input in the list and aggregates results."""
-        results: List[CrewOutput] = []
-
-        # Initialize the parent crew's usage metrics
-        total_usage_metrics = UsageMetrics()
+    def kickoff_for_each(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: int = 1,
+        backend: Literal["thread", "async", "process"] = "thread",
+        return_exceptions: bool = False,
+    ) -> List[Union[CrewOutput, BaseException]]:
+        """Executes the Crew's workflow for each input in the list and aggregates results.
+
+        Up to ``max_concurrency`` inputs run at once on ``backend``. Results are
+        returned in input order. With ``return_exceptions`` a failing input
+        leaves its exception in its slot instead of aborting the others.
+        """
+        results: List[Union[CrewOutput, BaseException]] = [None] * len(inputs)  # type: ignore
+        for index, result in self.kickoff_for_each_iter(
+            inputs,
+            max_concurrency=max_concurrency,
+            backend=backend,
+            ordered=False,
+            return_exceptions=return_exceptions,
+        ):
+            results[index] = result
+        return results
 
-        for input_data in inputs:
-            crew = self.copy()
+    def kickoff_for_each_iter(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: int = 1,
+        backend: Literal["thread", "async", "process"] = "thread",
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[int, Union[CrewOutput, BaseException]]]:
+        """Runs the crew for each input and yields ``(index, output)`` as results arrive.
+
+        With ``ordered=False`` outputs are yielded in completion order. The
+        ``process`` backend rebuilds the crew from its ``@CrewBase`` class in
+        each worker process, so it is only available for crews created by a
+        ``@crew`` method. ``usage_metrics`` aggregates every finished run.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if backend == "process" and self._factory is None:
+            raise ValueError(
+                "backend='process' requires a crew created by a @CrewBase class "
+                "so it can be rebuilt in worker processes."
+            )
 
-            output = crew.kickoff(inputs=input_data)
+        self.usage_metrics = UsageMetrics()
+        runs: Iterator[Tuple[int, Any]]
+        try:
+            if max_concurrency == 1 and backend == "thread":
+                runs = (
+                    self._settle(index, lambda: self._kickoff_copy(input_data))
+                    for index, input_data in enumerate(inputs)
+                )
+            else:
+                runs = self._kickoff_each_concurrently(
+                    inputs, max_concurrency, backend, ordered
+                )
+            for index, result in runs:
+                if isinstance(result, BaseException):
+                    if not return_exceptions:
+                        raise result
+                    yield index, result
+                    continue
+                output, usage_metrics = result
+                if usage_metrics:
+                    self.usage_metrics.add_usage_metrics(usage_metrics)
+                yield index, output
+        finally:
+            self._task_output_handler.reset()
 
-            if crew.usage_metrics:
-                total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+    def _kickoff_each_concurrently(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: int,
+        backend: Literal["thread", "async", "process"],
+        ordered: bool,
+    ) -> Iterator[Tuple[int, Any]]:
+        # Crew copies block on the tasks they start, so on the thread backend
+        # they run on a pool of their own rather than holding shared workers.
+        executor: Union[TaskExecutor, ThreadPoolExecutor]
+        if backend == "thread":
+            executor = ThreadPoolExecutor(
+                max_workers=max_concurrency, thread_name_prefix="crewai-kickoff"
+            )
+        else:
+            executor = create_task_executor(backend, max_concurrency)
+        futures: Dict[Future, int] = {}
+        for index, input_data in enumerate(inputs):
+            if backend == "process":
+                assert self._factory is not None, "Factory should not be None."
+                future = executor.submit(_kickoff_from_factory, self._factory, input_data)
+            elif backend == "async":
+                future = executor.submit(self._akickoff_copy, input_data)
+            else:
+                future = executor.submit(self._kickoff_copy, input_data)
+            futures[future] = index
 
-            results.append(output)
+        completed = futures if ordered else as_completed(futures)
+        try:
+            for future in completed:
+                yield self._settle(futures[future], future.result)
+        finally:
+            if isinstance(executor, ThreadPoolExecutor):
+                executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                executor.cancel_pending()
 
-        self.usage_metrics = total_usage_metrics
-        self._task_output_handler.reset()
-        return results
+    @staticmethod
+    def _settle(index: int, run: Callable[[], Any]) -> Tuple[int, Any]:
+        try:
+            return index, run()
+        except Exception as e:
+            return index, e
+
+    def _kickoff_copy(
+        self, inputs: Dict[str, Any]
+    ) -> Tuple[CrewOutput, Optional[UsageMetrics]]:
+        crew = self.copy()
+        output = crew.kickoff(inputs=inputs)
+        return output, crew.usage_metrics
+
+    async def _akickoff_copy(
+        self, inputs: Dict[str, Any]
+    ) -> Tuple[CrewOutput, Optional[UsageMetrics]]:
+        crew = self.copy()
+        output = await crew.kickoff_async(inputs=inputs)
+        return output, crew.usage_metrics
 
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> CrewOutput:
         """Asynchronous kickoff method to start the crew execution."""
         return await asyncio.to_thread(self.kickoff, inputs)
 
-    async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
+    async def kickoff_for_each_async(
+        self,
+        inputs: List[Dict],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[CrewOutput, BaseException]]:
+        """Runs the crew for each input concurrently, at most ``max_concurrency`` at a time."""
         crew_copies = [self.copy() for _ in inputs]
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
 
         async def run_crew(crew, input_data):
-            return await crew.kickoff_async(inputs=input_data)
+            if semaphore is None:
+                return await crew.kickoff_async(inputs=input_data)
+            async with semaphore:
+                return await crew.kickoff_async(inputs=input_data)
 
         tasks = [
             asyncio.create_task(run_crew(crew_copies[i], inputs[i]))
             for i in range(len(inputs))
         ]
 
-        results = await asyncio.gather(*tasks)
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        finally:
+            for pending in tasks:
+                pending.cancel()
 
         total_usage_metrics = UsageMetrics()
         for crew in crew_copies:
@@ -735,6 +940,10 @@ class Crew(BaseModel):
         self._create_manager_agent()
         return self._execute_tasks(self.tasks)
 
+    def _run_graph_process(self) -> CrewOutput:
+        """Runs every task as soon as the tasks in its context have completed."""
+        return self._execute_task_graph(self.tasks)
+
     def _create_manager_agent(self):
         i18n = I18N(prompt_file=self.prompt_file)
         if self.manager_agent is not None:
@@ -779,6 +988,7 @@ class Crew(BaseModel):
         task_outputs: List[TaskOutput] = []
         futures: List[Tuple[Task, Future[TaskOutput], int]] = []
         last_sync_output: Optional[TaskOutput] = None
+        executor = self._create_task_executor()
 
         for task_index, task in enumerate(tasks):
             if start_index is not None and task_index < start_index:
@@ -818,6 +1028,7 @@ class Crew(BaseModel):
                     agent=agent_to_use,
                     context=context,
                     tools=tools_for_task,
+                    executor=executor,
                 )
                 futures.append((task, future, task_index))
             else:
@@ -840,6 +1051,143 @@ class Crew(BaseModel):
 
         return self._create_crew_output(task_outputs)
 
+    def _execute_task_graph(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Executes tasks as a dependency graph built from their ``context``.
+
+        A task becomes ready once every task in its context has an output, and
+        all ready tasks run concurrently on a bounded thread pool. Tasks
+        without a context do not depend on anything and only receive the
+        outputs of the tasks listed in their context. An agent works on one
+        task at a time. Outputs are logged with their position in ``tasks`` so
+        the replay indexes stay the same as for the sequential process.
+
+        Args:
+            tasks (List[Task]): List of tasks to execute
+            start_index (Optional[int]): Tasks before this index are already done, as in a replay.
+            was_replayed (bool): Whether the execution is a replay.
+
+        Returns:
+            CrewOutput: Final output of the crew
+        """
+        task_indices = {id(task): index for index, task in enumerate(tasks)}
+        dependencies = {
+            index: {
+                task_indices[id(context_task)]
+                for context_task in task.context or []
+                if id(context_task) in task_indices
+            }
+            for index, task in enumerate(tasks)
+        }
+
+        outputs: Dict[int, TaskOutput] = {}
+        completed: Set[int] = set()
+        for index, task in enumerate(tasks[: start_index or 0]):
+            completed.add(index)
+            if task.output:
+                outputs[index] = task.output
+
+        pending = [index for index in range(start_index or 0, len(tasks))]
+        running: Dict[Future[TaskOutput], Tuple[int, BaseAgent]] = {}
+        busy_agents: Set[int] = set()
+        max_workers = self.max_parallel_tasks or max(1, len(pending))
+        executor = self._create_task_executor()
+
+        try:
+            while pending or running:
+                completed_before = len(completed)
+                for task_index in list(pending):
+                    if not dependencies[task_index] <= completed:
+                        continue
+                    task = tasks[task_index]
+                    agent_to_use = self._get_agent_to_use(task)
+                    if agent_to_use is None:
+                        raise ValueError(
+                            f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                        )
+                    if id(agent_to_use) in busy_agents:
+                        continue
+                    if len(running) >= max_workers:
+                        break
+
+                    pending.remove(task_index)
+                    tools_for_task: List[BaseTool] = list(
+                        self._prepare_tools(
+                            agent_to_use,
+                            task,
+                            cast(List[Tool], task.tools or agent_to_use.tools or []),
+                        )
+                    )
+                    self._log_task_start(task, agent_to_use.role)
+
+                    if isinstance(task, ConditionalTask):
+                        previous_output = next(
+                            (
+                                outputs[index]
+                                for index in sorted(
+                                    dependencies[task_index], reverse=True
+                                )
+                                if index in outputs
+                            ),
+                            None,
+                        )
+                        skipped_task_output = self._skip_conditional_task(
+                            task, previous_output, task_index, was_replayed
+                        )
+                        if skipped_task_output:
+                            outputs[task_index] = skipped_task_output
+                            completed.add(task_index)
+                            continue
+
+                    busy_agents.add(id(agent_to_use))
+                    future = task.execute_async(
+                        agent=agent_to_use,
+                        context=self._get_context(task, []),
+                        tools=tools_for_task,
+                        executor=executor,
+                    )
+                    running[future] = (task_index, agent_to_use)
+
+                if not running:
+                    if not pending:
+                        break
+                    if len(completed) > completed_before:
+                        # Skipped conditional tasks may have unblocked others.
+                        continue
+                    raise ValueError(
+                        "Task graph cannot make progress: the remaining tasks depend on tasks that will never run."
+                    )
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_index, agent_to_use = running.pop(future)
+                    busy_agents.discard(id(agent_to_use))
+                    task_output = future.result()
+                    task = tasks[task_index]
+                    outputs[task_index] = task_output
+                    completed.add(task_index)
+                    self._process_task_result(task, task_output)
+                    self._store_execution_log(
+                        task, task_output, task_index, was_replayed
+                    )
+        except BaseException:
+            # Let tasks that are already running finish, start nothing new.
+            executor.cancel_pending()
+            wait(running)
+            raise
+
+        return self._create_crew_output([outputs[index] for index in sorted(outputs)])
+
+    def _create_task_executor(self) -> TaskExecutor:
+        """Executor for the tasks of one kickoff, bounded by max_parallel_tasks."""
+        return create_task_executor(
+            self.task_execution_backend, max_concurrency=self.max_parallel_tasks
+        )
+
     def _handle_conditional_task(
         self,
         task: ConditionalTask,
@@ -853,6 +1201,18 @@ class Crew(BaseModel):
             futures.clear()
 
         previous_output = task_outputs[-1] if task_outputs else None
+        return self._skip_conditional_task(
+            task, previous_output, task_index, was_replayed
+        )
+
+    def _skip_conditional_task(
+        self,
+        task: ConditionalTask,
+        previous_output: Optional[TaskOutput],
+        task_index: int,
+        was_replayed: bool,
+    ) -> Optional[TaskOutput]:
+        """Return the skipped output if the condition rejects the previous output."""
         if previous_output is not None and not task.should_execute(previous_output):
             self._logger.log(
                 "debug",
@@ -972,6 +1332,19 @@ class Crew(BaseModel):
                 status="completed",
                 output=output.raw,
             )
+        self._flush_memories()
+        # The task's memories may change what later searches should return.
+        self._memory_context_cache.clear()
+
+    def _flush_memories(self) -> None:
+        """Write the memory saves buffered during the finished task(s)."""
+        for memory in (
+            getattr(self, "_short_term_memory", None),
+            getattr(self, "_entity_memory", None),
+            getattr(self, "_user_memory", None),
+        ):
+            if memory is not None:
+                memory.flush()
 
     def _create_crew_output(self, task_outputs: List[TaskOutput]) -> CrewOutput:
         if not task_outputs:
@@ -1006,8 +1379,14 @@ class Crew(BaseModel):
         was_replayed: bool = False,
     ) -> List[TaskOutput]:
         task_outputs: List[TaskOutput] = []
-        for future_task, future, task_index in futures:
-            task_output = future.result()
+        for position, (future_task, future, task_index) in enumerate(futures):
+            try:
+                task_output = future.result()
+            except BaseException:
+                # Tasks that have not started yet are not worth running anymore.
+                for _, pending_future, _ in futures[position + 1 :]:
+                    pending_future.cancel()
+                raise
             task_outputs.append(task_output)
             self._process_task_result(future_task, task_output)
             self._store_execution_log(
@@ -1065,6 +1444,8 @@ class Crew(BaseModel):
             self.tasks[i].output = task_output
 
         self._logging_color = "bold_blue"
+        if self.process == Process.graph:
+            return self._execute_task_graph(self.tasks, start_index, True)
         result = self._execute_tasks(self.tasks, start_index, True)
         return result
 
@@ -1151,6 +1532,9 @@ class Crew(BaseModel):
             knowledge_sources=existing_knowledge_sources,
             knowledge=existing_knowledge,
         )
+        # Copies (e.g. from kickoff_for_each) share the crew's request budget.
+        copied_crew._rpm_controller = self._rpm_controller
+        copied_crew._factory = self._factory
 
         return copied_crew
 
@@ -1312,3 +1696,12 @@ class Crew(BaseModel):
             memory_system.reset()
         except Exception as e:
             raise RuntimeError(f"Failed to reset {name} memory") from e
+
+
+def _kickoff_from_factory(
+    factory: CrewFactory, inputs: Dict[str, Any]
+) -> Tuple[CrewOutput, Optional[UsageMetrics]]:
+    """Process-pool entry point for ``kickoff_for_each(backend="process")``."""
+    crew = factory.build()
+    output = crew.kickoff(inputs=inputs)
+    return output, crew.usage_metrics
@@ -1,3 +1,4 @@
+from .crew_factory import CrewFactory
 from .crew_output import CrewOutput
 
-__all__ = ["CrewOutput"]
+__all__ = ["CrewFactory", "CrewOutput"]
@@ -0,0 +1,41 @@
+import importlib
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from crewai.crew import Crew
+
+"""Picklable recipe for rebuilding a crew in another process."""
+
+
+@dataclass(frozen=True)
+class CrewFactory:
+    """Rebuilds a crew from the ``@CrewBase`` class that defined it.
+
+    Live crews hold LLM clients, locks and callbacks that cannot be pickled,
+    so process workers receive this recipe instead and construct their own
+    crew from the class, its YAML configuration and the ``@crew`` method.
+    """
+
+    module: str
+    class_name: str
+    method_name: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    method_args: Tuple[Any, ...] = ()
+    method_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def build(self) -> "Crew":
+        module = importlib.import_module(self.module)
+        try:
+            crew_class: Any = reduce(getattr, self.class_name.split("."), module)
+        except AttributeError:
+            raise ValueError(
+                f"Cannot import crew class '{self.class_name}' from '{self.module}'. "
+                "Crews run with backend='process' must be defined at module level."
+            )
+        instance = crew_class(*self.args, **self.kwargs)
+        return getattr(instance, self.method_name)(
+            *self.method_args, **self.method_kwargs
+        )
@@ -1,5 +1,15 @@
-from crewai.flow.flow import Flow, start, listen, or_, and_, router
+from crewai.flow.flow import Flow, and_, concurrency, listen, or_, router, start
 from crewai.flow.persistence import persist
+from crewai.flow.runner import FlowRunner
 
-__all__ = ["Flow", "start", "listen", "or_", "and_", "router", "persist"]
-
+__all__ = [
+    "Flow",
+    "start",
+    "listen",
+    "or_",
+    "and_",
+    "router",
+    "concurrency",
+    "persist",
+    "FlowRunner",
+]
@@ -1,7 +1,12 @@
 import asyncio
-import copy
+import contextlib
+import contextvars
+import functools
+import importlib
 import inspect
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
@@ -10,6 +15,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -21,7 +27,9 @@ from pydantic import BaseModel, Field, ValidationError
 
 from crewai.flow.flow_visualizer import plot_flow
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.state_snapshot import StateSnapshotter
 from crewai.flow.utils import get_possible_return_constants
+from crewai.utilities.concurrency import get_background_loop
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.flow_events import (
     FlowCreatedEvent,
@@ -380,6 +388,91 @@ def and_(*conditions: Union[str, dict, Callable]) -> dict:
     return {"type": "AND", "methods": methods}
 
 
+def concurrency(max_parallel: Optional[int] = None, offload: bool = True) -> Callable:
+    """
+    Configures how a synchronous flow method is executed.
+
+    Synchronous methods run on the flow's executor, so listeners triggered
+    together, such as several crews kicked off by the same method, run in
+    parallel instead of blocking the event loop one after another.
+
+    Parameters
+    ----------
+    max_parallel : Optional[int], optional
+        Maximum number of runs of this method at the same time, within the
+        flow's ``max_parallel_methods``. Default is None, meaning no extra limit.
+    offload : bool, optional
+        If False, the method runs directly on the event loop thread.
+        Default is True.
+
+    Returns
+    -------
+    Callable
+        A decorator function that records the execution settings.
+
+    Examples
+    --------
+    >>> @listen(fetch_data)
+    >>> @concurrency(max_parallel=1)
+    >>> def write_report(self):
+    ...     pass
+    """
+    if max_parallel is not None and max_parallel < 1:
+        raise ValueError("max_parallel must be at least 1")
+
+    def decorator(func):
+        func.__max_parallel__ = max_parallel
+        func.__offload__ = offload
+        return func
+
+    return decorator
+
+
+class _PendingOutput:
+    """Placeholder holding a running method's position in the flow outputs."""
+
+
+# Marks a recorded method run whose output cannot be restored; it runs again.
+_RERUN = object()
+
+
+def _encode_result(result: Any) -> Tuple[Any, Optional[str]]:
+    """Return the JSON form of a method output and the path of its model class.
+
+    Raises:
+        ValueError: If the JSON form does not restore an equal output
+    """
+    from crewai.flow.state_utils import to_serializable
+
+    value: Any
+    path: Optional[str]
+    if isinstance(result, BaseModel):
+        model_class = type(result)
+        path = f"{model_class.__module__}:{model_class.__qualname__}"
+        value = result.model_dump(mode="json")
+        restored = _decode_result(value, path)
+    else:
+        path = None
+        value = restored = to_serializable(result)
+    try:
+        equal = type(restored) is type(result) and bool(restored == result)
+    except Exception:
+        equal = False
+    if not equal:
+        raise ValueError(f"{type(result).__name__} output does not round-trip")
+    return value, path
+
+
+def _decode_result(value: Any, path: Optional[str]) -> Any:
+    if path is None:
+        return value
+    module_name, _, qualname = path.partition(":")
+    model_class: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        model_class = getattr(model_class, name)
+    return model_class.model_validate(value)
+
+
 class FlowMeta(type):
     def __new__(mcs, name, bases, dct):
         cls = super().__new__(mcs, name, bases, dct)
@@ -416,10 +509,41 @@ class FlowMeta(type):
                         if possible_returns:
                             router_paths[attr_name] = possible_returns
 
+        # Reverse index for dispatch: trigger -> (routers, other listeners),
+        # each in definition order, plus the arity of every listener.
+        trigger_index: Dict[str, tuple[List[str], List[str]]] = {}
+        listener_params: Dict[str, int] = {}
+        for listener_name, (_, methods) in listeners.items():
+            for trigger in dict.fromkeys(methods):
+                routers_for, listeners_for = trigger_index.setdefault(
+                    trigger, ([], [])
+                )
+                (routers_for if listener_name in routers else listeners_for).append(
+                    listener_name
+                )
+            listener_params[listener_name] = len(
+                [
+                    p
+                    for p in inspect.signature(dct[listener_name]).parameters.values()
+                    if p.name != "self"
+                ]
+            )
+
         setattr(cls, "_start_methods", start_methods)
         setattr(cls, "_listeners", listeners)
         setattr(cls, "_routers", routers)
         setattr(cls, "_router_paths", router_paths)
+        setattr(cls, "_trigger_index", trigger_index)
+        setattr(cls, "_listener_params", listener_params)
+        setattr(
+            cls,
+            "_method_concurrency",
+            {
+                attr_name: (attr_value.__max_parallel__, attr_value.__offload__)
+                for attr_name, attr_value in dct.items()
+                if hasattr(attr_value, "__offload__")
+            },
+        )
 
         return cls
 
@@ -435,7 +559,13 @@ class Flow(Generic[T], metaclass=FlowMeta):
     _listeners: Dict[str, tuple[str, List[str]]] = {}
     _routers: Set[str] = set()
     _router_paths: Dict[str, List[str]] = {}
+    _trigger_index: Dict[str, tuple[List[str], List[str]]] = {}
+    _listener_params: Dict[str, int] = {}
+    _method_concurrency: Dict[str, tuple[Optional[int], bool]] = {}
     initial_state: Union[Type[T], T, None] = None
+    # Maximum number of synchronous methods running at once on the flow's
+    # executor; None uses ThreadPoolExecutor's default.
+    max_parallel_methods: Optional[int] = None
 
     def __class_getitem__(cls: Type["Flow"], item: Type[T]) -> Type["Flow"]:
         class _FlowGeneric(cls):  # type: ignore
@@ -460,7 +590,20 @@ class Flow(Generic[T], metaclass=FlowMeta):
         self._method_execution_counts: Dict[str, int] = {}
         self._pending_and_listeners: Dict[str, Set[str]] = {}
         self._method_outputs: List[Any] = []  # List to store all method outputs
+        # Outputs per method, recorded with persisted state to resume the flow
+        self._method_results: Dict[str, List[Any]] = {}
+        # Guards _method_results, read by @persist from the executor threads.
+        self._results_lock = threading.Lock()
+        # Recorded outputs of the methods completed before the flow was resumed
+        self._resumed_results: Dict[str, List[Any]] = {}
+        self._progress_persistences: List[FlowPersistence] = []
+        self._method_failed = False
         self._persistence: Optional[FlowPersistence] = persistence
+        self._method_executor: Optional[ThreadPoolExecutor] = None
+        # False when the executor is shared with other flows, e.g. by a FlowRunner.
+        self._owns_method_executor = True
+        self._state_snapshotter = StateSnapshotter()
+        self._method_semaphores: Dict[str, asyncio.Semaphore] = {}
 
         # Initialize state with initial values
         self._state = self._create_initial_state()
@@ -576,7 +719,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
         )
 
     def _copy_state(self) -> T:
-        return copy.deepcopy(self._state)
+        return self._state_snapshotter.snapshot(self._state)
 
     @property
     def state(self) -> T:
@@ -585,7 +728,11 @@ class Flow(Generic[T], metaclass=FlowMeta):
     @property
     def method_outputs(self) -> List[Any]:
         """Returns the list of all outputs from executed methods."""
-        return self._method_outputs
+        return [
+            output
+            for output in self._method_outputs
+            if not isinstance(output, _PendingOutput)
+        ]
 
     @property
     def flow_id(self) -> str:
@@ -708,18 +855,122 @@ class Flow(Generic[T], metaclass=FlowMeta):
         else:
             raise TypeError(f"State must be dict or BaseModel, got {type(self._state)}")
 
+    def _resume(self, progress: Dict[str, Any]) -> None:
+        """Skip the methods an interrupted run of this flow already completed."""
+        models = progress.get("result_models", {})
+        reruns = progress.get("rerun", {})
+        self._resumed_results = {}
+        for name, results in progress.get("method_results", {}).items():
+            entries = []
+            for index, value in enumerate(results):
+                if index in reruns.get(name, ()):
+                    entries.append(_RERUN)
+                    continue
+                try:
+                    entries.append(
+                        _decode_result(value, models.get(name, {}).get(str(index)))
+                    )
+                except (ImportError, AttributeError, ValidationError):
+                    entries.append(_RERUN)
+            self._resumed_results[name] = entries
+        if self._persistence not in self._progress_persistences:
+            self._progress_persistences.append(self._persistence)  # type: ignore[arg-type]
+        completed = sum(len(results) for results in self._resumed_results.values())
+        self._log_flow_event(
+            f"Resuming flow {self.flow_id}: skipping {completed} completed method runs",
+            color="yellow",
+        )
+
     def kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> Any:
         """
         Start the flow execution in a synchronous context.
 
         This method wraps kickoff_async so that all state initialization and event
-        emission is handled in the asynchronous method.
+        emission is handled in the asynchronous method. When called from a
+        thread that is already running an event loop, the flow runs on a
+        background loop and this call blocks until it finishes; prefer
+        ``await kickoff_async()`` there. Code already running on that
+        background loop, such as an async method of another flow started
+        this way, must use ``kickoff_async``.
         """
 
         async def run_flow():
             return await self.kickoff_async(inputs)
 
-        return asyncio.run(run_flow())
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run_flow())
+        background_loop = get_background_loop()
+        if running_loop is background_loop:
+            raise RuntimeError(
+                "Flow.kickoff cannot block the background event loop it would "
+                "run on; use kickoff_async instead"
+            )
+        return asyncio.run_coroutine_threadsafe(run_flow(), background_loop).result()
+
+    @classmethod
+    def kickoff_many(
+        cls,
+        inputs_list: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+        **flow_kwargs: Any,
+    ) -> List[Any]:
+        """
+        Run a new instance of the flow for each input, concurrently.
+
+        The instances run on one event loop, at most ``max_concurrency`` at a
+        time, and share a thread pool for their synchronous methods; see
+        :class:`~crewai.flow.runner.FlowRunner` to keep the loop between calls.
+
+        Parameters
+        ----------
+        inputs_list : List[Dict[str, Any]]
+            The inputs of each run.
+        max_concurrency : Optional[int], optional
+            Maximum number of flows running at once. Default is None (no limit).
+        return_exceptions : bool, optional
+            If True, a failing run leaves its exception in its slot instead of
+            raising it. Default is False.
+        **flow_kwargs : Any
+            Arguments for each flow instance, such as ``persistence``.
+
+        Returns
+        -------
+        List[Any]
+            The final output of each run, in input order.
+        """
+        from crewai.flow.runner import FlowRunner
+
+        with FlowRunner(cls, max_concurrency=max_concurrency, **flow_kwargs) as runner:
+            return runner.kickoff_many(inputs_list, return_exceptions=return_exceptions)
+
+    @classmethod
+    async def kickoff_many_async(
+        cls,
+        inputs_list: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+        **flow_kwargs: Any,
+    ) -> List[Any]:
+        """
+        Run a new instance of the flow for each input on the running event loop.
+
+        See :meth:`kickoff_many` for the parameters.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run_flow(inputs: Dict[str, Any]) -> Any:
+            if semaphore is None:
+                return await cls(**flow_kwargs).kickoff_async(inputs)
+            async with semaphore:
+                return await cls(**flow_kwargs).kickoff_async(inputs)
+
+        return await asyncio.gather(
+            *(run_flow(inputs) for inputs in inputs_list),
+            return_exceptions=return_exceptions,
+        )
 
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -754,6 +1005,9 @@ class Flow(Generic[T], metaclass=FlowMeta):
                         color="yellow",
                     )
                     self._restore_state(stored_state)
+                    progress = self._persistence.load_progress(restore_uuid)
+                    if progress:
+                        self._resume(progress)
                 else:
                     self._log_flow_event(
                         f"No flow state found for UUID: {restore_uuid}", color="red"
@@ -784,9 +1038,18 @@ class Flow(Generic[T], metaclass=FlowMeta):
             self._execute_start_method(start_method)
             for start_method in self._start_methods
         ]
-        await asyncio.gather(*tasks)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self._shutdown_method_executor()
+
+        if not self._method_failed:
+            # Nothing is left to resume; a later kickoff with this id restarts.
+            for persistence in self._progress_persistences:
+                persistence.save_progress(self.flow_id, None)
 
-        final_output = self._method_outputs[-1] if self._method_outputs else None
+        outputs = self.method_outputs
+        final_output = outputs[-1] if outputs else None
 
         crewai_event_bus.emit(
             self,
@@ -825,45 +1088,59 @@ class Flow(Generic[T], metaclass=FlowMeta):
     async def _execute_method(
         self, method_name: str, method: Callable, *args: Any, **kwargs: Any
     ) -> Any:
+        replayed = self._resumed_results.get(method_name)
+        recorded = replayed.pop(0) if replayed else _RERUN
+        if recorded is not _RERUN:
+            # Completed before the flow was resumed: reuse the recorded output
+            # so its listeners are triggered without running it again.
+            self._record_result(method_name, recorded)
+            return recorded
+
+        # Reserve the output's position now: methods running in parallel finish
+        # in any order, but outputs are kept in the order methods were started.
+        slot = _PendingOutput()
+        self._method_outputs.append(slot)
         try:
-            dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
-                kwargs or {}
-            )
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionStartedEvent(
-                    type="method_execution_started",
-                    method_name=method_name,
-                    flow_name=self.__class__.__name__,
-                    params=dumped_params,
-                    state=self._copy_state(),
-                ),
-            )
+            # Snapshots of the state are only taken for events someone receives.
+            if crewai_event_bus.has_handlers(MethodExecutionStartedEvent):
+                dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
+                    kwargs or {}
+                )
+                crewai_event_bus.emit(
+                    self,
+                    MethodExecutionStartedEvent(
+                        type="method_execution_started",
+                        method_name=method_name,
+                        flow_name=self.__class__.__name__,
+                        params=dumped_params,
+                        state=self._copy_state(),
+                    ),
+                )
 
             result = (
                 await method(*args, **kwargs)
                 if asyncio.iscoroutinefunction(method)
-                else method(*args, **kwargs)
+                else await self._run_sync_method(method_name, method, *args, **kwargs)
             )
 
-            self._method_outputs.append(result)
-            self._method_execution_counts[method_name] = (
-                self._method_execution_counts.get(method_name, 0) + 1
-            )
-
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionFinishedEvent(
-                    type="method_execution_finished",
-                    method_name=method_name,
-                    flow_name=self.__class__.__name__,
-                    state=self._copy_state(),
-                    result=result,
-                ),
-            )
+            self._record_result(method_name, result, slot)
+
+            if crewai_event_bus.has_handlers(MethodExecutionFinishedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    MethodExecutionFinishedEvent(
+                        type="method_execution_finished",
+                        method_name=method_name,
+                        flow_name=self.__class__.__name__,
+                        state=self._copy_state(),
+                        result=result,
+                    ),
+                )
 
             return result
         except Exception as e:
+            self._method_failed = True
+            del self._method_outputs[self._output_index(slot)]
             crewai_event_bus.emit(
                 self,
                 MethodExecutionFailedEvent(
@@ -875,6 +1152,103 @@ class Flow(Generic[T], metaclass=FlowMeta):
             )
             raise e
 
+    def _record_result(
+        self, method_name: str, result: Any, slot: Optional["_PendingOutput"] = None
+    ) -> None:
+        if slot is None:
+            self._method_outputs.append(result)
+        else:
+            self._method_outputs[self._output_index(slot)] = result
+        with self._results_lock:
+            self._method_results.setdefault(method_name, []).append(result)
+        self._method_execution_counts[method_name] = (
+            self._method_execution_counts.get(method_name, 0) + 1
+        )
+
+    def _output_index(self, slot: "_PendingOutput") -> int:
+        # Compared by identity: outputs may not support comparisons.
+        for index in range(len(self._method_outputs) - 1, -1, -1):
+            if self._method_outputs[index] is slot:
+                return index
+        raise ValueError("Output slot not found")
+
+    def _progress_record(
+        self, method_name: str, result: Any, persistence: FlowPersistence
+    ) -> Dict[str, Any]:
+        """Return the progress to save with the state once ``method_name`` returns.
+
+        The record holds the outputs of every completed method, so the number
+        of outputs of a method is its execution count. Pydantic outputs are
+        stored with the path of their class to be validated back into it;
+        outputs that would not be restored equal to the original are listed
+        under ``rerun`` and their methods run again on resume. ``persistence``
+        is cleared when the flow finishes.
+        """
+        with self._results_lock:
+            if persistence not in self._progress_persistences:
+                self._progress_persistences.append(persistence)
+            method_results = {
+                name: list(results) for name, results in self._method_results.items()
+            }
+        method_results.setdefault(method_name, []).append(result)
+
+        values: Dict[str, List[Any]] = {}
+        models: Dict[str, Dict[str, str]] = {}
+        reruns: Dict[str, List[int]] = {}
+        for name, results in method_results.items():
+            values[name] = []
+            for index, output in enumerate(results):
+                try:
+                    value, path = _encode_result(output)
+                except Exception:
+                    value, path = None, None
+                    reruns.setdefault(name, []).append(index)
+                if path is not None:
+                    models.setdefault(name, {})[str(index)] = path
+                values[name].append(value)
+
+        progress: Dict[str, Any] = {"method_results": values}
+        if models:
+            progress["result_models"] = models
+        if reruns:
+            progress["rerun"] = reruns
+        return progress
+
+    async def _run_sync_method(
+        self, method_name: str, method: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a synchronous method on the flow's executor.
+
+        The method runs in a copy of the current context. Methods marked with
+        ``@concurrency(offload=False)`` run on the event loop thread instead.
+        """
+        max_parallel, offload = self._method_concurrency.get(method_name, (None, True))
+        if not offload:
+            return method(*args, **kwargs)
+
+        limit: Any = contextlib.nullcontext()
+        if max_parallel is not None:
+            limit = self._method_semaphores.setdefault(
+                method_name, asyncio.Semaphore(max_parallel)
+            )
+        async with limit:
+            if self._method_executor is None:
+                self._method_executor = ThreadPoolExecutor(
+                    max_workers=self.max_parallel_methods,
+                    thread_name_prefix="crewai-flow",
+                )
+            context = contextvars.copy_context()
+            return await asyncio.get_running_loop().run_in_executor(
+                self._method_executor,
+                functools.partial(context.run, method, *args, **kwargs),
+            )
+
+    def _shutdown_method_executor(self) -> None:
+        if self._method_executor is not None and self._owns_method_executor:
+            self._method_executor.shutdown(wait=False)
+            self._method_executor = None
+        self._method_semaphores = {}
+
     async def _execute_listeners(self, trigger_method: str, result: Any) -> None:
         """
         Executes all listeners and routers triggered by a method completion.
@@ -910,9 +1284,11 @@ class Flow(Generic[T], metaclass=FlowMeta):
                 break
 
             for router_name in routers_triggered:
-                await self._execute_single_listener(router_name, result)
-                # After executing router, the router's result is the path
-                router_result = self._method_outputs[-1]
+                # The router's result is the path; other methods running in
+                # parallel may have appended to _method_outputs meanwhile.
+                router_result = await self._execute_single_listener(
+                    router_name, result
+                )
                 if router_result:  # Only add non-None results
                     router_results.append(router_result)
                 current_trigger = (
@@ -963,27 +1339,30 @@ class Flow(Generic[T], metaclass=FlowMeta):
           * AND: Triggers only when all conditions are met
         - Maintains state for AND conditions using _pending_and_listeners
         - Separates router and normal listener evaluation
+        - Only visits the listeners of ``trigger_method``, looked up in the
+          index built by ``FlowMeta``
         """
+        candidates = (
+            self._trigger_index.get(trigger_method)
+            if isinstance(trigger_method, str)
+            else None
+        )
+        if not candidates:
+            return []
         triggered = []
-        for listener_name, (condition_type, methods) in self._listeners.items():
-            is_router = listener_name in self._routers
-
-            if router_only != is_router:
-                continue
+        for listener_name in candidates[0 if router_only else 1]:
+            condition_type, methods = self._listeners[listener_name]
 
             if condition_type == "OR":
-                # If the trigger_method matches any in methods, run this
-                if trigger_method in methods:
-                    triggered.append(listener_name)
+                triggered.append(listener_name)
             elif condition_type == "AND":
                 # Initialize pending methods for this listener if not already done
-                if listener_name not in self._pending_and_listeners:
-                    self._pending_and_listeners[listener_name] = set(methods)
-                # Remove the trigger method from pending methods
-                if trigger_method in self._pending_and_listeners[listener_name]:
-                    self._pending_and_listeners[listener_name].discard(trigger_method)
+                pending = self._pending_and_listeners.setdefault(
+                    listener_name, set(methods)
+                )
+                pending.discard(trigger_method)
 
-                if not self._pending_and_listeners[listener_name]:
+                if not pending:
                     # All required methods have been executed
                     triggered.append(listener_name)
                     # Reset pending methods for this listener
@@ -991,7 +1370,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
         return triggered
 
-    async def _execute_single_listener(self, listener_name: str, result: Any) -> None:
+    async def _execute_single_listener(self, listener_name: str, result: Any) -> Any:
         """
         Executes a single listener method with proper event handling.
 
@@ -1006,6 +1385,11 @@ class Flow(Generic[T], metaclass=FlowMeta):
             The result from the triggering method, which may be passed
             to the listener if it accepts parameters.
 
+        Returns
+        -------
+        Any
+            The listener's result, or None if it raised.
+
         Notes
         -----
         - Inspects method signature to determine if it accepts the trigger result
@@ -1022,11 +1406,15 @@ class Flow(Generic[T], metaclass=FlowMeta):
         try:
             method = self._methods[listener_name]
 
-            sig = inspect.signature(method)
-            params = list(sig.parameters.values())
-            method_params = [p for p in params if p.name != "self"]
+            if listener_name in self._listener_params:
+                accepts_result = self._listener_params[listener_name] > 0
+            else:
+                accepts_result = any(
+                    p.name != "self"
+                    for p in inspect.signature(method).parameters.values()
+                )
 
-            if method_params:
+            if accepts_result:
                 listener_result = await self._execute_method(
                     listener_name, method, result
                 )
@@ -1035,6 +1423,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
             # Execute listeners (and possibly routers) of this listener
             await self._execute_listeners(listener_name, listener_result)
+            return listener_result
 
         except Exception as e:
             print(
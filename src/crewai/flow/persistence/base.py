@@ -51,3 +51,32 @@ class FlowPersistence(abc.ABC):
             The most recent state as a dictionary, or None if no state exists
         """
         pass
+    
+    def save_progress(
+        self,
+        flow_uuid: str,
+        progress: Optional[Dict[str, Any]]
+    ) -> None:
+        """Record which methods of a running flow have completed.
+        
+        Called right after ``save_state`` so both describe the same moment.
+        The default implementation stores nothing, so flows restored from
+        such a backend run again from their start methods.
+        
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            progress: JSON-compatible progress record, or None once the flow
+                finished and there is nothing left to resume
+        """
+        pass
+    
+    def load_progress(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
+        """Load the progress recorded for an unfinished flow.
+        
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            
+        Returns:
+            The last progress record, or None if there is nothing to resume
+        """
+        return None
@@ -58,17 +58,20 @@ class PersistenceDecorator:
     _printer = Printer()  # Class-level printer instance
 
     @classmethod
-    def persist_state(cls, flow_instance: Any, method_name: str, persistence_instance: FlowPersistence, verbose: bool = False) -> None:
+    def persist_state(cls, flow_instance: Any, method_name: str, persistence_instance: FlowPersistence, verbose: bool = False, result: Any = None) -> None:
         """Persist flow state with proper error handling and logging.
 
         This method handles the persistence of flow state data, including proper
-        error handling and colored console output for status updates.
+        error handling and colored console output for status updates. The
+        flow's progress, including ``result``, is saved right after the state
+        so an interrupted flow can resume after this method.
 
         Args:
             flow_instance: The flow instance whose state to persist
             method_name: Name of the method that triggered persistence
             persistence_instance: The persistence backend to use
             verbose: Whether to log persistence operations
+            result: The value the method returned
 
         Raises:
             ValueError: If flow has no state or state lacks an ID
@@ -100,6 +103,12 @@ class PersistenceDecorator:
                     method_name=method_name,
                     state_data=state,
                 )
+                progress_record = getattr(flow_instance, "_progress_record", None)
+                if progress_record is not None:
+                    persistence_instance.save_progress(
+                        flow_uuid,
+                        progress_record(method_name, result, persistence_instance),
+                    )
             except Exception as e:
                 error_msg = LOG_MESSAGES["save_error"].format(method_name, str(e))
                 cls._printer.print(error_msg, color="red")
@@ -181,7 +190,7 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
                         @functools.wraps(original_method)
                         async def method_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
                             result = await original_method(self, *args, **kwargs)
-                            PersistenceDecorator.persist_state(self, method_name, actual_persistence, verbose)
+                            PersistenceDecorator.persist_state(self, method_name, actual_persistence, verbose, result)
                             return result
                         return method_wrapper
 
@@ -201,7 +210,7 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
                         @functools.wraps(original_method)
                         def method_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
                             result = original_method(self, *args, **kwargs)
-                            PersistenceDecorator.persist_state(self, method_name, actual_persistence, verbose)
+                            PersistenceDecorator.persist_state(self, method_name, actual_persistence, verbose, result)
                             return result
                         return method_wrapper
 
@@ -230,7 +239,7 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
                         result = await method_coro
                     else:
                         result = method_coro
-                    PersistenceDecorator.persist_state(flow_instance, method.__name__, actual_persistence, verbose)
+                    PersistenceDecorator.persist_state(flow_instance, method.__name__, actual_persistence, verbose, result)
                     return result
 
                 for attr in ["__is_start_method__", "__trigger_methods__", "__condition_type__", "__is_router__"]:
@@ -242,7 +251,7 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
                 @functools.wraps(method)
                 def method_sync_wrapper(flow_instance: Any, *args: Any, **kwargs: Any) -> T:
                     result = method(flow_instance, *args, **kwargs)
-                    PersistenceDecorator.persist_state(flow_instance, method.__name__, actual_persistence, verbose)
+                    PersistenceDecorator.persist_state(flow_instance, method.__name__, actual_persistence, verbose, result)
                     return result
 
                 for attr in ["__is_start_method__", "__trigger_methods__", "__condition_type__", "__is_router__"]:
@@ -0,0 +1,119 @@
+"""
+Minimal JSON Patch (RFC 6902) support for flow state deltas.
+"""
+
+from typing import Any, Dict, List
+
+Patch = List[Dict[str, Any]]
+
+
+def make_patch(old: Any, new: Any) -> Patch:
+    """Return the operations turning the JSON document ``old`` into ``new``.
+
+    Objects are compared key by key. A list that only grew at the end is
+    patched with ``add`` operations for the new items; any other change to
+    a list, or a change of type, replaces the whole value.
+
+    Args:
+        old: The previous JSON-compatible document
+        new: The current JSON-compatible document
+
+    Returns:
+        A list of ``add``, ``remove`` and ``replace`` operations
+    """
+    patch: Patch = []
+    _diff(old, new, "", patch)
+    return patch
+
+
+def apply_patch(document: Any, patch: Patch) -> Any:
+    """Apply the operations of ``patch`` to ``document`` in place.
+
+    Args:
+        document: The JSON-compatible document to patch
+        patch: Operations produced by :func:`make_patch`
+
+    Returns:
+        The patched document, which is ``document`` itself unless the
+        patch replaced the whole document
+
+    Raises:
+        ValueError: If an operation is not supported or its path does not exist
+    """
+    for operation in patch:
+        document = _apply(document, operation)
+    return document
+
+
+def _diff(old: Any, new: Any, path: str, patch: Patch) -> None:
+    if type(old) is not type(new):
+        patch.append({"op": "replace", "path": path, "value": new})
+    elif isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                patch.append({"op": "add", "path": child, "value": value})
+            elif not _same(old[key], value):
+                _diff(old[key], value, child, patch)
+    elif isinstance(new, list):
+        if len(new) > len(old) and _same(new[: len(old)], old):
+            for value in new[len(old) :]:
+                patch.append({"op": "add", "path": f"{path}/-", "value": value})
+        elif not _same(old, new):
+            patch.append({"op": "replace", "path": path, "value": new})
+    elif old != new:
+        patch.append({"op": "replace", "path": path, "value": new})
+
+
+def _same(old: Any, new: Any) -> bool:
+    """Compare JSON values without Python's ``1 == True == 1.0`` coercions."""
+    if type(old) is not type(new):
+        return False
+    if isinstance(new, dict):
+        return old.keys() == new.keys() and all(
+            _same(old[key], value) for key, value in new.items()
+        )
+    if isinstance(new, list):
+        return len(old) == len(new) and all(map(_same, old, new))
+    return old == new
+
+
+def _apply(document: Any, operation: Dict[str, Any]) -> Any:
+    op, path = operation["op"], operation["path"]
+    if path == "":
+        if op != "replace":
+            raise ValueError(f"Unsupported operation on the document root: {op}")
+        return operation["value"]
+
+    *parents, last = [_unescape(token) for token in path[1:].split("/")]
+    target = document
+    try:
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        if op == "remove":
+            del target[int(last) if isinstance(target, list) else last]
+        elif op in ("add", "replace"):
+            if isinstance(target, list):
+                if last == "-":
+                    target.append(operation["value"])
+                elif op == "add":
+                    target.insert(int(last), operation["value"])
+                else:
+                    target[int(last)] = operation["value"]
+            else:
+                target[last] = operation["value"]
+        else:
+            raise ValueError(f"Unsupported JSON patch operation: {op}")
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(f"Invalid JSON patch path {path}: {e}") from e
+    return document
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
@@ -2,33 +2,81 @@
 SQLite-based implementation of flow state persistence.
 """
 
+import atexit
 import json
+import logging
+import queue
 import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import apply_patch, make_patch
+
+logger = logging.getLogger(__name__)
+
+# Flows whose previous state is kept in memory to compute deltas against.
+MAX_CACHED_FLOWS = 256
+
+# Persistences whose queued writes must reach the database before exit.
+_write_behind_persistences: "weakref.WeakSet[SQLiteFlowPersistence]" = (
+    weakref.WeakSet()
+)
+
+
+@atexit.register
+def _flush_persistences_on_exit() -> None:
+    for persistence in list(_write_behind_persistences):
+        persistence.flush()
+
+
+# ("state", flow_uuid, method_name, timestamp, state_json) or
+# ("progress", flow_uuid, progress_json or None)
+_PendingWrite = Tuple[Any, ...]
 
 
 class SQLiteFlowPersistence(FlowPersistence):
     """SQLite-based implementation of flow state persistence.
 
     This class provides a simple, file-based persistence implementation using SQLite.
-    It's suitable for development and testing, or for production use cases with
-    moderate performance requirements.
+    A single connection in WAL mode is shared by all threads. With
+    ``write_behind`` (the default) ``save_state`` only serializes the state
+    and queues it; a background thread writes queued states in one
+    transaction per batch. Every ``checkpoint_every``-th state of a flow is
+    stored in full and the ones in between as JSON patches against the
+    previous state, so ``load_state`` replays at most ``checkpoint_every - 1``
+    patches. With ``keep_last`` set, only the last ``keep_last`` states of
+    each flow (plus the checkpoint they are based on) are kept. The progress
+    of unfinished flows is kept in a ``flow_progress`` table, one row per
+    flow, written in the same order as the states.
     """
 
     db_path: str  # Type annotation for instance variable
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        write_behind: bool = True,
+        checkpoint_every: int = 20,
+        keep_last: Optional[int] = None,
+        max_batch_size: int = 256,
+    ):
         """Initialize SQLite persistence.
 
         Args:
             db_path: Path to the SQLite database file. If not provided, uses
                     db_storage_path() from utilities.paths.
+            write_behind: Whether states are written by a background thread.
+            checkpoint_every: Number of states per flow between two full
+                    snapshots; 1 stores every state in full.
+            keep_last: Number of states kept per flow UUID, or None to keep all.
+            max_batch_size: Maximum number of queued states written per transaction.
 
         Raises:
             ValueError: If db_path is invalid
@@ -40,13 +88,42 @@ class SQLiteFlowPersistence(FlowPersistence):
 
         if not path:
             raise ValueError("Database path must be provided")
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
 
         self.db_path = path  # Now mypy knows this is str
+        self.write_behind = write_behind
+        self.checkpoint_every = checkpoint_every
+        self.keep_last = keep_last
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Last state written per flow, the number of deltas written since its
+        # checkpoint and its row id, in least recently saved order.
+        self._last_states: "OrderedDict[str, Tuple[Any, int, Optional[int]]]" = (
+            OrderedDict()
+        )
+        self._pending: "queue.Queue[_PendingWrite]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
         self.init_db()
+        if write_behind:
+            _write_behind_persistences.add(self)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
 
     def init_db(self) -> None:
         """Create the necessary tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._connection()
             conn.execute(
                 """
             CREATE TABLE IF NOT EXISTS flow_states (
@@ -54,10 +131,17 @@ class SQLiteFlowPersistence(FlowPersistence):
                 flow_uuid TEXT NOT NULL,
                 method_name TEXT NOT NULL,
                 timestamp DATETIME NOT NULL,
-                state_json TEXT NOT NULL
+                state_json TEXT NOT NULL,
+                is_delta INTEGER NOT NULL DEFAULT 0
             )
             """
             )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(flow_states)")}
+            if "is_delta" not in columns:
+                # Databases created before deltas were stored.
+                conn.execute(
+                    "ALTER TABLE flow_states ADD COLUMN is_delta INTEGER NOT NULL DEFAULT 0"
+                )
             # Add index for faster UUID lookups
             conn.execute(
                 """
@@ -65,6 +149,16 @@ class SQLiteFlowPersistence(FlowPersistence):
             ON flow_states(flow_uuid)
             """
             )
+            conn.execute(
+                """
+            CREATE TABLE IF NOT EXISTS flow_progress (
+                flow_uuid TEXT PRIMARY KEY,
+                timestamp DATETIME NOT NULL,
+                progress_json TEXT NOT NULL
+            )
+            """
+            )
+            conn.commit()
 
     def save_state(
         self,
@@ -89,23 +183,50 @@ class SQLiteFlowPersistence(FlowPersistence):
                 f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-            INSERT INTO flow_states (
+        # Serializing here captures the state before the flow changes it again.
+        self._submit(
+            (
+                "state",
                 flow_uuid,
                 method_name,
-                timestamp,
-                state_json
-            ) VALUES (?, ?, ?, ?)
-            """,
-                (
-                    flow_uuid,
-                    method_name,
-                    datetime.now(timezone.utc).isoformat(),
-                    json.dumps(state_dict),
-                ),
+                datetime.now(timezone.utc).isoformat(),
+                json.dumps(state_dict),
             )
+        )
+
+    def save_progress(
+        self, flow_uuid: str, progress: Optional[Dict[str, Any]]
+    ) -> None:
+        """Save or, with None, delete the progress of a flow.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            progress: JSON-compatible progress record, or None
+        """
+        self._submit(
+            ("progress", flow_uuid, None if progress is None else json.dumps(progress))
+        )
+
+    def load_progress(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
+        """Load the progress recorded for an unfinished flow.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+
+        Returns:
+            The last progress record, or None if there is nothing to resume
+        """
+        self.flush()
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT progress_json FROM flow_progress WHERE flow_uuid = ?",
+                    (flow_uuid,),
+                )
+                .fetchone()
+            )
+        return json.loads(row[0]) if row else None
 
     def load_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
         """Load the most recent state for a given flow UUID.
@@ -116,19 +237,191 @@ class SQLiteFlowPersistence(FlowPersistence):
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        self.flush()
+        with self._lock:
+            conn = self._connection()
+            checkpoint = conn.execute(
                 """
-            SELECT state_json
+            SELECT id, state_json
             FROM flow_states
-            WHERE flow_uuid = ?
+            WHERE flow_uuid = ? AND is_delta = 0
             ORDER BY id DESC
             LIMIT 1
             """,
                 (flow_uuid,),
-            )
-            row = cursor.fetchone()
+            ).fetchone()
+            if checkpoint is None:
+                return None
+            deltas = conn.execute(
+                """
+            SELECT state_json
+            FROM flow_states
+            WHERE flow_uuid = ? AND id > ?
+            ORDER BY id
+            """,
+                (flow_uuid, checkpoint[0]),
+            ).fetchall()
+
+        state = json.loads(checkpoint[1])
+        for (patch_json,) in deltas:
+            state = apply_patch(state, json.loads(patch_json))
+        return state
+
+    def flush(self) -> None:
+        """Block until every queued state has been written."""
+        self._pending.join()
+
+    def close(self) -> None:
+        """Write the queued states and close the connection."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _submit(self, pending: _PendingWrite) -> None:
+        if not self.write_behind:
+            self._write([pending])
+            return
+        self._pending.put(pending)
+        self._start_writer()
 
-        if row:
-            return json.loads(row[0])
-        return None
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_pending, name="crewai-flow-persistence", daemon=True
+                )
+                self._writer.start()
+
+    def _write_pending(self) -> None:
+        while True:
+            batch: List[_PendingWrite] = []
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                with self._writer_lock:
+                    # A state queued before the lock was taken is still ours.
+                    if self._pending.empty():
+                        self._writer = None
+                        return
+                continue
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} flow states: {e}")
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    def _write(self, batch: List[_PendingWrite]) -> None:
+        """Write ``batch`` in one transaction, states as checkpoints or deltas."""
+        states = [pending[1:] for pending in batch if pending[0] == "state"]
+        timestamp = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            conn = self._connection()
+            try:
+                # Take the write lock before looking up the latest rows, so no
+                # other connection can add a state between lookup and insert.
+                conn.execute("BEGIN IMMEDIATE")
+                for flow_uuid, method_name, saved_at, state_json in states:
+                    state = json.loads(state_json)
+                    row_json, is_delta, deltas = self._encode(
+                        conn, flow_uuid, state_json, state
+                    )
+                    cursor = conn.execute(
+                        """
+                    INSERT INTO flow_states (
+                        flow_uuid,
+                        method_name,
+                        timestamp,
+                        state_json,
+                        is_delta
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                        (flow_uuid, method_name, saved_at, row_json, is_delta),
+                    )
+                    self._last_states[flow_uuid] = (state, deltas, cursor.lastrowid)
+                    if len(self._last_states) > MAX_CACHED_FLOWS:
+                        self._last_states.popitem(last=False)
+                if self.keep_last is not None:
+                    for flow_uuid in {state[0] for state in states}:
+                        self._apply_retention(conn, flow_uuid)
+                for pending in batch:
+                    if pending[0] != "progress":
+                        continue
+                    _, flow_uuid, progress_json = pending
+                    if progress_json is None:
+                        conn.execute(
+                            "DELETE FROM flow_progress WHERE flow_uuid = ?",
+                            (flow_uuid,),
+                        )
+                    else:
+                        conn.execute(
+                            """
+                        INSERT OR REPLACE INTO flow_progress (
+                            flow_uuid,
+                            timestamp,
+                            progress_json
+                        ) VALUES (?, ?, ?)
+                        """,
+                            (flow_uuid, timestamp, progress_json),
+                        )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                # The cached states were never written; start the next
+                # states of these flows from a checkpoint.
+                for state in states:
+                    self._last_states.pop(state[0], None)
+                raise
+
+    def _encode(
+        self, conn: sqlite3.Connection, flow_uuid: str, state_json: str, state: Any
+    ) -> Tuple[str, int, int]:
+        """Return the row of ``state``, its ``is_delta`` flag and the deltas since its checkpoint.
+
+        A delta is only written against the cached state if that state is
+        still the latest row of the flow; another persistence instance on
+        the same database, such as the one of a method-level ``@persist``,
+        may have written a state since.
+        """
+        previous = self._last_states.pop(flow_uuid, None)
+        if previous is not None:
+            latest = conn.execute(
+                "SELECT MAX(id) FROM flow_states WHERE flow_uuid = ?", (flow_uuid,)
+            ).fetchone()[0]
+            if latest != previous[2]:
+                previous = None
+        if previous is None or previous[1] + 1 >= self.checkpoint_every:
+            return state_json, 0, 0
+        return json.dumps(make_patch(previous[0], state)), 1, previous[1] + 1
+
+    def _apply_retention(self, conn: sqlite3.Connection, flow_uuid: str) -> None:
+        oldest_kept = conn.execute(
+            """
+            SELECT id FROM flow_states
+            WHERE flow_uuid = ?
+            ORDER BY id DESC
+            LIMIT 1 OFFSET ?
+            """,
+            (flow_uuid, self.keep_last - 1),  # type: ignore[operator]
+        ).fetchone()
+        if oldest_kept is None:
+            return
+        # The deltas of the oldest kept state need the checkpoint before it.
+        base = conn.execute(
+            """
+            SELECT MAX(id) FROM flow_states
+            WHERE flow_uuid = ? AND is_delta = 0 AND id <= ?
+            """,
+            (flow_uuid, oldest_kept[0]),
+        ).fetchone()
+        if base[0] is not None:
+            conn.execute(
+                "DELETE FROM flow_states WHERE flow_uuid = ? AND id < ?",
+                (flow_uuid, base[0]),
+            )
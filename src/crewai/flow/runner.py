@@ -0,0 +1,160 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from crewai.flow.flow import Flow
+
+"""Long-lived runner executing many flow instances on one event loop."""
+
+
+def _new_event_loop(use_uvloop: bool) -> asyncio.AbstractEventLoop:
+    if use_uvloop:
+        try:
+            import uvloop
+
+            return uvloop.new_event_loop()
+        except ImportError:
+            pass
+    return asyncio.new_event_loop()
+
+
+class FlowRunner:
+    """Runs instances of a flow class concurrently on one long-lived event loop.
+
+    The loop (``uvloop``'s when it is installed and ``use_uvloop`` is set)
+    runs on a daemon thread owned by the runner, so it can be fed from any
+    thread or event loop, for example by the handlers of a web API. Every
+    run creates a new instance of ``flow_class``, so method outputs, pending
+    ``and_`` conditions and state are never shared between runs; what is
+    shared are the loop, a thread pool of ``max_parallel_methods`` workers
+    for synchronous methods, and the ``flow_kwargs`` passed to every
+    instance, such as a ``persistence`` backend. At most ``max_concurrency``
+    runs are in progress at once; further ones wait for a slot.
+
+    Example:
+        with FlowRunner(MyFlow, max_concurrency=8) as runner:
+            for index, output in runner.as_completed([{"topic": "ai"}, ...]):
+                ...
+    """
+
+    def __init__(
+        self,
+        flow_class: Type[Flow],
+        max_concurrency: Optional[int] = None,
+        max_parallel_methods: Optional[int] = None,
+        use_uvloop: bool = True,
+        **flow_kwargs: Any,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.flow_class = flow_class
+        self.max_concurrency = max_concurrency
+        self.flow_kwargs = flow_kwargs
+        self._loop = _new_event_loop(use_uvloop)
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="crewai-flow-runner", daemon=True
+        )
+        self._thread.start()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_parallel_methods or flow_class.max_parallel_methods,
+            thread_name_prefix="crewai-flow",
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._closed = False
+
+    def submit(self, inputs: Optional[Dict[str, Any]] = None) -> "Future[Any]":
+        """Start a run and return a future of its final output."""
+        if self._closed:
+            raise RuntimeError("FlowRunner is closed")
+        return asyncio.run_coroutine_threadsafe(self._run(inputs), self._loop)
+
+    def kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> Any:
+        """Run one flow and block until it finishes."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "FlowRunner.kickoff cannot block the runner's own loop; "
+                "use kickoff_async instead"
+            )
+        return self.submit(inputs).result()
+
+    async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = None) -> Any:
+        """Run one flow on the runner's loop and await its output from any loop."""
+        return await asyncio.wrap_future(self.submit(inputs))
+
+    def as_completed(
+        self,
+        inputs_list: List[Dict[str, Any]],
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[int, Any]]:
+        """Run a flow for each input and yield ``(index, output)`` as they finish.
+
+        With ``return_exceptions`` a failing run yields its exception instead
+        of raising it. Runs still in progress when the iterator is closed are
+        cancelled.
+        """
+        futures = {
+            self.submit(inputs): index for index, inputs in enumerate(inputs_list)
+        }
+        try:
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is not None:
+                    if not return_exceptions:
+                        raise error
+                    yield futures[future], error
+                else:
+                    yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def kickoff_many(
+        self,
+        inputs_list: List[Dict[str, Any]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run a flow for each input and return the outputs in input order."""
+        results: List[Any] = [None] * len(inputs_list)
+        for index, result in self.as_completed(inputs_list, return_exceptions):
+            results[index] = result
+        return results
+
+    def close(self) -> None:
+        """Wait for the runs in progress, then stop the loop and the thread pool."""
+        if self._closed:
+            return
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("FlowRunner cannot be closed from its own loop")
+        self._closed = True
+
+        async def wait_for_runs() -> None:
+            current = asyncio.current_task()
+            runs = [task for task in asyncio.all_tasks() if task is not current]
+            await asyncio.gather(*runs, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(wait_for_runs(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> "FlowRunner":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def _run(self, inputs: Optional[Dict[str, Any]]) -> Any:
+        if self.max_concurrency is None:
+            return await self._kickoff(inputs)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await self._kickoff(inputs)
+
+    async def _kickoff(self, inputs: Optional[Dict[str, Any]]) -> Any:
+        flow = self.flow_class(**self.flow_kwargs)
+        flow._method_executor = self._executor
+        flow._owns_method_executor = False
+        return await flow.kickoff_async(inputs)
@@ -3,6 +3,8 @@ from typing import List, Optional, Union
 
 import numpy as np
 
+from crewai.utilities.embedding_cache import get_embedding_cache
+
 from .base_embedder import BaseEmbedder
 
 try:
@@ -46,6 +48,7 @@ class FastEmbed(BaseEmbedder):
             model_name=model_name,
             cache_dir=str(cache_dir) if cache_dir else None,
         )
+        self.fingerprint = f"fastembed/{model_name}"
 
     def embed_chunks(self, chunks: List[str]) -> List[np.ndarray]:
         """
@@ -57,8 +60,7 @@ class FastEmbed(BaseEmbedder):
         Returns:
             List of embeddings
         """
-        embeddings = list(self.model.embed(chunks))
-        return embeddings
+        return self.embed_texts(chunks)
 
     def embed_texts(self, texts: List[str]) -> List[np.ndarray]:
         """
@@ -70,8 +72,9 @@ class FastEmbed(BaseEmbedder):
         Returns:
             List of embeddings
         """
-        embeddings = list(self.model.embed(texts))
-        return embeddings
+        return get_embedding_cache().embed(
+            self.fingerprint, texts, lambda missing: list(self.model.embed(missing))
+        )
 
     def embed_text(self, text: str) -> np.ndarray:
         """
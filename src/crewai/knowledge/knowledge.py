@@ -5,6 +5,8 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.storage.numpy_knowledge_storage import NumpyKnowledgeStorage
+from crewai.utilities.numpy_vector_store import vector_store_backend
 
 os.environ["TOKENIZERS_PARALLELISM"] = "false"  # removes logging from fastembed
 
@@ -36,7 +38,12 @@ class Knowledge(BaseModel):
         if storage:
             self.storage = storage
         else:
-            self.storage = KnowledgeStorage(
+            storage_class = (
+                NumpyKnowledgeStorage
+                if vector_store_backend() == "numpy"
+                else KnowledgeStorage
+            )
+            self.storage = storage_class(
                 embedder=embedder, collection_name=collection_name
             )
         self.sources = sources
@@ -61,12 +68,22 @@ class Knowledge(BaseModel):
         return results
 
     def _add_sources(self):
+        """Ingest the sources, skipping documents the storage already holds.
+
+        Documents that were ingested before but no longer belong to any source
+        are removed once every source has been added.
+        """
+        if self.storage is None:
+            raise ValueError("Storage is not initialized.")
+        self.storage.begin_sync()
+        completed = False
         try:
             for source in self.sources:
                 source.storage = self.storage
                 source.add()
-        except Exception as e:
-            raise e
+            completed = True
+        finally:
+            self.storage.finish_sync(prune=completed)
 
     def reset(self) -> None:
         if self.storage:
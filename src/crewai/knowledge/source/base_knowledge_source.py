@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
+from crewai.knowledge.storage.knowledge_manifest import KnowledgeManifest
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 
 
@@ -19,6 +21,14 @@ class BaseKnowledgeSource(BaseModel, ABC):
     storage: Optional[KnowledgeStorage] = Field(default=None)
     metadata: Dict[str, Any] = Field(default_factory=dict)  # Currently unused
     collection_name: Optional[str] = Field(default=None)
+    parallel: bool = Field(
+        default=False,
+        description="Parse files in worker processes (PDF, Excel and Docling sources).",
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="Maximum number of worker processes used when parallel is enabled.",
+    )
 
     @abstractmethod
     def validate_content(self) -> Any:
@@ -41,6 +51,101 @@ class BaseKnowledgeSource(BaseModel, ABC):
             for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
         ]
 
+    def _chunk_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Chunk text arriving in pieces, yielding the same chunks as ``_chunk_text``.
+
+        Only the text of the chunk being built is buffered, so memory does
+        not grow with the size of the document.
+        """
+        step = self.chunk_size - self.chunk_overlap
+        buffer = ""
+        for piece in pieces:
+            buffer += piece
+            start = 0
+            while len(buffer) - start >= self.chunk_size:
+                yield buffer[start : start + self.chunk_size]
+                start += step
+            buffer = buffer[start:]
+        while buffer:
+            yield buffer
+            buffer = buffer[step:]
+
+    def _document_key(self, key: str) -> str:
+        # Changing the chunking settings produces a new document key, so the
+        # chunks from the old settings are pruned.
+        return f"{key}#{self.chunk_size}:{self.chunk_overlap}"
+
+    def _add_document(
+        self,
+        key: str,
+        content: str,
+        file_paths: Sequence[Path] = (),
+        chunker: Optional[Callable[[str], List[str]]] = None,
+    ) -> None:
+        """
+        Chunk and store one document of this source.
+        The storage skips documents whose files or content are unchanged since
+        the last ingestion and only embeds the chunks that are new.
+        """
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        new_chunks = self.storage.sync_document(
+            self._document_key(key),
+            content,
+            chunker or self._chunk_text,
+            file_paths=file_paths,
+        )
+        self.chunks.extend(new_chunks)
+
+    def _add_document_stream(
+        self,
+        key: str,
+        pieces: Callable[[], Iterable[str]],
+        file_paths: Sequence[Path],
+    ) -> None:
+        """
+        Stream one file-backed document through the chunker into the storage.
+        ``pieces`` is only called when the files changed since the last
+        ingestion, and chunks are written in batches instead of being kept
+        on the source.
+        """
+        content_hash = self._stale_file_hash(key, file_paths)
+        if content_hash is not None:
+            self._write_document_stream(key, pieces(), content_hash, file_paths)
+
+    def _stale_file_hash(self, key: str, file_paths: Sequence[Path]) -> Optional[str]:
+        """Return the hash of ``file_paths`` if they must be ingested, else None."""
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        hashes: List[str] = []
+
+        def content_hash() -> str:
+            if not hashes:
+                hashes.append(KnowledgeManifest.hash_files(file_paths))
+            return hashes[0]
+
+        if self.storage.is_document_current(
+            self._document_key(key), file_paths, content_hash
+        ):
+            return None
+        return content_hash()
+
+    def _write_document_stream(
+        self,
+        key: str,
+        pieces: Iterable[str],
+        content_hash: str,
+        file_paths: Sequence[Path],
+    ) -> None:
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        self.storage.write_document(
+            self._document_key(key),
+            self._chunk_stream(pieces),
+            content_hash,
+            file_paths,
+        )
+
     def _save_documents(self):
         """
         Save the documents to the storage.
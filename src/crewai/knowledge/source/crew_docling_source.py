@@ -1,5 +1,6 @@
+from functools import partial
 from pathlib import Path
-from typing import Iterator, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 try:
@@ -16,13 +17,29 @@ except ImportError:
 from pydantic import Field
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.utilities.concurrency import ordered_map
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 
+_converters: Dict[Tuple, "DocumentConverter"] = {}
+
+
+def _convert_document(
+    source: Union[Path, str], allowed_formats: Tuple["InputFormat", ...]
+) -> "DoclingDocument":
+    """Convert one document in a worker process, reusing the process's converter."""
+    converter = _converters.get(allowed_formats)
+    if converter is None:
+        converter = _converters[allowed_formats] = DocumentConverter(
+            allowed_formats=list(allowed_formats)
+        )
+    return converter.convert(source).document
+
 
 class CrewDoclingSource(BaseKnowledgeSource):
     """Default Source class for converting documents to markdown or json
     This will auto support PDF, DOCX, and TXT, XLSX, Images, and HTML files without any additional dependencies and follows the docling package as the source of truth.
+    With ``parallel=True`` each document is converted in a worker process.
     """
 
     def __init__(self, *args, **kwargs):
@@ -83,15 +100,33 @@ class CrewDoclingSource(BaseKnowledgeSource):
     def add(self) -> None:
         if self.content is None:
             return
-        for doc in self.content:
-            new_chunks_iterable = self._chunk_doc(doc)
-            self.chunks.extend(list(new_chunks_iterable))
-        self._save_documents()
+        self.chunks = []
+        for source, doc in zip(self.safe_file_paths, self.content):
+            self._add_document(
+                str(source),
+                doc.export_to_markdown(),
+                file_paths=[source] if isinstance(source, Path) else [],
+                chunker=partial(self._chunk_exported_doc, doc),
+            )
 
     def _convert_source_to_docling_documents(self) -> List["DoclingDocument"]:
+        if self.parallel:
+            allowed_formats = tuple(self.document_converter.allowed_formats)
+            return list(
+                ordered_map(
+                    _convert_document,
+                    [(source, allowed_formats) for source in self.safe_file_paths],
+                    backend="process",
+                    max_concurrency=self.max_workers,
+                )
+            )
         conv_results_iter = self.document_converter.convert_all(self.safe_file_paths)
         return [result.document for result in conv_results_iter]
 
+    def _chunk_exported_doc(self, doc: "DoclingDocument", _markdown: str) -> List[str]:
+        """Chunk ``doc`` by its structure instead of its exported markdown."""
+        return list(self._chunk_doc(doc))
+
     def _chunk_doc(self, doc: "DoclingDocument") -> Iterator[str]:
         chunker = HierarchicalChunker()
         for chunk in chunker.chunk(doc):
@@ -1,36 +1,27 @@
 import csv
 from pathlib import Path
-from typing import Dict, List
+from typing import Iterator, List
 
-from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.source.streaming_file_knowledge_source import (
+    StreamingFileKnowledgeSource,
+)
 
 
-class CSVKnowledgeSource(BaseFileKnowledgeSource):
+class CSVKnowledgeSource(StreamingFileKnowledgeSource):
     """A knowledge source that stores and queries CSV file content using embeddings."""
 
-    def load_content(self) -> Dict[Path, str]:
-        """Load and preprocess CSV file content."""
-        content_dict = {}
-        for file_path in self.safe_file_paths:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                content = ""
-                for row in reader:
-                    content += " ".join(row) + "\n"
-                content_dict[file_path] = content
-        return content_dict
+    def iter_content(self, path: Path) -> Iterator[str]:
+        """Yield each CSV row as a line of space-separated values."""
+        with open(path, "r", encoding="utf-8", newline="") as csvfile:
+            for row in csv.reader(csvfile):
+                yield " ".join(row) + "\n"
 
     def add(self) -> None:
         """
         Add CSV file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+        self._add_files()
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
@@ -5,12 +5,27 @@ from urllib.parse import urlparse
 from pydantic import Field, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.utilities.concurrency import ordered_map
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 
 
+def _read_workbook(file_path: Path) -> Dict[str, str]:
+    """Convert every sheet of a workbook to CSV text. Runs in worker processes when parallel."""
+    import pandas as pd
+
+    with pd.ExcelFile(file_path) as xl:
+        return {
+            str(sheet_name): str(pd.read_excel(xl, sheet_name).to_csv(index=False))
+            for sheet_name in xl.sheet_names
+        }
+
+
 class ExcelKnowledgeSource(BaseKnowledgeSource):
-    """A knowledge source that stores and queries Excel file content using embeddings."""
+    """A knowledge source that stores and queries Excel file content using embeddings.
+
+    With ``parallel=True`` workbooks are converted in worker processes.
+    """
 
     # override content to be a dict of file paths to sheet names to csv content
 
@@ -112,19 +127,18 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             ImportError: If required dependencies are missing.
             FileNotFoundError: If the specified Excel file cannot be opened.
         """
-        pd = self._import_dependencies()
-        content_dict = {}
-        for file_path in self.safe_file_paths:
-            file_path = self.convert_to_path(file_path)
-            with pd.ExcelFile(file_path) as xl:
-                sheet_dict = {
-                    str(sheet_name): str(
-                        pd.read_excel(xl, sheet_name).to_csv(index=False)
-                    )
-                    for sheet_name in xl.sheet_names
-                }
-            content_dict[file_path] = sheet_dict
-        return content_dict
+        self._import_dependencies()
+        paths = [self.convert_to_path(path) for path in self.safe_file_paths]
+        if self.parallel:
+            workbooks = ordered_map(
+                _read_workbook,
+                [(path,) for path in paths],
+                backend="process",
+                max_concurrency=self.max_workers,
+            )
+        else:
+            workbooks = map(_read_workbook, paths)
+        return dict(zip(paths, workbooks))
 
     def convert_to_path(self, path: Union[Path, str]) -> Path:
         """Convert a path to a Path object."""
@@ -157,9 +171,12 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             else:
                 content_str += str(value) + "\n"
 
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+        self.chunks = []
+        self._add_document(
+            ",".join(str(path) for path in self.safe_file_paths),
+            content_str,
+            file_paths=self.safe_file_paths,
+        )
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
@@ -1,48 +1,51 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Iterator, List
 
-from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.source.streaming_file_knowledge_source import (
+    StreamingFileKnowledgeSource,
+)
 
 
-class JSONKnowledgeSource(BaseFileKnowledgeSource):
+class JSONKnowledgeSource(StreamingFileKnowledgeSource):
     """A knowledge source that stores and queries JSON file content using embeddings."""
 
-    def load_content(self) -> Dict[Path, str]:
-        """Load and preprocess JSON file content."""
-        content: Dict[Path, str] = {}
-        for path in self.safe_file_paths:
-            path = self.convert_to_path(path)
-            with open(path, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-            content[path] = self._json_to_text(data)
-        return content
+    def iter_content(self, path: Path) -> Iterator[str]:
+        """Load one JSON file and yield its text representation in pieces.
+
+        The file itself is parsed whole, as the standard library has no
+        incremental JSON parser; only the text and its chunks are produced
+        lazily.
+        """
+        with open(self.convert_to_path(path), "r", encoding="utf-8") as json_file:
+            data = json.load(json_file)
+        yield from self._iter_json_text(data)
 
     def _json_to_text(self, data: Any, level: int = 0) -> str:
         """Recursively convert JSON data to a text representation."""
-        text = ""
+        return "".join(self._iter_json_text(data, level))
+
+    def _iter_json_text(self, data: Any, level: int = 0) -> Iterator[str]:
         indent = "  " * level
         if isinstance(data, dict):
             for key, value in data.items():
-                text += f"{indent}{key}: {self._json_to_text(value, level + 1)}\n"
+                yield f"{indent}{key}: "
+                yield from self._iter_json_text(value, level + 1)
+                yield "\n"
         elif isinstance(data, list):
             for item in data:
-                text += f"{indent}- {self._json_to_text(item, level + 1)}\n"
+                yield f"{indent}- "
+                yield from self._iter_json_text(item, level + 1)
+                yield "\n"
         else:
-            text += f"{str(data)}"
-        return text
+            yield str(data)
 
     def add(self) -> None:
         """
         Add JSON file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+        self._add_files()
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
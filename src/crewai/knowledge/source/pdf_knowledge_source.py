@@ -1,28 +1,49 @@
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Iterator, List, Tuple
 
-from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from pydantic import Field
 
+from crewai.knowledge.source.streaming_file_knowledge_source import (
+    StreamingFileKnowledgeSource,
+)
+from crewai.utilities.concurrency import ordered_map
 
-class PDFKnowledgeSource(BaseFileKnowledgeSource):
-    """A knowledge source that stores and queries PDF file content using embeddings."""
 
-    def load_content(self) -> Dict[Path, str]:
-        """Load and preprocess PDF file content."""
-        pdfplumber = self._import_pdfplumber()
+def _extract_pages(path: Path, start: int, stop: int) -> str:
+    """Extract the text of pages ``start``..``stop`` of a PDF. Runs in worker processes."""
+    import pdfplumber
 
-        content = {}
+    text = ""
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages[start:stop]:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+            page.close()
+    return text
 
-        for path in self.safe_file_paths:
-            text = ""
-            path = self.convert_to_path(path)
-            with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            content[path] = text
-        return content
+
+class PDFKnowledgeSource(StreamingFileKnowledgeSource):
+    """A knowledge source that stores and queries PDF file content using embeddings.
+
+    With ``parallel=True`` every file is split into ranges of
+    ``pages_per_task`` pages that are extracted in worker processes.
+    """
+
+    pages_per_task: int = Field(
+        default=20, description="Pages extracted per worker task when parallel."
+    )
+
+    def iter_content(self, path: Path) -> Iterator[str]:
+        """Extract a PDF page by page, so only one page is held in memory."""
+        pdfplumber = self._import_pdfplumber()
+        with pdfplumber.open(self.convert_to_path(path)) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    yield page_text + "\n"
+                page.close()
 
     def _import_pdfplumber(self):
         """Dynamically import pdfplumber."""
@@ -40,10 +61,38 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
         Add PDF file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
+        if not self.parallel:
+            self._add_files()
+            return
+
+        self.chunks = []
+        stale = []
+        for path in self.safe_file_paths:
+            content_hash = self._stale_file_hash(str(path), [path])
+            if content_hash is not None:
+                stale.append((path, content_hash, self._page_ranges(path)))
+
+        # Page ranges of every changed file are extracted concurrently, and
+        # their text comes back in file and page order.
+        texts = ordered_map(
+            _extract_pages,
+            [(path, start, stop) for path, _, ranges in stale for start, stop in ranges],
+            backend="process",
+            max_concurrency=self.max_workers,
+        )
+        for path, content_hash, ranges in stale:
+            self._write_document_stream(
+                str(path), islice(texts, len(ranges)), content_hash, [path]
+            )
+
+    def _page_ranges(self, path: Path) -> List[Tuple[int, int]]:
+        pdfplumber = self._import_pdfplumber()
+        with pdfplumber.open(path) as pdf:
+            page_count = len(pdf.pages)
+        return [
+            (start, min(start + self.pages_per_task, page_count))
+            for start in range(0, page_count, self.pages_per_task)
+        ]
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
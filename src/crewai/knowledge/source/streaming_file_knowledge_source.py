@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterator
+
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+
+
+class StreamingFileKnowledgeSource(BaseFileKnowledgeSource, ABC):
+    """Base class for file sources that read their files in pieces.
+
+    Files are read lazily when ``add`` calls ``_add_files``: the pieces
+    yielded by ``iter_content`` are chunked as they arrive and written to the
+    storage in batches, so ``content`` and ``chunks`` stay empty.
+    """
+
+    def model_post_init(self, _):
+        """Post-initialization method to validate the paths without reading them."""
+        self.safe_file_paths = self._process_file_paths()
+        self.validate_content()
+
+    @abstractmethod
+    def iter_content(self, path: Path) -> Iterator[str]:
+        """Yield the text of one file in pieces."""
+
+    def load_content(self) -> Dict[Path, str]:
+        """Read the full text of every file."""
+        return {
+            path: "".join(self.iter_content(path)) for path in self.safe_file_paths
+        }
+
+    def _add_files(self) -> None:
+        """Stream every file through the chunker into the storage, one document per file."""
+        self.chunks = []
+        for path in self.safe_file_paths:
+            self._add_document_stream(
+                str(path), partial(self.iter_content, path), file_paths=[path]
+            )
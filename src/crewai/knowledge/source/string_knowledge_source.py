@@ -1,3 +1,4 @@
+import hashlib
 from typing import List, Optional
 
 from pydantic import Field
@@ -22,9 +23,9 @@ class StringKnowledgeSource(BaseKnowledgeSource):
 
     def add(self) -> None:
         """Add string content to the knowledge source, chunk it, compute embeddings, and save them."""
-        new_chunks = self._chunk_text(self.content)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+        self.chunks = []
+        content_hash = hashlib.sha256(self.content.encode("utf-8")).hexdigest()
+        self._add_document(f"string:{content_hash}", self.content)
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
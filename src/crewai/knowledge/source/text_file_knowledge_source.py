@@ -1,30 +1,27 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import Iterator, List
 
-from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.source.streaming_file_knowledge_source import (
+    StreamingFileKnowledgeSource,
+)
 
 
-class TextFileKnowledgeSource(BaseFileKnowledgeSource):
+class TextFileKnowledgeSource(StreamingFileKnowledgeSource):
     """A knowledge source that stores and queries text file content using embeddings."""
 
-    def load_content(self) -> Dict[Path, str]:
-        """Load and preprocess text file content."""
-        content = {}
-        for path in self.safe_file_paths:
-            path = self.convert_to_path(path)
-            with open(path, "r", encoding="utf-8") as f:
-                content[path] = f.read()
-        return content
+    read_size: int = 1 << 20
+
+    def iter_content(self, path: Path) -> Iterator[str]:
+        """Read a text file in blocks of ``read_size`` characters."""
+        with open(self.convert_to_path(path), "r", encoding="utf-8") as f:
+            yield from iter(lambda: f.read(self.read_size), "")
 
     def add(self) -> None:
         """
         Add text file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
+        self._add_files()
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
+
+"""Manifest of the documents stored in a knowledge collection."""
+
+
+class KnowledgeManifest:
+    """Records what has been ingested into a knowledge collection.
+
+    Each entry is keyed by the document it came from (usually its file path)
+    and stores the files' mtime and size, a hash of the content, and the ids
+    of the chunks written for it. The manifest also records the embedder that
+    produced those chunks, so a different embedder starts from scratch.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, Path], embedder_fingerprint: str):
+        self.path = Path(path)
+        self.embedder_fingerprint = embedder_fingerprint
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.stale = False
+        self._seen: Set[str] = set()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.stale = True
+            return
+        if (
+            data.get("version") != self.VERSION
+            or data.get("embedder") != self.embedder_fingerprint
+        ):
+            # Chunks embedded by another embedder cannot be reused.
+            self.stale = True
+            return
+        self.entries = data.get("documents", {})
+
+    def save(self) -> None:
+        """Write the manifest atomically next to the collection."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "embedder": self.embedder_fingerprint,
+                    "documents": self.entries,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+    def is_current(
+        self,
+        key: str,
+        content_hash: Optional[str] = None,
+        file_paths: Sequence[Path] = (),
+    ) -> bool:
+        """Whether ``key`` is stored with the same files or content.
+
+        Matching mtime and size of every file is enough; otherwise the
+        content hash decides. A matching document is marked as seen.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        if file_paths and entry.get("files") == self.file_stats(file_paths):
+            self._seen.add(key)
+            return True
+        if content_hash is not None and entry.get("content_hash") == content_hash:
+            entry["files"] = self.file_stats(file_paths)
+            self._seen.add(key)
+            return True
+        return False
+
+    def chunk_ids(self, key: str) -> List[str]:
+        return list(self.entries.get(key, {}).get("chunk_ids", []))
+
+    def update(
+        self,
+        key: str,
+        content_hash: str,
+        chunk_ids: List[str],
+        file_paths: Sequence[Path] = (),
+    ) -> None:
+        self.entries[key] = {
+            "files": self.file_stats(file_paths),
+            "content_hash": content_hash,
+            "chunk_ids": chunk_ids,
+        }
+        self._seen.add(key)
+
+    def remove(self, key: str) -> List[str]:
+        """Forget ``key`` and return the chunk ids that belonged to it."""
+        entry = self.entries.pop(key, None)
+        self._seen.discard(key)
+        return list(entry.get("chunk_ids", [])) if entry else []
+
+    def begin_sync(self) -> None:
+        self._seen = set()
+
+    def unseen_keys(self) -> List[str]:
+        """Keys not ingested or confirmed since :meth:`begin_sync`."""
+        return [key for key in self.entries if key not in self._seen]
+
+    @staticmethod
+    def file_stats(file_paths: Sequence[Path]) -> Dict[str, List[float]]:
+        stats = {}
+        for file_path in file_paths:
+            stat = Path(file_path).stat()
+            stats[str(file_path)] = [stat.st_mtime, stat.st_size]
+        return stats
+
+    @staticmethod
+    def hash_files(file_paths: Sequence[Path], block_size: int = 1 << 20) -> str:
+        """Hash the bytes of ``file_paths`` without loading them into memory."""
+        digest = hashlib.sha256()
+        for file_path in file_paths:
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(block_size), b""):
+                    digest.update(block)
+        return digest.hexdigest()
@@ -4,7 +4,8 @@ import io
 import logging
 import os
 import shutil
-from typing import Any, Dict, List, Optional, Union, cast
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union, cast
 
 import chromadb
 import chromadb.errors
@@ -13,8 +14,10 @@ from chromadb.api.types import OneOrMany
 from chromadb.config import Settings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.knowledge_manifest import KnowledgeManifest
 from crewai.utilities import EmbeddingConfigurator
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.embeddings import BatchEmbedder, embedder_fingerprint
 from crewai.utilities.logger import Logger
 from crewai.utilities.paths import db_storage_path
 
@@ -45,6 +48,10 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     collection: Optional[chromadb.Collection] = None
     collection_name: Optional[str] = "knowledge"
     app: Optional[ClientAPI] = None
+    manifest: Optional[KnowledgeManifest] = None
+    embedder_config: Optional[Dict[str, Any]] = None
+    batch_size: Optional[int] = None
+    batch_embedder: BatchEmbedder
 
     def __init__(
         self,
@@ -64,7 +71,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         with suppress_logging():
             if self.collection:
                 fetched = self.collection.query(
-                    query_texts=query,
+                    query_embeddings=self.batch_embedder.embed(query),
                     n_results=limit,
                     where=filter,
                 )
@@ -106,6 +113,148 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         except Exception:
             raise Exception("Failed to create or get collection")
 
+        self._open_manifest(os.path.join(base_path, f"{collection_name}.manifest.json"))
+
+    def _open_manifest(self, path: str) -> None:
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        had_manifest = os.path.exists(path)
+        self.manifest = KnowledgeManifest(
+            path, embedder_fingerprint=embedder_fingerprint(self.embedder_config)
+        )
+        if not had_manifest and self.collection.count() > 0:
+            # Chunks written before manifests existed are keyed by their
+            # content only and would never be pruned.
+            self.manifest.stale = True
+        if self.manifest.stale:
+            # Chunks from another embedder (or an unreadable manifest) cannot
+            # be reused or tracked, so rebuild the collection from scratch.
+            self._clear_collection()
+        elif self.manifest.entries and self.collection.count() == 0:
+            # The collection was reset behind the manifest's back.
+            self.manifest.entries = {}
+
+    def _clear_collection(self) -> None:
+        if not self.app or not self.collection:
+            raise Exception("Collection not initialized")
+        collection_name = self.collection.name
+        self.app.delete_collection(collection_name)
+        self.collection = self.app.get_or_create_collection(
+            name=collection_name, embedding_function=self.embedder
+        )
+
+    def begin_sync(self) -> None:
+        """Start tracking which documents are still part of the knowledge."""
+        if self.manifest:
+            self.manifest.begin_sync()
+
+    def finish_sync(self, prune: bool = True) -> None:
+        """Persist the manifest, first removing documents not seen since :meth:`begin_sync`."""
+        if not self.manifest:
+            return
+        if prune and self.collection:
+            removed_ids = []
+            for key in self.manifest.unseen_keys():
+                removed_ids.extend(self.manifest.remove(key))
+            if removed_ids:
+                self.collection.delete(ids=removed_ids)
+        self.manifest.save()
+
+    def is_document_current(
+        self,
+        key: str,
+        file_paths: Sequence[Path] = (),
+        content_hash: Optional[Callable[[], str]] = None,
+    ) -> bool:
+        """Whether the manifest holds ``key`` with the same files or content.
+
+        ``content_hash`` is only called when the files' mtime and size differ
+        from the manifest.
+        """
+        if self.manifest is None:
+            return False
+        if file_paths and self.manifest.is_current(key, file_paths=file_paths):
+            return True
+        return content_hash is not None and self.manifest.is_current(
+            key, content_hash(), file_paths
+        )
+
+    def write_document(
+        self,
+        key: str,
+        chunks: Iterable[str],
+        content_hash: str,
+        file_paths: Sequence[Path] = (),
+    ) -> int:
+        """Replace the stored chunks of one document and return how many it has.
+
+        ``chunks`` is consumed lazily and upserted in batches of
+        ``batch_size``. Only chunks that are new to the document are embedded,
+        and chunks the document no longer produces are deleted afterwards.
+        """
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        batch_size = self._write_batch_size()
+        previous_ids = set(self.manifest.chunk_ids(key)) if self.manifest else set()
+        chunk_ids: Dict[str, None] = {}
+        batch: Dict[str, str] = {}
+        for chunk in chunks:
+            chunk_id = hashlib.sha256(f"{key}\0{chunk}".encode("utf-8")).hexdigest()
+            if chunk_id in chunk_ids:
+                continue
+            chunk_ids[chunk_id] = None
+            if chunk_id not in previous_ids:
+                batch[chunk_id] = chunk
+                if len(batch) >= batch_size:
+                    self._upsert_chunks(key, batch)
+                    batch = {}
+        if batch:
+            self._upsert_chunks(key, batch)
+
+        obsolete_ids = list(previous_ids - chunk_ids.keys())
+        if obsolete_ids:
+            self.collection.delete(ids=obsolete_ids)
+        if self.manifest:
+            self.manifest.update(key, content_hash, list(chunk_ids), file_paths)
+        return len(chunk_ids)
+
+    def sync_document(
+        self,
+        key: str,
+        content: str,
+        chunker: Callable[[str], List[str]],
+        file_paths: Sequence[Path] = (),
+    ) -> List[str]:
+        """Store the chunks of one document unless the manifest shows it unchanged.
+
+        Returns the chunks of the document when it was (re)written and an
+        empty list when it was skipped.
+        """
+        def content_hash() -> str:
+            return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        if self.is_document_current(key, file_paths, content_hash):
+            return []
+        chunks = chunker(content)
+        self.write_document(key, chunks, content_hash(), file_paths)
+        return chunks
+
+    def _write_batch_size(self) -> int:
+        """Chunks per upsert: enough to keep every concurrent embedding batch busy."""
+        if self.batch_size:
+            return self.batch_size
+        batch_size = self.batch_embedder.batch_size * self.batch_embedder.max_concurrency
+        if self.app:
+            batch_size = min(batch_size, self.app.get_max_batch_size())
+        return batch_size
+
+    def _upsert_chunks(self, key: str, chunks: Dict[str, str]) -> None:
+        self._upsert(
+            ids=list(chunks),
+            documents=list(chunks.values()),
+            metadatas=[{"source": key} for _ in chunks],
+        )
+
     def reset(self):
         base_path = os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
         if not self.app:
@@ -127,41 +276,56 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         if not self.collection:
             raise Exception("Collection not initialized")
 
-        try:
-            # Create a dictionary to store unique documents
-            unique_docs = {}
-
-            # Generate IDs and create a mapping of id -> (document, metadata)
-            for idx, doc in enumerate(documents):
-                doc_id = hashlib.sha256(doc.encode("utf-8")).hexdigest()
-                doc_metadata = None
-                if metadata is not None:
-                    if isinstance(metadata, list):
-                        doc_metadata = metadata[idx]
-                    else:
-                        doc_metadata = metadata
-                unique_docs[doc_id] = (doc, doc_metadata)
-
-            # Prepare filtered lists for ChromaDB
-            filtered_docs = []
-            filtered_metadata = []
-            filtered_ids = []
-
-            # Build the filtered lists
-            for doc_id, (doc, meta) in unique_docs.items():
-                filtered_docs.append(doc)
-                filtered_metadata.append(meta)
-                filtered_ids.append(doc_id)
-
-            # If we have no metadata at all, set it to None
-            final_metadata: Optional[OneOrMany[chromadb.Metadata]] = (
-                None if all(m is None for m in filtered_metadata) else filtered_metadata
-            )
+        # Create a dictionary to store unique documents
+        unique_docs = {}
+
+        # Generate IDs and create a mapping of id -> (document, metadata)
+        for idx, doc in enumerate(documents):
+            doc_id = hashlib.sha256(doc.encode("utf-8")).hexdigest()
+            doc_metadata = None
+            if metadata is not None:
+                if isinstance(metadata, list):
+                    doc_metadata = metadata[idx]
+                else:
+                    doc_metadata = metadata
+            unique_docs[doc_id] = (doc, doc_metadata)
 
+        # Prepare filtered lists for ChromaDB
+        filtered_docs = []
+        filtered_metadata = []
+        filtered_ids = []
+
+        # Build the filtered lists
+        for doc_id, (doc, meta) in unique_docs.items():
+            filtered_docs.append(doc)
+            filtered_metadata.append(meta)
+            filtered_ids.append(doc_id)
+
+        # If we have no metadata at all, set it to None
+        final_metadata: Optional[OneOrMany[chromadb.Metadata]] = (
+            None if all(m is None for m in filtered_metadata) else filtered_metadata
+        )
+
+        self._upsert(
+            documents=filtered_docs,
+            metadatas=final_metadata,
+            ids=filtered_ids,
+        )
+
+    def _upsert(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: Optional[OneOrMany[chromadb.Metadata]],
+    ) -> None:
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        try:
             self.collection.upsert(
-                documents=filtered_docs,
-                metadatas=final_metadata,
-                ids=filtered_ids,
+                documents=documents,
+                embeddings=self.batch_embedder.embed(documents),
+                metadatas=metadatas,
+                ids=ids,
             )
         except chromadb.errors.InvalidDimensionException as e:
             Logger(verbose=True).log(
@@ -194,8 +358,10 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             embedder_config (Optional[Dict[str, Any]]): Configuration dictionary for the embedder.
                 If None or empty, defaults to the default embedding function.
         """
+        self.embedder_config = embedder
         self.embedder = (
             EmbeddingConfigurator().configure_embedder(embedder)
             if embedder
             else self._create_default_embedding_function()
         )
+        self.batch_embedder = BatchEmbedder.from_config(self.embedder, embedder)
@@ -0,0 +1,82 @@
+import os
+import shutil
+from typing import Any, Dict, List, Optional
+
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.numpy_vector_store import DEFAULT_HNSW_THRESHOLD, NumpyCollection
+from crewai.utilities.paths import db_storage_path
+
+NUMPY_KNOWLEDGE_DIRECTORY = "numpy"
+
+
+class NumpyKnowledgeStorage(KnowledgeStorage):
+    """KnowledgeStorage kept in an in-process :class:`NumpyCollection`.
+
+    Collections and their manifests live under ``knowledge/numpy`` in the
+    storage directory, apart from the Chroma ones. Search scores are cosine
+    similarities, so ``score_threshold`` is the minimum similarity.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Dict[str, Any]] = None,
+        collection_name: Optional[str] = None,
+        hnsw_threshold: Optional[int] = DEFAULT_HNSW_THRESHOLD,
+    ):
+        self.hnsw_threshold = hnsw_threshold
+        super().__init__(embedder=embedder, collection_name=collection_name)
+
+    def initialize_knowledge_storage(self):
+        base_path = self._base_path()
+        collection_name = (
+            f"knowledge_{self.collection_name}" if self.collection_name else "knowledge"
+        )
+        self.collection = NumpyCollection(  # type: ignore[assignment]
+            os.path.join(base_path, collection_name),
+            hnsw_threshold=self.hnsw_threshold,
+        )
+        self._open_manifest(os.path.join(base_path, f"{collection_name}.manifest.json"))
+
+    def search(
+        self,
+        query: List[str],
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+    ) -> List[Dict[str, Any]]:
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        fetched = self.collection.query(
+            query_embeddings=self.batch_embedder.embed(query),
+            n_results=limit,
+            where=filter,
+        )
+        results = []
+        for i in range(len(fetched["ids"][0])):  # type: ignore
+            score: float = 1.0 - fetched["distances"][0][i]  # type: ignore
+            if score >= score_threshold:
+                results.append(
+                    {
+                        "id": fetched["ids"][0][i],  # type: ignore
+                        "metadata": fetched["metadatas"][0][i],  # type: ignore
+                        "context": fetched["documents"][0][i],  # type: ignore
+                        "score": score,
+                    }
+                )
+        return results
+
+    def reset(self):
+        base_path = self._base_path()
+        if os.path.exists(base_path):
+            shutil.rmtree(base_path)
+        self.collection = None
+
+    def _clear_collection(self) -> None:
+        self.collection.reset()  # type: ignore[union-attr]
+
+    @staticmethod
+    def _base_path() -> str:
+        return os.path.join(
+            db_storage_path(), KNOWLEDGE_DIRECTORY, NUMPY_KNOWLEDGE_DIRECTORY
+        )
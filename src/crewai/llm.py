@@ -1,28 +1,49 @@
+import asyncio
+import inspect
 import json
 import logging
 import os
 import sys
 import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Dict, List, Literal, Optional, Type, Union, cast
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
+from crewai.types.tool_call_result import ToolCallResult
 from crewai.utilities.events.llm_events import (
     LLMCallCompletedEvent,
     LLMCallFailedEvent,
     LLMCallStartedEvent,
     LLMCallType,
+    LLMStreamChunkEvent,
+)
+from crewai.utilities.events.tool_usage_events import (
+    ToolExecutionErrorEvent,
+    ToolUsageErrorEvent,
+    ToolUsageFinishedEvent,
+    ToolUsageStartedEvent,
 )
-from crewai.utilities.events.tool_usage_events import ToolExecutionErrorEvent
 
 with warnings.catch_warnings():
     warnings.simplefilter("ignore", UserWarning)
     import litellm
-    from litellm import Choices
-    from litellm.types.utils import ModelResponse
+    from litellm.types.utils import ChatCompletionMessageToolCall, ModelResponse, Usage
     from litellm.utils import get_supported_openai_params, supports_response_schema
 
 
@@ -30,6 +51,8 @@ from crewai.utilities.events import crewai_event_bus
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
+from crewai.utilities.llm_response_cache import LLMResponseCache, serialize_response
+from crewai.utilities.rate_limiter import RateLimiter, get_rate_limiter
 
 load_dotenv()
 
@@ -126,6 +149,45 @@ def suppress_warnings():
             sys.stderr = old_stderr
 
 
+class _StreamStopTracker:
+    """Detects stop words in streamed text without rescanning the whole output."""
+
+    def __init__(self, stop_words: List[str]):
+        self.stop_words = [word for word in stop_words if word]
+        self._window = max((len(word) for word in self.stop_words), default=0)
+        self._tail = ""
+        self.stopped = False
+
+    def feed(self, chunk: str) -> bool:
+        if not self.stop_words:
+            return False
+        haystack = self._tail + chunk
+        if any(word in haystack for word in self.stop_words):
+            self.stopped = True
+        self._tail = haystack[-self._window :]
+        return self.stopped
+
+    def truncate(self, text: str) -> str:
+        positions = [text.find(word) for word in self.stop_words if word in text]
+        return text[: min(positions)].rstrip() if positions else text
+
+
+def _close_stream(stream: Any) -> None:
+    """Close the underlying HTTP stream of a litellm stream wrapper."""
+    close = getattr(getattr(stream, "completion_stream", None), "close", None)
+    if callable(close):
+        close()
+
+
+async def _aclose_stream(stream: Any) -> None:
+    """Close the underlying HTTP stream of an async litellm stream wrapper."""
+    close = getattr(getattr(stream, "completion_stream", None), "close", None)
+    if callable(close):
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+
+
 class LLM:
     def __init__(
         self,
@@ -150,6 +212,11 @@ class LLM:
         api_key: Optional[str] = None,
         callbacks: List[Any] = [],
         reasoning_effort: Optional[Literal["none", "low", "medium", "high"]] = None,
+        cache: Optional[Union[bool, LLMResponseCache]] = None,
+        stream: bool = False,
+        max_parallel_tool_calls: int = 8,
+        max_rpm: Optional[int] = None,
+        max_tpm: Optional[int] = None,
         **kwargs,
     ):
         self.model = model
@@ -173,6 +240,20 @@ class LLM:
         self.callbacks = callbacks
         self.context_window_size = 0
         self.reasoning_effort = reasoning_effort
+        # Opt-in response cache; ``True`` uses a default in-memory + SQLite cache.
+        self.cache: Optional[LLMResponseCache] = (
+            LLMResponseCache() if cache is True else cache or None
+        )
+        self.stream = stream
+        self.max_parallel_tool_calls = max_parallel_tool_calls
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        # Limits are shared by every LLM in the process using the same model.
+        self._rate_limiter: Optional[RateLimiter] = (
+            get_rate_limiter(self._rate_limit_key(), max_rpm=max_rpm, max_tpm=max_tpm)
+            if max_rpm or max_tpm
+            else None
+        )
         self.additional_params = kwargs
         self.is_anthropic = self._is_anthropic_model(model)
 
@@ -207,6 +288,9 @@ class LLM:
         tools: Optional[List[dict]] = None,
         callbacks: Optional[List[Any]] = None,
         available_functions: Optional[Dict[str, Any]] = None,
+        stop_condition: Optional[Callable[[str], bool]] = None,
+        execute_tools: bool = True,
+        from_agent: Optional[Any] = None,
     ) -> Union[str, Any]:
         """High-level LLM call method.
 
@@ -221,10 +305,21 @@ class LLM:
                       during and after the LLM call.
             available_functions: Optional dict mapping function names to callables
                                that can be invoked by the LLM.
+            stop_condition: Optional callable used when streaming. It receives
+                           every streamed text chunk and returns True to cancel
+                           the rest of the completion.
+            execute_tools: When False, tool calls requested by the model are
+                          not run; they are returned as a list of
+                          ToolCallResult (without results) for the caller to
+                          execute.
+            from_agent: Optional agent on whose behalf the call is made. Its
+                       key and role are reported in the tool usage events;
+                       without one the events name this LLM instead.
 
         Returns:
-            Union[str, Any]: Either a text response from the LLM (str) or
-                           the result of a tool function call (Any).
+            Union[str, Any]: Either a text response from the LLM (str),
+                           the result of a tool function call (Any), or the
+                           requested tool calls when ``execute_tools`` is False.
 
         Raises:
             TypeError: If messages format is invalid
@@ -246,6 +341,204 @@ class LLM:
             >>> print(response)
             "The capital of France is Paris."
         """
+        messages = self._prepare_call(messages, tools, callbacks, available_functions)
+
+        with suppress_warnings():
+            if callbacks and len(callbacks) > 0:
+                self.set_callbacks(callbacks)
+
+            try:
+                params = self._prepare_completion_params(messages, tools)
+
+                # --- 3) Make the completion call, unless the response is cached
+                cache_key, cached_response = self._lookup_cache(params)
+                if cached_response is None:
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.acquire()
+                    if self.stream:
+                        response = self._stream_completion(params, stop_condition)
+                    else:
+                        response = litellm.completion(**params)
+                    cached_response = self._store_response(cache_key, response)
+                    is_cache_hit = False
+                else:
+                    is_cache_hit = True
+
+                text_response, planned_calls = self._handle_completion_response(
+                    params,
+                    cached_response,
+                    is_cache_hit,
+                    callbacks,
+                    available_functions,
+                    execute_tools,
+                )
+                if planned_calls is None:
+                    return text_response
+                if not execute_tools:
+                    return self._return_tool_calls(planned_calls, is_cache_hit)
+
+                self._execute_tool_calls(planned_calls, from_agent)
+                return self._finish_tool_calls(
+                    planned_calls, text_response, is_cache_hit
+                )
+            except Exception as e:
+                self._handle_call_failure(e)
+                raise
+
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        stop_condition: Optional[Callable[[str], bool]] = None,
+        execute_tools: bool = True,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        """Asynchronous counterpart of :meth:`call` built on ``litellm.acompletion``.
+
+        Accepts the same arguments and returns the same values as ``call``, but
+        awaits the provider request instead of blocking a thread on it, so a
+        single event loop can drive many concurrent agent loops. Coroutine
+        functions in ``available_functions`` are awaited.
+
+        Examples:
+            >>> response = await llm.acall("Return the name of a random city.")
+        """
+        messages = self._prepare_call(messages, tools, callbacks, available_functions)
+
+        # Output redirection swaps the global sys.stdout, so it must never be
+        # held across an await where other coroutines could interleave with it.
+        with suppress_warnings():
+            if callbacks and len(callbacks) > 0:
+                self.set_callbacks(callbacks)
+
+        try:
+            with suppress_warnings():
+                params = self._prepare_completion_params(messages, tools)
+                cache_key, cached_response = self._lookup_cache(params)
+
+            if cached_response is None:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.aacquire()
+                if self.stream:
+                    response = await self._astream_completion(params, stop_condition)
+                else:
+                    response = await litellm.acompletion(**params)
+                with suppress_warnings():
+                    cached_response = self._store_response(cache_key, response)
+                is_cache_hit = False
+            else:
+                is_cache_hit = True
+
+            with suppress_warnings():
+                text_response, planned_calls = self._handle_completion_response(
+                    params,
+                    cached_response,
+                    is_cache_hit,
+                    callbacks,
+                    available_functions,
+                    execute_tools,
+                )
+            if planned_calls is None:
+                return text_response
+            if not execute_tools:
+                return self._return_tool_calls(planned_calls, is_cache_hit)
+
+            await self._aexecute_tool_calls(planned_calls, from_agent)
+            return self._finish_tool_calls(planned_calls, text_response, is_cache_hit)
+        except Exception as e:
+            self._handle_call_failure(e)
+            raise
+
+    def _stream_completion(
+        self,
+        params: Dict[str, Any],
+        stop_condition: Optional[Callable[[str], bool]] = None,
+    ) -> Any:
+        """Stream a completion, emitting chunk events and stopping early if asked.
+
+        The stream is cancelled as soon as the accumulated text contains one of
+        ``self.stop`` (for providers that ignore stop words) or ``stop_condition``
+        returns True. The chunks received so far are assembled into a regular
+        ``ModelResponse``.
+        """
+        stream_params = {
+            **params,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        stream = litellm.completion(**stream_params)
+        chunks: List[Any] = []
+        stop_tracker = _StreamStopTracker(self.stop)
+        for chunk in stream:
+            chunks.append(chunk)
+            if self._handle_stream_chunk(chunk, stop_tracker, stop_condition):
+                _close_stream(stream)
+                break
+        return self._build_streamed_response(chunks, params, stop_tracker)
+
+    async def _astream_completion(
+        self,
+        params: Dict[str, Any],
+        stop_condition: Optional[Callable[[str], bool]] = None,
+    ) -> Any:
+        """Asynchronous version of :meth:`_stream_completion`."""
+        stream_params = {
+            **params,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        stream = await litellm.acompletion(**stream_params)
+        chunks: List[Any] = []
+        stop_tracker = _StreamStopTracker(self.stop)
+        async for chunk in stream:  # type: ignore[union-attr]
+            chunks.append(chunk)
+            if self._handle_stream_chunk(chunk, stop_tracker, stop_condition):
+                await _aclose_stream(stream)
+                break
+        return self._build_streamed_response(chunks, params, stop_tracker)
+
+    def _handle_stream_chunk(
+        self,
+        chunk: Any,
+        stop_tracker: "_StreamStopTracker",
+        stop_condition: Optional[Callable[[str], bool]],
+    ) -> bool:
+        """Emit the chunk event and return True when the stream should stop."""
+        choices = getattr(chunk, "choices", None)
+        content = choices[0].delta.content if choices else None
+        if not content:
+            return False
+
+        crewai_event_bus.emit(self, event=LLMStreamChunkEvent(chunk=content))
+        if stop_tracker.feed(content):
+            return True
+        return bool(stop_condition and stop_condition(content))
+
+    def _build_streamed_response(
+        self,
+        chunks: List[Any],
+        params: Dict[str, Any],
+        stop_tracker: "_StreamStopTracker",
+    ) -> Any:
+        """Assemble streamed chunks into a single response, trimmed at stop words."""
+        response = litellm.stream_chunk_builder(chunks, messages=params["messages"])
+        if response is None:
+            raise ValueError("Invalid response from LLM call - empty stream.")
+        message = cast(ModelResponse, response).choices[0].message  # type: ignore[union-attr]
+        if message.content and stop_tracker.stopped:
+            message.content = stop_tracker.truncate(message.content)
+        return response
+
+    def _prepare_call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]],
+        callbacks: Optional[List[Any]],
+        available_functions: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, str]]:
+        """Emit the start event, validate the call and normalize the messages."""
         crewai_event_bus.emit(
             self,
             event=LLMCallStartedEvent(
@@ -268,136 +561,348 @@ class LLM:
                 if message.get("role") == "system":
                     message["role"] = "assistant"
 
-        with suppress_warnings():
-            if callbacks and len(callbacks) > 0:
-                self.set_callbacks(callbacks)
+        return messages
 
+    def _prepare_completion_params(
+        self, messages: List[Dict[str, str]], tools: Optional[List[dict]] = None
+    ) -> Dict[str, Any]:
+        """Build the litellm completion parameters for the given messages."""
+        # --- 1) Format messages according to provider requirements
+        formatted_messages = self._format_messages_for_provider(messages)
+
+        # --- 2) Prepare the parameters for the completion call
+        params = {
+            "model": self.model,
+            "messages": formatted_messages,
+            "timeout": self.timeout,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "n": self.n,
+            "stop": self.stop,
+            "max_tokens": self.max_tokens or self.max_completion_tokens,
+            "presence_penalty": self.presence_penalty,
+            "frequency_penalty": self.frequency_penalty,
+            "logit_bias": self.logit_bias,
+            "response_format": self.response_format,
+            "seed": self.seed,
+            "logprobs": self.logprobs,
+            "top_logprobs": self.top_logprobs,
+            "api_base": self.api_base,
+            "base_url": self.base_url,
+            "api_version": self.api_version,
+            "api_key": self.api_key,
+            "stream": False,
+            "tools": tools,
+            "reasoning_effort": self.reasoning_effort,
+            **self.additional_params,
+        }
+
+        # Remove None values from params
+        return {k: v for k, v in params.items() if v is not None}
+
+    def _lookup_cache(
+        self, params: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return the cache key and the cached response for ``params``, if any."""
+        if self.cache is None:
+            return None, None
+        cache_key = self.cache.make_key(params)
+        if cache_key is None:
+            return None, None
+        return cache_key, self.cache.get(cache_key)
+
+    def _store_response(self, cache_key: Optional[str], response: Any) -> Dict[str, Any]:
+        """Serialize a provider response and store it in the cache if enabled."""
+        serialized = serialize_response(cast(ModelResponse, response))
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, serialized)
+        return serialized
+
+    def _handle_completion_response(
+        self,
+        params: Dict[str, Any],
+        response: Dict[str, Any],
+        is_cache_hit: bool,
+        callbacks: Optional[List[Any]],
+        available_functions: Optional[Dict[str, Any]],
+        execute_tools: bool = True,
+    ) -> Tuple[str, Optional[List[Tuple[ToolCallResult, Optional[Callable]]]]]:
+        """Run usage callbacks and resolve the tool calls requested by the model.
+
+        Returns the text response and, when tools have to run, the planned
+        calls paired with the function to execute (None for calls that could
+        not be resolved, whose ``error`` is already set).
+        """
+        text_response = response["content"]
+        tool_calls = [
+            ChatCompletionMessageToolCall(**tool_call)
+            for tool_call in response["tool_calls"]
+        ]
+        usage_info = Usage(**response["usage"]) if response["usage"] else None
+        if usage_info and not is_cache_hit and self._rate_limiter is not None:
+            self._rate_limiter.record_tokens(usage_info.total_tokens)
+
+        # --- 4) Handle callbacks with usage info
+        if callbacks and len(callbacks) > 0:
+            for callback in callbacks:
+                if hasattr(callback, "log_success_event"):
+                    if usage_info:
+                        callback.log_success_event(
+                            kwargs=params,
+                            response_obj={
+                                "usage": usage_info,
+                                "cache_hit": is_cache_hit,
+                            },
+                            start_time=0,
+                            end_time=0,
+                        )
+
+        # --- 5) If no tool calls, return the text response
+        if not tool_calls or (execute_tools and not available_functions):
+            self._handle_emit_call_events(
+                text_response, LLMCallType.LLM_CALL, cached=is_cache_hit
+            )
+            return text_response, None
+
+        # --- 6) Resolve every tool call the model requested, keeping their order
+        functions: Dict[str, Any] = available_functions or {}
+        planned_calls: List[Tuple[ToolCallResult, Optional[Callable]]] = []
+        for tool_call in tool_calls:
+            function_name = tool_call.function.name or ""
+            call = ToolCallResult(
+                tool_call_id=tool_call.id or "", function_name=function_name
+            )
+            if execute_tools and function_name not in functions:
+                logging.warning(
+                    f"Tool call requested unknown function '{function_name}'"
+                )
+                call.error = f"Unknown function '{function_name}'"
+                planned_calls.append((call, None))
+                continue
             try:
-                # --- 1) Format messages according to provider requirements
-                formatted_messages = self._format_messages_for_provider(messages)
-
-                # --- 2) Prepare the parameters for the completion call
-                params = {
-                    "model": self.model,
-                    "messages": formatted_messages,
-                    "timeout": self.timeout,
-                    "temperature": self.temperature,
-                    "top_p": self.top_p,
-                    "n": self.n,
-                    "stop": self.stop,
-                    "max_tokens": self.max_tokens or self.max_completion_tokens,
-                    "presence_penalty": self.presence_penalty,
-                    "frequency_penalty": self.frequency_penalty,
-                    "logit_bias": self.logit_bias,
-                    "response_format": self.response_format,
-                    "seed": self.seed,
-                    "logprobs": self.logprobs,
-                    "top_logprobs": self.top_logprobs,
-                    "api_base": self.api_base,
-                    "base_url": self.base_url,
-                    "api_version": self.api_version,
-                    "api_key": self.api_key,
-                    "stream": False,
-                    "tools": tools,
-                    "reasoning_effort": self.reasoning_effort,
-                    **self.additional_params,
-                }
-
-                # Remove None values from params
-                params = {k: v for k, v in params.items() if v is not None}
-
-                # --- 2) Make the completion call
-                response = litellm.completion(**params)
-                response_message = cast(Choices, cast(ModelResponse, response).choices)[
-                    0
-                ].message
-                text_response = response_message.content or ""
-                tool_calls = getattr(response_message, "tool_calls", [])
-
-                # --- 3) Handle callbacks with usage info
-                if callbacks and len(callbacks) > 0:
-                    for callback in callbacks:
-                        if hasattr(callback, "log_success_event"):
-                            usage_info = getattr(response, "usage", None)
-                            if usage_info:
-                                callback.log_success_event(
-                                    kwargs=params,
-                                    response_obj={"usage": usage_info},
-                                    start_time=0,
-                                    end_time=0,
-                                )
-
-                # --- 4) If no tool calls, return the text response
-                if not tool_calls or not available_functions:
-                    self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
-                    return text_response
+                call.arguments = json.loads(tool_call.function.arguments or "{}")
+            except json.JSONDecodeError as e:
+                logging.warning(f"Failed to parse function arguments: {e}")
+                call.error = f"Failed to parse function arguments: {e}"
+                planned_calls.append((call, None))
+                continue
+            planned_calls.append(
+                (call, functions[function_name] if execute_tools else None)
+            )
 
-                # --- 5) Handle the tool call
-                tool_call = tool_calls[0]
-                function_name = tool_call.function.name
-
-                if function_name in available_functions:
-                    try:
-                        function_args = json.loads(tool_call.function.arguments)
-                    except json.JSONDecodeError as e:
-                        logging.warning(f"Failed to parse function arguments: {e}")
-                        return text_response
-
-                    fn = available_functions[function_name]
-                    try:
-                        # Call the actual tool function
-                        result = fn(**function_args)
-                        self._handle_emit_call_events(result, LLMCallType.TOOL_CALL)
-                        return result
-
-                    except Exception as e:
-                        logging.error(
-                            f"Error executing function '{function_name}': {e}"
-                        )
-                        crewai_event_bus.emit(
-                            self,
-                            event=ToolExecutionErrorEvent(
-                                tool_name=function_name,
-                                tool_args=function_args,
-                                tool_class=fn,
-                                error=str(e),
-                            ),
-                        )
-                        crewai_event_bus.emit(
-                            self,
-                            event=LLMCallFailedEvent(
-                                error=f"Tool execution error: {str(e)}"
-                            ),
-                        )
-                        return text_response
+        return text_response, planned_calls
 
-                else:
-                    logging.warning(
-                        f"Tool call requested unknown function '{function_name}'"
-                    )
-                    return text_response
+    def _execute_tool_calls(
+        self,
+        planned_calls: List[Tuple[ToolCallResult, Optional[Callable]]],
+        from_agent: Optional[Any] = None,
+    ) -> None:
+        """Run the planned tool calls, concurrently when there is more than one."""
+        runnable = [(call, fn) for call, fn in planned_calls if fn is not None]
+        if len(runnable) == 1 and not inspect.iscoroutinefunction(runnable[0][1]):
+            self._execute_tool_call(*runnable[0], from_agent)
+            return
+        if not runnable:
+            return
+
+        max_workers = max(1, min(self.max_parallel_tool_calls, len(runnable)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._execute_tool_call, call, fn, from_agent)
+                for call, fn in runnable
+            ]
+            for future in futures:
+                future.result()
+
+    async def _aexecute_tool_calls(
+        self,
+        planned_calls: List[Tuple[ToolCallResult, Optional[Callable]]],
+        from_agent: Optional[Any] = None,
+    ) -> None:
+        """Await coroutine tools and offload synchronous ones, bounded in parallel."""
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel_tool_calls))
+
+        async def run(call: ToolCallResult, fn: Callable) -> None:
+            async with semaphore:
+                started_at = self._start_tool_call(call, fn, from_agent)
+                try:
+                    if inspect.iscoroutinefunction(fn):
+                        result = await fn(**call.arguments)
+                    else:
+                        result = await asyncio.to_thread(fn, **call.arguments)
+                except Exception as e:
+                    self._fail_tool_call(call, fn, e, started_at, from_agent)
+                    return
+                self._complete_tool_call(call, fn, result, started_at, from_agent)
+
+        await asyncio.gather(
+            *(run(call, fn) for call, fn in planned_calls if fn is not None)
+        )
 
-            except Exception as e:
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=str(e)),
-                )
-                if not LLMContextLengthExceededException(
-                    str(e)
-                )._is_context_limit_error(str(e)):
-                    logging.error(f"LiteLLM call failed: {str(e)}")
-                raise
+    def _execute_tool_call(
+        self, call: ToolCallResult, fn: Callable, from_agent: Optional[Any] = None
+    ) -> None:
+        """Execute a single tool call and record its result or error."""
+        started_at = self._start_tool_call(call, fn, from_agent)
+        try:
+            result = fn(**call.arguments)
+            if inspect.isawaitable(result):
+                result = asyncio.run(result)  # type: ignore[arg-type]
+        except Exception as e:
+            self._fail_tool_call(call, fn, e, started_at, from_agent)
+            return
+        self._complete_tool_call(call, fn, result, started_at, from_agent)
+
+    def _tool_event_fields(
+        self, call: ToolCallResult, fn: Callable, from_agent: Optional[Any]
+    ) -> Dict[str, Any]:
+        """Fields shared by the tool usage events of ``call``."""
+        if from_agent is not None:
+            agent_key, agent_role = from_agent.key, from_agent.role
+        else:
+            agent_key, agent_role = self._rate_limit_key(), self.model
+        return {
+            "agent_key": agent_key,
+            "agent_role": agent_role,
+            "tool_name": call.function_name,
+            "tool_args": call.arguments,
+            "tool_class": getattr(fn, "__name__", str(fn)),
+        }
+
+    def _start_tool_call(
+        self, call: ToolCallResult, fn: Callable, from_agent: Optional[Any] = None
+    ) -> datetime:
+        crewai_event_bus.emit(
+            self,
+            event=ToolUsageStartedEvent(
+                **self._tool_event_fields(call, fn, from_agent)
+            ),
+        )
+        return datetime.now()
 
-    def _handle_emit_call_events(self, response: Any, call_type: LLMCallType):
+    def _complete_tool_call(
+        self,
+        call: ToolCallResult,
+        fn: Callable,
+        result: Any,
+        started_at: datetime,
+        from_agent: Optional[Any] = None,
+    ) -> None:
+        call.result = result
+        crewai_event_bus.emit(
+            self,
+            event=ToolUsageFinishedEvent(
+                **self._tool_event_fields(call, fn, from_agent),
+                started_at=started_at,
+                finished_at=datetime.now(),
+            ),
+        )
+
+    def _fail_tool_call(
+        self,
+        call: ToolCallResult,
+        fn: Callable,
+        error: Exception,
+        started_at: datetime,
+        from_agent: Optional[Any] = None,
+    ) -> None:
+        call.error = str(error)
+        crewai_event_bus.emit(
+            self,
+            event=ToolUsageErrorEvent(
+                **self._tool_event_fields(call, fn, from_agent),
+                error=str(error),
+            ),
+        )
+        self._handle_tool_execution_error(call.function_name, call.arguments, fn, error)
+
+    def _return_tool_calls(
+        self,
+        planned_calls: List[Tuple[ToolCallResult, Optional[Callable]]],
+        is_cache_hit: bool,
+    ) -> List[ToolCallResult]:
+        """Hand the requested tool calls back to the caller without running them."""
+        results = [call for call, _ in planned_calls]
+        self._handle_emit_call_events(results, LLMCallType.LLM_CALL, cached=is_cache_hit)
+        return results
+
+    def _finish_tool_calls(
+        self,
+        planned_calls: List[Tuple[ToolCallResult, Optional[Callable]]],
+        text_response: str,
+        is_cache_hit: bool,
+    ) -> Any:
+        """Return the tool output(s) and emit the completion event.
+
+        A single tool call keeps the historical behaviour of returning the raw
+        function result, or the text response of the model (usually empty) if
+        the call could not be resolved or raised. Several tool calls return the
+        list of :class:`ToolCallResult` in the order requested.
+        """
+        results = [call for call, _ in planned_calls]
+        if len(results) == 1:
+            call = results[0]
+            if call.error is not None:
+                return text_response
+            self._handle_emit_call_events(
+                call.result, LLMCallType.TOOL_CALL, cached=is_cache_hit
+            )
+            return call.result
+
+        self._handle_emit_call_events(
+            results, LLMCallType.TOOL_CALL, cached=is_cache_hit
+        )
+        return results
+
+    def _handle_tool_execution_error(
+        self,
+        function_name: str,
+        function_args: Dict[str, Any],
+        fn: Any,
+        error: Exception,
+    ) -> None:
+        """Log a failed tool function and emit the corresponding events."""
+        logging.error(f"Error executing function '{function_name}': {error}")
+        crewai_event_bus.emit(
+            self,
+            event=ToolExecutionErrorEvent(
+                tool_name=function_name,
+                tool_args=function_args,
+                tool_class=fn,
+                error=str(error),
+            ),
+        )
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=f"Tool execution error: {str(error)}"),
+        )
+
+    def _handle_call_failure(self, error: Exception) -> None:
+        """Emit the failure event and log errors that are not context-limit related."""
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=str(error)),
+        )
+        if not LLMContextLengthExceededException(
+            str(error)
+        )._is_context_limit_error(str(error)):
+            logging.error(f"LiteLLM call failed: {str(error)}")
+
+    def _handle_emit_call_events(
+        self, response: Any, call_type: LLMCallType, cached: bool = False
+    ):
         """Handle the events for the LLM call.
 
         Args:
             response (str): The response from the LLM call.
             call_type (str): The type of call, either "tool_call" or "llm_call".
+            cached (bool): Whether the response was served from the response cache.
         """
         crewai_event_bus.emit(
             self,
-            event=LLMCallCompletedEvent(response=response, call_type=call_type),
+            event=LLMCallCompletedEvent(
+                response=response, call_type=call_type, cached=cached
+            ),
         )
 
     def _format_messages_for_provider(
@@ -436,6 +941,12 @@ class LLM:
 
         return messages
 
+    def _rate_limit_key(self) -> str:
+        """Key of the shared rate limiter, in ``provider/model`` form."""
+        if "/" in self.model:
+            return self.model
+        return f"{self._get_custom_llm_provider()}/{self.model}"
+
     def _get_custom_llm_provider(self) -> str:
         """
         Derives the custom_llm_provider from the model string.
@@ -1,9 +1,34 @@
-from typing import Any, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from crewai.memory import EntityMemory, LongTermMemory, ShortTermMemory, UserMemory
 
+# Memory searches get their own small pool: tasks already occupy the shared
+# pool and would deadlock it waiting on searches queued behind them.
+_search_pool: Optional[ThreadPoolExecutor] = None
+_search_pool_lock = threading.Lock()
+
+
+def _get_search_pool() -> ThreadPoolExecutor:
+    global _search_pool
+    with _search_pool_lock:
+        if _search_pool is None:
+            _search_pool = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="crewai-memory-search"
+            )
+        return _search_pool
+
 
 class ContextualMemory:
+    """Builds the memory context of a task from every configured memory.
+
+    The memories are searched concurrently. Formatted results are kept in
+    ``cache``, keyed by memory and query, when one is given; crews pass a
+    cache that lives for one task, so delegated work and retries reuse the
+    searches of the task they belong to.
+    """
+
     def __init__(
         self,
         memory_config: Optional[Dict[str, Any]],
@@ -11,6 +36,7 @@ class ContextualMemory:
         ltm: LongTermMemory,
         em: EntityMemory,
         um: UserMemory,
+        cache: Optional[Dict[Tuple[str, str], Optional[str]]] = None,
     ):
         if memory_config is not None:
             self.memory_provider = memory_config.get("provider")
@@ -20,6 +46,7 @@ class ContextualMemory:
         self.ltm = ltm
         self.em = em
         self.um = um
+        self.cache = cache
 
     def build_context_for_task(self, task, context) -> str:
         """
@@ -31,14 +58,28 @@ class ContextualMemory:
         if query == "":
             return ""
 
-        context = []
-        context.append(self._fetch_ltm_context(task.description))
-        context.append(self._fetch_stm_context(query))
-        context.append(self._fetch_entity_context(query))
+        fetches: List[Tuple[Callable[[str], Optional[str]], str]] = [
+            (self._fetch_ltm_context, task.description),
+            (self._fetch_stm_context, query),
+            (self._fetch_entity_context, query),
+        ]
         if self.memory_provider == "mem0":
-            context.append(self._fetch_user_context(query))
+            fetches.append((self._fetch_user_context, query))
+        pool = _get_search_pool()
+        futures = [pool.submit(self._cached_fetch, fetch, q) for fetch, q in fetches]
+        context = [future.result() for future in futures]
         return "\n".join(filter(None, context))
 
+    def _cached_fetch(
+        self, fetch: Callable[[str], Optional[str]], query: str
+    ) -> Optional[str]:
+        if self.cache is None:
+            return fetch(query)
+        key = (fetch.__name__, query)
+        if key not in self.cache:
+            self.cache[key] = fetch(query)
+        return self.cache[key]
+
     def _fetch_stm_context(self, query) -> str:
         """
         Fetches recent relevant insights from STM related to the task's description and expected_output,
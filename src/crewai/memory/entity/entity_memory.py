@@ -4,7 +4,9 @@ from pydantic import PrivateAttr
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.memory import Memory
+from crewai.memory.storage.numpy_rag_storage import NumpyRAGStorage
 from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.utilities.numpy_vector_store import vector_store_backend
 
 
 class EntityMemory(Memory):
@@ -31,10 +33,16 @@ class EntityMemory(Memory):
                 )
             storage = Mem0Storage(type="entities", crew=crew)
         else:
+            storage_class = (
+                NumpyRAGStorage
+                if vector_store_backend(getattr(crew, "memory_config", None))
+                == "numpy"
+                else RAGStorage
+            )
             storage = (
                 storage
                 if storage
-                else RAGStorage(
+                else storage_class(
                     type="entities",
                     allow_reset=True,
                     embedder_config=embedder_config,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
 from crewai.memory.memory import Memory
@@ -14,9 +14,17 @@ class LongTermMemory(Memory):
     LongTermMemoryItem instances.
     """
 
-    def __init__(self, storage=None, path=None):
+    def __init__(
+        self,
+        storage=None,
+        path=None,
+        max_rows_per_task: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
         if not storage:
-            storage = LTMSQLiteStorage(db_path=path) if path else LTMSQLiteStorage()
+            storage = LTMSQLiteStorage(
+                db_path=path, max_rows_per_task=max_rows_per_task, max_age=max_age
+            )
         super().__init__(storage=storage)
 
     def save(self, item: LongTermMemoryItem) -> None:  # type: ignore # BUG?: Signature of "save" incompatible with supertype "Memory"
@@ -29,6 +37,17 @@ class LongTermMemory(Memory):
             datetime=item.datetime,
         )
 
+    def save_many(self, items: Iterable[LongTermMemoryItem]) -> None:
+        """Save several items in one transaction."""
+        rows = []
+        for item in items:
+            metadata = item.metadata
+            metadata.update(
+                {"agent": item.agent, "expected_output": item.expected_output}
+            )
+            rows.append((item.task, metadata, item.datetime, metadata["quality"]))
+        self.storage.save_many(rows)  # type: ignore # BUG?: "Storage" has no attribute "save_many"
+
     def search(self, task: str, latest_n: int = 3) -> List[Dict[str, Any]]:  # type: ignore # signature of "search" incompatible with supertype "Memory"
         return self.storage.load(task, latest_n)  # type: ignore # BUG?: "Storage" has no attribute "load"
 
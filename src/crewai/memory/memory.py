@@ -27,6 +27,12 @@ class Memory(BaseModel):
 
         self.storage.save(value, metadata)
 
+    def flush(self) -> None:
+        """Write any saves the storage is still buffering."""
+        flush = getattr(self.storage, "flush", None)
+        if flush is not None:
+            flush()
+
     def search(
         self,
         query: str,
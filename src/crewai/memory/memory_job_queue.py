@@ -0,0 +1,93 @@
+import atexit
+import logging
+import queue
+import threading
+import weakref
+from typing import Any, Callable, List, Optional, Tuple
+
+"""Background queue for the memory work that follows a task."""
+
+# Queues whose pending jobs must finish before the interpreter exits.
+_queues_to_drain: "weakref.WeakSet[MemoryJobQueue]" = weakref.WeakSet()
+
+
+@atexit.register
+def _drain_queues_on_exit() -> None:
+    for job_queue in list(_queues_to_drain):
+        job_queue.drain()
+
+
+class MemoryJobQueue:
+    """Runs memory jobs, such as long-term memory evaluation, off the agent's path.
+
+    Jobs run on up to ``max_concurrency`` daemon worker threads owned by the
+    queue, which are started on demand and exit once the queue is empty.
+    :meth:`drain` blocks until every submitted job has finished. With
+    ``drain_on_exit`` the queue is also drained when the interpreter exits,
+    so jobs left pending by a crew that did not wait for them are not lost.
+    Failing jobs are logged and dropped.
+    """
+
+    def __init__(self, max_concurrency: int = 2, drain_on_exit: bool = False):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.drain_on_exit = drain_on_exit
+        self._jobs: "queue.Queue[Tuple[Callable, Tuple[Any, ...]]]" = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        if drain_on_exit:
+            _queues_to_drain.add(self)
+
+    def submit(self, fn: Callable, *args: Any) -> None:
+        self._jobs.put((fn, args))
+        self._start_workers()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the submitted jobs; return False if ``timeout`` ran out first."""
+        if timeout is None:
+            self._jobs.join()
+            return True
+        done = threading.Event()
+
+        def wait_for_jobs() -> None:
+            self._jobs.join()
+            done.set()
+
+        threading.Thread(target=wait_for_jobs, daemon=True).start()
+        return done.wait(timeout)
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs submitted but not finished yet."""
+        return self._jobs.unfinished_tasks
+
+    def _start_workers(self) -> None:
+        with self._lock:
+            if len(self._workers) >= self.max_concurrency:
+                return
+            worker = threading.Thread(
+                target=self._work,
+                name=f"crewai-memory-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _work(self) -> None:
+        while True:
+            try:
+                fn, args = self._jobs.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    # A job submitted before the lock was taken is still ours.
+                    if self._jobs.empty():
+                        self._workers.remove(threading.current_thread())
+                        return
+                continue
+            try:
+                fn(*args)
+            except Exception as e:
+                logging.error(f"Memory job {getattr(fn, '__name__', fn)} failed: {e}")
+            finally:
+                self._jobs.task_done()
@@ -4,7 +4,9 @@ from pydantic import PrivateAttr
 
 from crewai.memory.memory import Memory
 from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
+from crewai.memory.storage.numpy_rag_storage import NumpyRAGStorage
 from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.utilities.numpy_vector_store import vector_store_backend
 
 
 class ShortTermMemory(Memory):
@@ -33,10 +35,16 @@ class ShortTermMemory(Memory):
                 )
             storage = Mem0Storage(type="short_term", crew=crew)
         else:
+            storage_class = (
+                NumpyRAGStorage
+                if vector_store_backend(getattr(crew, "memory_config", None))
+                == "numpy"
+                else RAGStorage
+            )
             storage = (
                 storage
                 if storage
-                else RAGStorage(
+                else storage_class(
                     type="short_term",
                     embedder_config=embedder_config,
                     crew=crew,
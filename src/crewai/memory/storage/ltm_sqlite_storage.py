@@ -1,48 +1,97 @@
 import json
+import logging
 import sqlite3
+import threading
+import time
+from datetime import datetime as DateTime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from crewai.utilities import Printer
 from crewai.utilities.paths import db_storage_path
 
+# Saves between two automatic compactions when a retention policy is set.
+COMPACT_EVERY = 1000
+
 
 class LTMSQLiteStorage:
     """
     An updated SQLite storage class for LTM data storage.
+
+    A single connection in WAL mode is shared by all threads and guarded by
+    a lock. Rows carry a numeric ``timestamp`` next to the original
+    ``datetime`` text and are looked up through an index on
+    ``(task_description, timestamp)``. With ``max_rows_per_task`` or
+    ``max_age`` (in seconds) set, older rows are deleted by :meth:`compact`,
+    which runs when the storage opens and every ``COMPACT_EVERY`` saves.
     """
 
     def __init__(
-        self, db_path: Optional[str] = None
+        self,
+        db_path: Optional[str] = None,
+        max_rows_per_task: Optional[int] = None,
+        max_age: Optional[float] = None,
     ) -> None:
         if db_path is None:
             # Get the parent directory of the default db path and create our db file there
             db_path = str(Path(db_storage_path()) / "long_term_memory_storage.db")
         self.db_path = db_path
+        self.max_rows_per_task = max_rows_per_task
+        self.max_age = max_age
         self._printer: Printer = Printer()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._saves_since_compaction = 0
         # Ensure parent directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         self._initialize_db()
+        if self._has_retention_policy():
+            self.compact()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
 
     def _initialize_db(self):
         """
         Initializes the SQLite database and creates LTM table
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS long_term_memories (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         task_description TEXT,
                         metadata TEXT,
                         datetime TEXT,
-                        score REAL
+                        score REAL,
+                        timestamp REAL
                     )
                 """
                 )
-
+                columns = {
+                    row[1]
+                    for row in conn.execute("PRAGMA table_info(long_term_memories)")
+                }
+                if "timestamp" not in columns:
+                    # Databases created before the numeric column was added.
+                    conn.execute(
+                        "ALTER TABLE long_term_memories ADD COLUMN timestamp REAL"
+                    )
+                    conn.execute(
+                        "UPDATE long_term_memories SET timestamp = CAST(datetime AS REAL)"
+                    )
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_long_term_memories_task_timestamp
+                    ON long_term_memories (task_description, timestamp)
+                """
+                )
                 conn.commit()
         except sqlite3.Error as e:
             self._printer.print(
@@ -58,50 +107,76 @@ class LTMSQLiteStorage:
         score: Union[int, float],
     ) -> None:
         """Saves data to the LTM table with error handling."""
+        self.save_many([(task_description, metadata, datetime, score)])
+
+    def save_many(
+        self,
+        rows: Iterable[Tuple[str, Dict[str, Any], str, Union[int, float]]],
+    ) -> None:
+        """Saves ``(task_description, metadata, datetime, score)`` rows in one transaction."""
+        values = [
+            (
+                task_description,
+                json.dumps(metadata),
+                datetime,
+                score,
+                self._timestamp(datetime),
+            )
+            for task_description, metadata, datetime, score in rows
+        ]
+        if not values:
+            return
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._lock:
+                conn = self._connection()
+                conn.executemany(
                     """
-                INSERT INTO long_term_memories (task_description, metadata, datetime, score)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO long_term_memories (task_description, metadata, datetime, score, timestamp)
+                VALUES (?, ?, ?, ?, ?)
             """,
-                    (task_description, json.dumps(metadata), datetime, score),
+                    values,
                 )
                 conn.commit()
+                self._saves_since_compaction += len(values)
+                due = self._saves_since_compaction >= COMPACT_EVERY
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
                 color="red",
             )
+            return
+        if due and self._has_retention_policy():
+            self.compact()
 
     def load(
         self, task_description: str, latest_n: int
     ) -> Optional[List[Dict[str, Any]]]:
         """Queries the LTM table by task description with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    f"""
+            with self._lock:
+                rows = (
+                    self._connection()
+                    .execute(
+                        """
                     SELECT metadata, datetime, score
                     FROM long_term_memories
                     WHERE task_description = ?
-                    ORDER BY datetime DESC, score ASC
-                    LIMIT {latest_n}
-                """,  # nosec
-                    (task_description,),
+                    ORDER BY timestamp DESC, score ASC
+                    LIMIT ?
+                """,
+                        (task_description, latest_n),
+                    )
+                    .fetchall()
                 )
-                rows = cursor.fetchall()
-                if rows:
-                    return [
-                        {
-                            "metadata": json.loads(row[0]),
-                            "datetime": row[1],
-                            "score": row[2],
-                        }
-                        for row in rows
-                    ]
+            if rows:
+                return [
+                    {
+                        "metadata": json.loads(row[0]),
+                        "datetime": row[1],
+                        "score": row[2],
+                    }
+                    for row in rows
+                ]
 
         except sqlite3.Error as e:
             self._printer.print(
@@ -110,14 +185,55 @@ class LTMSQLiteStorage:
             )
         return None
 
+    def compact(self, vacuum: bool = False) -> int:
+        """Deletes the rows outside the retention policy and returns how many.
+
+        ``vacuum`` also rebuilds the database file to give the space back.
+        """
+        deleted = 0
+        try:
+            with self._lock:
+                conn = self._connection()
+                if self.max_age is not None:
+                    deleted += conn.execute(
+                        "DELETE FROM long_term_memories WHERE timestamp < ?",
+                        (time.time() - self.max_age,),
+                    ).rowcount
+                if self.max_rows_per_task is not None:
+                    deleted += conn.execute(
+                        """
+                        DELETE FROM long_term_memories WHERE id IN (
+                            SELECT id FROM (
+                                SELECT id, ROW_NUMBER() OVER (
+                                    PARTITION BY task_description
+                                    ORDER BY timestamp DESC, id DESC
+                                ) AS position
+                                FROM long_term_memories
+                            ) WHERE position > ?
+                        )
+                    """,
+                        (self.max_rows_per_task,),
+                    ).rowcount
+                conn.commit()
+                if vacuum:
+                    conn.execute("VACUUM")
+                conn.execute("PRAGMA optimize")
+                self._saves_since_compaction = 0
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: An error occurred while compacting LTM: {e}",
+                color="red",
+            )
+        return deleted
+
     def reset(
         self,
     ) -> None:
         """Resets the LTM table with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM long_term_memories")
+            with self._lock:
+                conn = self._connection()
+                conn.execute("DELETE FROM long_term_memories")
                 conn.commit()
 
         except sqlite3.Error as e:
@@ -126,3 +242,28 @@ class LTMSQLiteStorage:
                 color="red",
             )
         return None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _has_retention_policy(self) -> bool:
+        return self.max_rows_per_task is not None or self.max_age is not None
+
+    @staticmethod
+    def _timestamp(datetime: str) -> float:
+        """Seconds since the epoch of a ``time.time()`` string or ISO 8601 datetime."""
+        try:
+            return float(datetime)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return DateTime.fromisoformat(datetime).timestamp()
+        except (TypeError, ValueError):
+            logging.warning(
+                f"LTM datetime {datetime!r} is not a timestamp or ISO 8601 datetime; "
+                "ordering and retention use the time it was saved instead"
+            )
+            return time.time()
@@ -0,0 +1,58 @@
+import os
+from typing import Any, Dict, List, Optional
+
+from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.utilities.numpy_vector_store import DEFAULT_HNSW_THRESHOLD, NumpyCollection
+
+
+class NumpyRAGStorage(RAGStorage):
+    """RAGStorage kept in an in-process :class:`NumpyCollection` instead of Chroma.
+
+    Starts without a database client, searches with a single matrix product
+    and never redirects stdout or stderr. Search scores are cosine
+    similarities, so ``score_threshold`` is the minimum similarity.
+    """
+
+    def __init__(
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        hnsw_threshold: Optional[int] = DEFAULT_HNSW_THRESHOLD,
+        **kwargs: Any,
+    ):
+        self.hnsw_threshold = hnsw_threshold
+        super().__init__(type, allow_reset, embedder_config, crew, path, **kwargs)
+
+    def _initialize_app(self):
+        self._set_embedder_config()
+        base_path = self.path if self.path else self.storage_file_name
+        self.collection = NumpyCollection(
+            os.path.join(base_path, f"{self.type}.vectors"),
+            hnsw_threshold=self.hnsw_threshold,
+        )
+
+    def _query(
+        self, query: str, limit: int, filter: Optional[dict] = None
+    ) -> List[Dict[str, Any]]:
+        response = self.collection.query(
+            query_embeddings=self.batch_embedder.embed([query]),
+            n_results=limit,
+            where=filter,
+        )
+        return [
+            {
+                "id": response["ids"][0][i],
+                "metadata": response["metadatas"][0][i],
+                "context": response["documents"][0][i],
+                "score": 1.0 - response["distances"][0][i],
+            }
+            for i in range(len(response["ids"][0]))
+        ]
+
+    def reset(self) -> None:
+        self._discard_buffer()
+        if self.collection is not None:
+            self.collection.reset()
@@ -1,18 +1,35 @@
+import atexit
 import contextlib
 import io
 import logging
 import os
 import shutil
+import threading
 import uuid
-from typing import Any, Dict, List, Optional
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 
 from chromadb.api import ClientAPI
 
 from crewai.memory.storage.base_rag_storage import BaseRAGStorage
 from crewai.utilities import EmbeddingConfigurator
+from crewai.utilities.concurrency import get_shared_pool
 from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
+from crewai.utilities.embeddings import BatchEmbedder
 from crewai.utilities.paths import db_storage_path
 
+DEFAULT_WRITE_BUFFER_SIZE = 32
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# Storages with buffered writes, flushed one last time when the process exits.
+_buffered_storages: "weakref.WeakSet[RAGStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_storages() -> None:
+    for storage in list(_buffered_storages):
+        storage.flush()
+
 
 @contextlib.contextmanager
 def suppress_logging(
@@ -35,14 +52,33 @@ class RAGStorage(BaseRAGStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    Saves are buffered and written behind: the buffer is embedded and added
+    as one batch once it holds ``write_buffer_size`` entries, ``flush_interval``
+    seconds after the first buffered save, or when :meth:`flush` is called.
+    Searches flush first, so they always see earlier saves. A
+    ``write_buffer_size`` of 0 writes every save immediately.
     """
 
     app: ClientAPI | None = None
 
     def __init__(
-        self, type, allow_reset=True, embedder_config=None, crew=None, path=None
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        write_buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+        flush_interval: Optional[float] = DEFAULT_FLUSH_INTERVAL,
     ):
         super().__init__(type, allow_reset, embedder_config, crew)
+        self.write_buffer_size = write_buffer_size
+        self.flush_interval = flush_interval
+        self._buffer: List[Tuple[Any, Dict[str, Any]]] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
         agents = crew.agents if crew else []
         agents = [self._sanitize_role(agent.role) for agent in agents]
         agents = "_".join(agents)
@@ -56,8 +92,17 @@ class RAGStorage(BaseRAGStorage):
         self._initialize_app()
 
     def _set_embedder_config(self):
+        if self.embedder_config is not None and not isinstance(
+            self.embedder_config, dict
+        ):
+            # Already configured by an earlier initialization.
+            return
         configurator = EmbeddingConfigurator()
-        self.embedder_config = configurator.configure_embedder(self.embedder_config)
+        embedding_function = configurator.configure_embedder(self.embedder_config)
+        self.batch_embedder = BatchEmbedder.from_config(
+            embedding_function, self.embedder_config
+        )
+        self.embedder_config = embedding_function
 
     def _initialize_app(self):
         import chromadb
@@ -103,10 +148,41 @@ class RAGStorage(BaseRAGStorage):
     def save(self, value: Any, metadata: Dict[str, Any]) -> None:
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
-        try:
-            self._generate_embedding(value, metadata)
-        except Exception as e:
-            logging.error(f"Error during {self.type} save: {str(e)}")
+        if self.write_buffer_size <= 0:
+            try:
+                self._generate_embedding(value, metadata)
+            except Exception as e:
+                logging.error(f"Error during {self.type} save: {str(e)}")
+            return
+
+        with self._buffer_lock:
+            self._buffer.append((value, metadata))
+            full = len(self._buffer) >= self.write_buffer_size
+            if len(self._buffer) == 1 and not full and self.flush_interval:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        _buffered_storages.add(self)
+        if full:
+            get_shared_pool("thread").submit(self.flush)
+
+    def flush(self) -> None:
+        """Embed and write every buffered save as one batch."""
+        with self._flush_lock:
+            with self._buffer_lock:
+                pending, self._buffer = self._buffer, []
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if not pending:
+                return
+            try:
+                self._add_documents(
+                    [value for value, _ in pending],
+                    [metadata for _, metadata in pending],
+                )
+            except Exception as e:
+                logging.error(f"Error during {self.type} save: {str(e)}")
 
     def search(
         self,
@@ -117,38 +193,57 @@ class RAGStorage(BaseRAGStorage):
     ) -> List[Any]:
         if not hasattr(self, "app"):
             self._initialize_app()
+        # Read-your-writes: buffered saves must be searchable.
+        self.flush()
 
         try:
-            with suppress_logging():
-                response = self.collection.query(query_texts=query, n_results=limit)
-
-            results = []
-            for i in range(len(response["ids"][0])):
-                result = {
-                    "id": response["ids"][0][i],
-                    "metadata": response["metadatas"][0][i],
-                    "context": response["documents"][0][i],
-                    "score": response["distances"][0][i],
-                }
-                if result["score"] >= score_threshold:
-                    results.append(result)
-
-            return results
+            return [
+                result
+                for result in self._query(query, limit, filter)
+                if result["score"] >= score_threshold
+            ]
         except Exception as e:
             logging.error(f"Error during {self.type} search: {str(e)}")
             return []
 
+    def _query(
+        self, query: str, limit: int, filter: Optional[dict] = None
+    ) -> List[Dict[str, Any]]:
+        with suppress_logging():
+            response = self.collection.query(
+                query_embeddings=self.batch_embedder.embed([query]),
+                n_results=limit,
+            )
+
+        return [
+            {
+                "id": response["ids"][0][i],
+                "metadata": response["metadatas"][0][i],
+                "context": response["documents"][0][i],
+                "score": response["distances"][0][i],
+            }
+            for i in range(len(response["ids"][0]))
+        ]
+
     def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> None:  # type: ignore
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
 
+        self._add_documents([text], [metadata])
+
+    def _add_documents(
+        self, texts: List[str], metadatas: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """Embed ``texts`` in batches and add them to the collection."""
         self.collection.add(
-            documents=[text],
-            metadatas=[metadata or {}],
-            ids=[str(uuid.uuid4())],
+            documents=texts,
+            embeddings=self.batch_embedder.embed(texts),
+            metadatas=[metadata or {} for metadata in metadatas],
+            ids=[str(uuid.uuid4()) for _ in texts],
         )
 
     def reset(self) -> None:
+        self._discard_buffer()
         try:
             if self.app:
                 self.app.reset()
@@ -164,6 +259,13 @@ class RAGStorage(BaseRAGStorage):
                     f"An error occurred while resetting the {self.type} memory: {e}"
                 )
 
+    def _discard_buffer(self) -> None:
+        with self._buffer_lock:
+            self._buffer = []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
     def _create_default_embedding_function(self):
         from chromadb.utils.embedding_functions.openai_embedding_function import (
             OpenAIEmbeddingFunction,
@@ -2,6 +2,7 @@ from functools import wraps
 from typing import Callable
 
 from crewai import Crew
+from crewai.crews.crew_factory import CrewFactory
 from crewai.project.utils import memoize
 
 """Decorators for defining crew components and their behaviors."""
@@ -122,6 +123,16 @@ def crew(func) -> Callable[..., Crew]:
         for _, callback in self._after_kickoff.items():
             crew.after_kickoff_callbacks.append(callback_wrapper(callback, self))
 
+        module, class_name = self.crew_class_path
+        crew._factory = CrewFactory(
+            module=module,
+            class_name=class_name,
+            method_name=func.__name__,
+            args=self._crew_init_args,
+            kwargs=self._crew_init_kwargs,
+            method_args=args,
+            method_kwargs=kwargs,
+        )
         return crew
 
     return memoize(wrapper)
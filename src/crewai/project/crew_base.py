@@ -20,6 +20,7 @@ def CrewBase(cls: T) -> T:
 
     class WrappedClass(cls):  # type: ignore
         is_crew_class: bool = True  # type: ignore
+        crew_class_path = (cls.__module__, cls.__qualname__)
 
         # Get the directory of the class being decorated
         base_directory = Path(inspect.getfile(cls)).parent
@@ -31,6 +32,9 @@ def CrewBase(cls: T) -> T:
 
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
+            # Kept so the crew can be rebuilt in worker processes
+            self._crew_init_args = args
+            self._crew_init_kwargs = kwargs
             self.load_configurations()
             self.map_all_agent_variables()
             self.map_all_task_variables()
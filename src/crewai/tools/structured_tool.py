@@ -235,6 +235,28 @@ class CrewStructuredTool:
         parsed_args = self._parse_args(input)
         return self.func(**parsed_args, **kwargs)
 
+    def to_function_schema(self, name: Optional[str] = None) -> dict:
+        """Describe the tool as a function for native LLM tool calling.
+
+        Args:
+            name: Function name to expose, defaults to the tool name
+
+        Returns:
+            dict: The tool schema in the OpenAI function-calling format
+        """
+        parameters = self.args_schema.model_json_schema()
+        parameters.pop("title", None)
+        parameters.setdefault("type", "object")
+        parameters.setdefault("properties", {})
+        return {
+            "type": "function",
+            "function": {
+                "name": name or self.name,
+                "description": self.description,
+                "parameters": parameters,
+            },
+        }
+
     @property
     def args(self) -> dict:
         """Get the tool's input arguments schema."""
@@ -56,6 +56,7 @@ class ToolUsage:
       tools_description: Description of the tools available for the agent.
       tools_names: Names of the tools available for the agent.
       function_calling_llm: Language model to be used for the tool usage.
+      native_tool_calling: Whether the tool calls come from the LLM's native function calling.
     """
 
     def __init__(
@@ -69,6 +70,7 @@ class ToolUsage:
         function_calling_llm: Any,
         agent: Any,
         action: Any,
+        native_tool_calling: bool = False,
     ) -> None:
         self._i18n: I18N = agent.i18n
         self._printer: Printer = Printer()
@@ -85,6 +87,7 @@ class ToolUsage:
         self.task = task
         self.action = action
         self.function_calling_llm = function_calling_llm
+        self.native_tool_calling = native_tool_calling
 
         # Set the maximum parsing attempts for bigger models
         if (
@@ -201,8 +204,13 @@ class ToolUsage:
                     error_message = self._i18n.errors("tool_usage_exception").format(
                         error=e, tool=tool.name, tool_inputs=tool.description
                     )
+                    reminder = (
+                        ""
+                        if self.native_tool_calling
+                        else f' {self._i18n.slice("format").format(tool_names=self.tools_names)}'
+                    )
                     error = ToolUsageErrorException(
-                        f'\n{error_message}.\nMoving on then. {self._i18n.slice("format").format(tool_names=self.tools_names)}'
+                        f"\n{error_message}.\nMoving on then.{reminder}"
                     ).message
                     self.task.increment_tools_errors()
                     if self.agent.verbose:
@@ -264,6 +272,9 @@ class ToolUsage:
         return result
 
     def _should_remember_format(self) -> bool:
+        # Native tool calls are structured, there is no text format to recall.
+        if self.native_tool_calling:
+            return False
         return self.task.used_tools % self._remember_format_after_usages == 0
 
     def _remember_format(self, result: str) -> None:
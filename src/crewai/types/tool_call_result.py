@@ -0,0 +1,31 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ToolCallResult(BaseModel):
+    """
+    Outcome of one function call requested by the model in a single LLM response.
+
+    Attributes:
+        tool_call_id: Provider identifier of the tool call.
+        function_name: Name of the function the model asked to call.
+        arguments: Parsed arguments the function was called with.
+        result: Value returned by the function, if it succeeded.
+        error: Error message if the call could not be resolved or raised.
+    """
+
+    tool_call_id: str = Field(default="", description="Provider tool call id.")
+    function_name: str = Field(..., description="Name of the requested function.")
+    arguments: Dict[str, Any] = Field(
+        default_factory=dict, description="Arguments passed to the function."
+    )
+    result: Any = Field(default=None, description="Value returned by the function.")
+    error: Optional[str] = Field(
+        default=None, description="Error raised while resolving or running the call."
+    )
+
+    def __str__(self) -> str:
+        if self.error is not None:
+            return f"{self.function_name} failed: {self.error}"
+        return str(self.result)
@@ -6,11 +6,13 @@ from .logger import Logger
 from .parser import YamlParser
 from .printer import Printer
 from .prompts import Prompts
+from .rate_limiter import RateLimiter
 from .rpm_controller import RPMController
 from .exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
 from .embedding_configurator import EmbeddingConfigurator
+from .llm_response_cache import LLMResponseCache
 
 __all__ = [
     "Converter",
@@ -21,8 +23,10 @@ __all__ = [
     "Logger",
     "Printer",
     "Prompts",
+    "RateLimiter",
     "RPMController",
     "YamlParser",
     "LLMContextLengthExceededException",
     "EmbeddingConfigurator",
+    "LLMResponseCache",
 ]
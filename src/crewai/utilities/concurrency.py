@@ -0,0 +1,313 @@
+import abc
+import asyncio
+import inspect
+import os
+import threading
+from collections import deque
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+)
+
+"""Bounded executors used to run task work concurrently."""
+
+DEFAULT_MAX_WORKERS = 32
+
+_pools: Dict[str, Executor] = {}
+_pools_lock = threading.Lock()
+_max_workers: Dict[str, int] = {}
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# Depth of pool-worker nesting of the current thread: 0 outside the pools,
+# 1 in a shared thread pool worker, 2 in a nested pool worker.
+_worker_state = threading.local()
+
+
+def set_max_workers(
+    max_workers: int, backend: Literal["thread", "process"] = "thread"
+) -> None:
+    """Set the process-wide worker count of a shared pool.
+
+    The current pool, if any, finishes its queued work in the background and
+    the next submission creates a pool of the new size.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    with _pools_lock:
+        _max_workers[backend] = max_workers
+        pools = [_pools.pop(backend, None)]
+        if backend == "thread":
+            pools.append(_pools.pop("nested", None))
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+def _max_workers_for(backend: str) -> int:
+    if backend in _max_workers:
+        return _max_workers[backend]
+    env_value = os.environ.get(f"CREWAI_MAX_{backend.upper()}_WORKERS")
+    if env_value:
+        return int(env_value)
+    if backend == "process":
+        return os.cpu_count() or 1
+    return DEFAULT_MAX_WORKERS
+
+
+def _set_worker_depth(depth: int) -> None:
+    _worker_state.depth = depth
+
+
+def _worker_depth() -> int:
+    return getattr(_worker_state, "depth", 0)
+
+
+def get_shared_pool(backend: Literal["thread", "process"] = "thread") -> Executor:
+    """Return the process-wide pool for ``backend``, creating it if needed."""
+    with _pools_lock:
+        pool = _pools.get(backend)
+        if pool is None:
+            max_workers = _max_workers_for(backend)
+            if backend == "process":
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+            else:
+                pool = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="crewai-worker",
+                    initializer=_set_worker_depth,
+                    initargs=(1,),
+                )
+            _pools[backend] = pool
+        return pool
+
+
+def _get_nested_pool() -> Executor:
+    """Return the thread pool for work submitted from shared pool workers.
+
+    A worker that blocks on work it submitted to its own pool deadlocks once
+    every worker does the same, so nested work gets a pool of its own.
+    """
+    with _pools_lock:
+        pool = _pools.get("nested")
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=_max_workers_for("thread"),
+                thread_name_prefix="crewai-nested-worker",
+                initializer=_set_worker_depth,
+                initargs=(2,),
+            )
+            _pools["nested"] = pool
+        return pool
+
+
+def submit_to_thread_pool(fn: Callable, *args: Any, **kwargs: Any) -> Future:
+    """Run ``fn`` on a thread pool that cannot deadlock on the caller's worker.
+
+    Calls from outside the pools go to the shared thread pool, calls from its
+    workers go to the nested pool, and calls from nested workers run inline
+    and return a completed future.
+    """
+    depth = _worker_depth()
+    if depth == 0:
+        return get_shared_pool("thread").submit(fn, *args, **kwargs)
+    if depth == 1:
+        return _get_nested_pool().submit(fn, *args, **kwargs)
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+    try:
+        future.set_result(fn(*args, **kwargs))
+    except BaseException as e:
+        future.set_exception(e)
+    return future
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop that runs coroutines for :class:`AsyncioTaskExecutor`."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="crewai-event-loop", daemon=True
+            ).start()
+            _loop = loop
+        return _loop
+
+
+class TaskExecutor(abc.ABC):
+    """Runs callables on a shared backend with an optional concurrency limit.
+
+    Work beyond ``max_concurrency`` waits in a queue owned by this executor,
+    so a crew cannot flood the shared pool. ``submit`` always returns a
+    ``concurrent.futures.Future`` that receives the result or the exception,
+    and queued work can be cancelled through that future or
+    :meth:`cancel_pending`.
+    """
+
+    supports_coroutines: bool = False
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queue: Deque[Tuple[Future, Callable, Tuple, Dict[str, Any]]] = deque()
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if (
+                self.max_concurrency is not None
+                and self._running >= self.max_concurrency
+            ):
+                self._queue.append((future, fn, args, kwargs))
+                return future
+            self._running += 1
+        self._start(future, fn, args, kwargs)
+        return future
+
+    def cancel_pending(self) -> None:
+        """Cancel every submission that has not started yet."""
+        with self._lock:
+            queued = list(self._queue)
+            self._queue.clear()
+        for future, *_ in queued:
+            future.cancel()
+
+    def _start(
+        self, future: Future, fn: Callable, args: Tuple, kwargs: Dict[str, Any]
+    ) -> None:
+        if not future.set_running_or_notify_cancel():
+            self._release()
+            return
+        try:
+            inner = self._dispatch(fn, args, kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            self._release()
+            return
+        inner.add_done_callback(lambda done: self._complete(future, done))
+
+    def _complete(self, future: Future, inner: Future) -> None:
+        try:
+            if inner.cancelled():
+                future.set_exception(CancelledError())
+            elif inner.exception() is not None:
+                future.set_exception(inner.exception())
+            else:
+                future.set_result(inner.result())
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            if not self._queue:
+                self._running -= 1
+                return
+            future, fn, args, kwargs = self._queue.popleft()
+        self._start(future, fn, args, kwargs)
+
+    @abc.abstractmethod
+    def _dispatch(self, fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Future:
+        """Start ``fn`` on the backend and return a future of its outcome."""
+
+
+class ThreadTaskExecutor(TaskExecutor):
+    """Runs callables on the shared thread pool.
+
+    Work submitted from a pool worker runs on the nested pool instead, see
+    :func:`submit_to_thread_pool`.
+    """
+
+    def _dispatch(self, fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Future:
+        return submit_to_thread_pool(fn, *args, **kwargs)
+
+
+class ProcessTaskExecutor(TaskExecutor):
+    """Runs callables on the shared process pool.
+
+    The callable and its arguments must be picklable, so this backend suits
+    self-contained work such as parsing files, not live agents or crews.
+    """
+
+    def _dispatch(self, fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Future:
+        return get_shared_pool("process").submit(fn, *args, **kwargs)
+
+
+class AsyncioTaskExecutor(TaskExecutor):
+    """Runs coroutine functions on a shared background event loop.
+
+    Regular callables are moved off the loop with ``asyncio.to_thread``.
+    """
+
+    supports_coroutines = True
+
+    def _dispatch(self, fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Future:
+        if inspect.iscoroutinefunction(fn):
+            coroutine = fn(*args, **kwargs)
+        else:
+            coroutine = asyncio.to_thread(fn, *args, **kwargs)
+        return asyncio.run_coroutine_threadsafe(coroutine, get_background_loop())
+
+
+def create_task_executor(
+    backend: Literal["thread", "async", "process"] = "thread",
+    max_concurrency: Optional[int] = None,
+) -> TaskExecutor:
+    """Create an executor for ``backend`` limited to ``max_concurrency`` jobs."""
+    executors: Dict[str, Type[TaskExecutor]] = {
+        "thread": ThreadTaskExecutor,
+        "async": AsyncioTaskExecutor,
+        "process": ProcessTaskExecutor,
+    }
+    if backend not in executors:
+        raise ValueError(
+            f"Unknown backend '{backend}', expected one of {list(executors)}"
+        )
+    return executors[backend](max_concurrency=max_concurrency)
+
+
+def ordered_map(
+    fn: Callable,
+    items: Iterable[Tuple],
+    backend: Literal["thread", "async", "process"] = "process",
+    max_concurrency: Optional[int] = None,
+) -> Iterator[Any]:
+    """Run ``fn(*item)`` for every item concurrently and yield results in item order.
+
+    Submission runs ahead of consumption by at most twice the concurrency, so
+    results waiting to be consumed stay bounded. Unstarted work is cancelled
+    if the consumer stops early or an item fails.
+    """
+    executor = create_task_executor(backend, max_concurrency)
+    window = 2 * (max_concurrency or _max_workers_for(backend))
+    pending: Deque[Future] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, *item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.cancel_pending()
+        for future in pending:
+            future.cancel()
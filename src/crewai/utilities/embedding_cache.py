@@ -0,0 +1,182 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+"""Process-wide cache of embedding vectors."""
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class EmbeddingCache:
+    """LRU cache of embeddings keyed by embedder fingerprint and text hash.
+
+    Vectors are kept in memory as float32 arrays, evicting the least recently
+    used once ``max_entries`` is reached. With a ``path`` every vector is
+    also written to a SQLite file, which serves memory misses and survives
+    restarts.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def key(fingerprint: str, text: str) -> str:
+        return hashlib.sha256(f"{fingerprint}\0{text}".encode("utf-8")).hexdigest()
+
+    def embed(
+        self,
+        fingerprint: str,
+        texts: Sequence[str],
+        compute: Callable[[List[str]], Sequence[Any]],
+    ) -> List[np.ndarray]:
+        """Return one vector per text, calling ``compute`` once for the unique misses."""
+        keys = [self.key(fingerprint, text) for text in texts]
+        vectors = self.get_many(keys)
+        missing: Dict[str, str] = {}
+        for key, text, vector in zip(keys, texts, vectors):
+            if vector is None:
+                missing.setdefault(key, text)
+        if missing:
+            computed = compute(list(missing.values()))
+            new_vectors = {
+                key: np.asarray(vector, dtype=np.float32)
+                for key, vector in zip(missing, computed)
+            }
+            self.put_many(new_vectors)
+            vectors = [
+                vector if vector is not None else new_vectors[key]
+                for key, vector in zip(keys, vectors)
+            ]
+        return vectors  # type: ignore[return-value]
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        vectors: List[Optional[np.ndarray]] = []
+        disk_keys = []
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                elif self._conn is not None:
+                    disk_keys.append(key)
+                vectors.append(vector)
+        if disk_keys:
+            found = self._load(disk_keys)
+            if found:
+                self._remember(found)
+                vectors = [
+                    vector if vector is not None else found.get(key)
+                    for key, vector in zip(keys, vectors)
+                ]
+        with self._lock:
+            missed = sum(vector is None for vector in vectors)
+            self.misses += missed
+            self.hits += len(vectors) - missed
+        return vectors
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        self._remember(vectors)
+        if self._conn is not None:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in vectors.items()],
+                )
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Drop every cached vector, on disk too, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+                self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._entries[key] = vector
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            if self._conn is None:
+                return found
+            # Stay below SQLite's limit on bound parameters.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide cache.
+
+    The on-disk tier is enabled when ``CREWAI_EMBEDDING_CACHE_PATH`` is set
+    or through :func:`configure_embedding_cache`.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache(path=os.environ.get("CREWAI_EMBEDDING_CACHE_PATH"))
+        return _cache
+
+
+def configure_embedding_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[str] = None
+) -> EmbeddingCache:
+    """Replace the process-wide cache, e.g. to enable the on-disk tier."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = EmbeddingCache(max_entries=max_entries, path=path)
+        return _cache
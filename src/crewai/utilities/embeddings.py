@@ -0,0 +1,194 @@
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from chromadb import EmbeddingFunction
+
+from crewai.utilities.embedding_cache import get_embedding_cache
+from crewai.utilities.rate_limiter import RateLimiter, get_rate_limiter
+
+"""Batched, concurrent embedding on top of the configured embedding functions."""
+
+DEFAULT_EMBEDDING_MODEL = "openai/text-embedding-3-small"
+
+# Largest number of inputs each provider accepts in one embedding request.
+PROVIDER_BATCH_SIZES: Dict[str, int] = {
+    "openai": 2048,
+    "azure": 2048,
+    "cohere": 96,
+    "voyageai": 128,
+    "google": 100,
+    "vertexai": 250,
+    "watson": 1000,
+    "huggingface": 32,
+    "ollama": 32,
+    "bedrock": 1,
+}
+DEFAULT_BATCH_SIZE = 64
+# Keeps a batch of long chunks below the providers' per-request token limits.
+MAX_BATCH_CHARACTERS = 400_000
+
+
+# Config keys holding credentials, which never change the vectors.
+CREDENTIAL_KEY_PARTS = ("key", "token", "secret", "password", "credential")
+
+
+def embedder_fingerprint(embedder_config: Optional[Dict[str, Any]]) -> str:
+    """Identify the embedding model of a config without including credentials.
+
+    The fingerprint is ``provider/model``, followed by a hash of the other
+    config values, such as ``dimensions``, ``deployment_id`` or ``api_url``,
+    when there are any.
+    """
+    if not embedder_config:
+        return DEFAULT_EMBEDDING_MODEL
+    provider = embedder_config.get("provider")
+    config = embedder_config.get("config", {})
+    if provider == "custom":
+        embedder = config.get("embedder")
+        embedder_class = embedder if isinstance(embedder, type) else type(embedder)
+        model = embedder_class.__qualname__
+    else:
+        model = config.get("model")
+    options = {
+        name: value
+        for name, value in config.items()
+        if name not in ("model", "embedder")
+        and not any(part in name.lower() for part in CREDENTIAL_KEY_PARTS)
+    }
+    if not options:
+        return f"{provider}/{model}"
+    digest = hashlib.sha256(
+        json.dumps(options, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+    return f"{provider}/{model}#{digest}"
+
+
+class BatchEmbedder:
+    """Embeds texts in provider-sized batches, several batches at a time.
+
+    Batches are sent concurrently from a thread pool of ``max_concurrency``
+    workers owned by the call, each one waits for a slot of the optional
+    requests-per-minute budget, and failed batches are retried with
+    exponential backoff. Vectors are returned in
+    the order of the input texts so they can be handed to Chroma through
+    ``embeddings=``. Texts already embedded with the same model are served
+    from the process-wide :class:`EmbeddingCache` unless ``cache`` is False.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        fingerprint: str = DEFAULT_EMBEDDING_MODEL,
+        batch_size: Optional[int] = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        max_rpm: Optional[int] = None,
+        retry_delay: float = 1.0,
+        cache: bool = True,
+    ):
+        provider = fingerprint.split("/", 1)[0]
+        self.embedding_function = embedding_function
+        self.fingerprint = fingerprint
+        self.batch_size = batch_size or PROVIDER_BATCH_SIZES.get(
+            provider, DEFAULT_BATCH_SIZE
+        )
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.cache = cache
+        self._rate_limiter: Optional[RateLimiter] = (
+            get_rate_limiter(f"embeddings/{fingerprint}", max_rpm=max_rpm)
+            if max_rpm
+            else None
+        )
+
+    @classmethod
+    def from_config(
+        cls,
+        embedding_function: EmbeddingFunction,
+        embedder_config: Optional[Dict[str, Any]] = None,
+    ) -> "BatchEmbedder":
+        """Build a batch embedder from an ``embedder`` config.
+
+        ``batch_size``, ``max_concurrency``, ``max_retries``, ``max_rpm`` and
+        ``cache`` are read from the top level of the config, next to ``provider``.
+        """
+        embedder_config = embedder_config or {}
+        options = {
+            name: embedder_config[name]
+            for name in (
+                "batch_size",
+                "max_concurrency",
+                "max_retries",
+                "max_rpm",
+                "cache",
+            )
+            if name in embedder_config
+        }
+        return cls(
+            embedding_function,
+            fingerprint=embedder_fingerprint(embedder_config),
+            **options,
+        )
+
+    def embed(self, texts: Sequence[str]) -> List[Any]:
+        """Return one vector per text, in input order."""
+        if self.cache:
+            return get_embedding_cache().embed(
+                self.fingerprint, texts, self._embed_uncached
+            )
+        return self._embed_uncached(texts)
+
+    def _embed_uncached(self, texts: Sequence[str]) -> List[Any]:
+        batches = list(self._batches(texts))
+        if not batches:
+            return []
+        if len(batches) == 1:
+            return self._embed_batch(batches[0])
+        # Embedding runs from the shared pool's workers, for example while a
+        # knowledge source is ingested by an async task, so the batches get a
+        # pool of their own instead of waiting for those same workers.
+        embeddings: List[Any] = []
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(batches)),
+            thread_name_prefix="crewai-embed",
+        ) as pool:
+            for vectors in pool.map(self._embed_batch, batches):
+                embeddings.extend(vectors)
+        return embeddings
+
+    def _batches(self, texts: Sequence[str]) -> Iterator[List[str]]:
+        batch: List[str] = []
+        characters = 0
+        for text in texts:
+            if batch and (
+                len(batch) >= self.batch_size
+                or characters + len(text) > MAX_BATCH_CHARACTERS
+            ):
+                yield batch
+                batch, characters = [], 0
+            batch.append(text)
+            characters += len(text)
+        if batch:
+            yield batch
+
+    def _embed_batch(self, batch: List[str]) -> List[Any]:
+        attempt = 0
+        while True:
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            try:
+                return list(self.embedding_function(batch))
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_delay * 2**attempt
+                logging.warning(
+                    f"Embedding batch of {len(batch)} failed ({e}), retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+                attempt += 1
@@ -39,8 +39,8 @@ class TrainingTaskEvaluation(BaseModel):
 
 
 class TaskEvaluator:
-    def __init__(self, original_agent):
-        self.llm = original_agent.llm
+    def __init__(self, original_agent, llm=None):
+        self.llm = llm or original_agent.llm
         self.original_agent = original_agent
 
     def evaluate(self, task, output) -> TaskEvaluation:
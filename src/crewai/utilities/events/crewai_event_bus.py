@@ -73,6 +73,10 @@ class CrewAIEventsBus:
                 handler(source, event)
         self._signal.send(source, event=event)
 
+    def has_handlers(self, event_type: Type[CrewEvent]) -> bool:
+        """Whether emitting an event of this type would reach any handler"""
+        return bool(self._handlers.get(event_type)) or bool(self._signal.receivers)
+
     def clear_handlers(self) -> None:
         """Clear all registered event handlers - useful for testing"""
         self._handlers.clear()
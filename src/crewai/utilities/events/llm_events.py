@@ -27,6 +27,7 @@ class LLMCallCompletedEvent(CrewEvent):
     type: str = "llm_call_completed"
     response: Any
     call_type: LLMCallType
+    cached: bool = False
 
 
 class LLMCallFailedEvent(CrewEvent):
@@ -34,3 +35,10 @@ class LLMCallFailedEvent(CrewEvent):
 
     error: str
     type: str = "llm_call_failed"
+
+
+class LLMStreamChunkEvent(CrewEvent):
+    """Event emitted for each text chunk received from a streaming LLM call"""
+
+    type: str = "llm_stream_chunk"
+    chunk: str
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from crewai.utilities.paths import db_storage_path
+
+"""Content-addressed cache for LLM completion responses."""
+
+# Parameters that do not influence the completion and must never be persisted
+# (credentials) or would needlessly split the key space (transport settings).
+EXCLUDED_KEY_PARAMS = {"api_key", "timeout", "stream", "callbacks"}
+
+
+class LLMResponseCache:
+    """Two-tier cache for LLM responses keyed by a hash of the request params.
+
+    The first tier is an in-memory LRU of ``max_memory_entries`` items. The
+    optional second tier is a SQLite table that survives across processes and
+    is bounded by ``max_disk_entries`` (least recently used rows are evicted)
+    and ``ttl`` seconds (expired rows are dropped on read and on write).
+
+    Cached entries are plain dictionaries with the response ``content``, the
+    raw ``tool_calls`` and the provider ``usage`` so a hit can be replayed
+    without talking to the provider.
+    """
+
+    def __init__(
+        self,
+        max_memory_entries: int = 1024,
+        db_path: Optional[str] = None,
+        persist: bool = True,
+        max_disk_entries: Optional[int] = 100_000,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl = ttl
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.db_path: Optional[str] = None
+        if persist:
+            if db_path is None:
+                db_path = str(Path(db_storage_path()) / "llm_response_cache.db")
+            self.db_path = db_path
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:  # type: ignore[arg-type]
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT,
+                    created_at REAL,
+                    last_accessed REAL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_accessed "
+                "ON llm_response_cache (last_accessed)"
+            )
+            conn.commit()
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> Optional[str]:
+        """Return a canonical SHA-256 hash of the completion parameters.
+
+        Returns None when a parameter has no stable encoding, since a key
+        built from it could not be found again by another process; such
+        requests are not cached.
+        """
+        canonical = {
+            k: v
+            for k, v in params.items()
+            if k not in EXCLUDED_KEY_PARAMS and v is not None
+        }
+        try:
+            payload = json.dumps(
+                canonical, sort_keys=True, separators=(",", ":"), default=_encode_value
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key`` or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_expired(entry, now):
+                    del self._memory[key]
+                else:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry["response"]
+
+        if self.persist:
+            entry = self._read_from_disk(key, now)
+            if entry is not None:
+                with self._lock:
+                    self._remember(key, entry)
+                    self.hits += 1
+                return entry["response"]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """Store ``response`` under ``key`` in every enabled tier."""
+        entry = {"response": response, "created_at": time.time()}
+        with self._lock:
+            self._remember(key, entry)
+        if self.persist:
+            self._write_to_disk(key, entry)
+
+    def clear(self) -> None:
+        """Drop every cached response from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.persist:
+            with sqlite3.connect(self.db_path) as conn:  # type: ignore[arg-type]
+                conn.execute("DELETE FROM llm_response_cache")
+                conn.commit()
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return self.ttl is not None and now - entry["created_at"] > self.ttl
+
+    def _read_from_disk(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        try:
+            with sqlite3.connect(self.db_path) as conn:  # type: ignore[arg-type]
+                row = conn.execute(
+                    "SELECT response, created_at FROM llm_response_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                entry = {"response": json.loads(row[0]), "created_at": row[1]}
+                if self._is_expired(entry, now):
+                    conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_accessed = ? WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                return entry
+        except (sqlite3.Error, json.JSONDecodeError):
+            return None
+
+    def _write_to_disk(self, key: str, entry: Dict[str, Any]) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:  # type: ignore[arg-type]
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_response_cache
+                        (key, response, created_at, last_accessed)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (
+                        key,
+                        json.dumps(entry["response"]),
+                        entry["created_at"],
+                        entry["created_at"],
+                    ),
+                )
+                if self.ttl is not None:
+                    conn.execute(
+                        "DELETE FROM llm_response_cache WHERE created_at < ?",
+                        (entry["created_at"] - self.ttl,),
+                    )
+                if self.max_disk_entries is not None:
+                    conn.execute(
+                        """
+                        DELETE FROM llm_response_cache WHERE key IN (
+                            SELECT key FROM llm_response_cache
+                            ORDER BY last_accessed DESC
+                            LIMIT -1 OFFSET ?
+                        )
+                        """,
+                        (self.max_disk_entries,),
+                    )
+                conn.commit()
+        except sqlite3.Error:
+            # The disk tier is best effort; the in-memory tier still holds the entry.
+            pass
+
+
+def serialize_response(response: Any) -> Dict[str, Any]:
+    """Extract the cacheable parts of a litellm ``ModelResponse``."""
+    message = response.choices[0].message
+    tool_calls: List[Dict[str, Any]] = []
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        tool_calls.append(
+            {
+                "id": tool_call.id,
+                "type": getattr(tool_call, "type", "function"),
+                "function": {
+                    "name": tool_call.function.name,
+                    "arguments": tool_call.function.arguments,
+                },
+            }
+        )
+    usage = getattr(response, "usage", None)
+    return {
+        "content": message.content or "",
+        "tool_calls": tool_calls,
+        "usage": _usage_to_dict(usage) if usage else None,
+    }
+
+
+def _usage_to_dict(usage: Any) -> Dict[str, Any]:
+    if hasattr(usage, "model_dump"):
+        return usage.model_dump()
+    if isinstance(usage, dict):
+        return usage
+    return {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+        "completion_tokens": getattr(usage, "completion_tokens", 0),
+        "total_tokens": getattr(usage, "total_tokens", 0),
+    }
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return {"__pydantic_schema__": value.model_json_schema()}
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
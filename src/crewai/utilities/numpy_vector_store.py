@@ -0,0 +1,477 @@
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+"""In-process vector collection backed by a NumPy matrix."""
+
+# Collections at least this large are searched through an HNSW index when
+# hnswlib is installed.
+DEFAULT_HNSW_THRESHOLD = 50_000
+
+VECTOR_STORES = ("chroma", "numpy")
+
+RECORDS_FILE = "records.json"
+# Each snapshot saves its vectors under a fresh name that the records file
+# points to, so replacing the records file commits both at once. Snapshots
+# written before that keep their vectors in VECTORS_FILE.
+VECTORS_FILE = "embeddings.npy"
+VECTORS_FILE_PATTERN = "embeddings.{}.npy"
+# Writes since the last snapshot: one JSON line per upsert or delete, and the
+# upserted vectors appended as raw float32 in the same order.
+JOURNAL_FILE = "journal.jsonl"
+JOURNAL_VECTORS_FILE = "journal.f32"
+# Journal size, in rows written plus ids deleted, always allowed before the
+# journal is folded into the snapshot; beyond it the journal may grow as
+# large as the snapshot, so rewrites cost O(1) per row amortized.
+MIN_COMPACTION_ROWS = 1024
+
+_COMPARISONS = {
+    "$eq": lambda value, expected: value == expected,
+    "$ne": lambda value, expected: value != expected,
+    "$gt": lambda value, expected: value is not None and value > expected,
+    "$gte": lambda value, expected: value is not None and value >= expected,
+    "$lt": lambda value, expected: value is not None and value < expected,
+    "$lte": lambda value, expected: value is not None and value <= expected,
+    "$in": lambda value, expected: value in expected,
+    "$nin": lambda value, expected: value not in expected,
+}
+
+
+def vector_store_backend(config: Optional[Dict[str, Any]] = None) -> str:
+    """Name of the vector store for memory and knowledge storages.
+
+    ``config["vector_store"]`` wins over the ``CREWAI_VECTOR_STORE``
+    environment variable; the default is ``"chroma"``.
+    """
+    backend = (config or {}).get("vector_store") or os.environ.get(
+        "CREWAI_VECTOR_STORE", "chroma"
+    )
+    if backend not in VECTOR_STORES:
+        raise ValueError(
+            f"Unknown vector store '{backend}', expected one of {list(VECTOR_STORES)}"
+        )
+    return backend
+
+
+def matches_filter(metadata: Optional[Dict[str, Any]], where: Dict[str, Any]) -> bool:
+    """Whether ``metadata`` satisfies a Chroma-style ``where`` filter.
+
+    Supports ``{"field": value}``, the operators ``$eq``, ``$ne``, ``$gt``,
+    ``$gte``, ``$lt``, ``$lte``, ``$in`` and ``$nin``, and ``$and``/``$or``
+    over lists of filters.
+    """
+    metadata = metadata or {}
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_filter(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_filter(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for operator, expected in condition.items():
+                if operator not in _COMPARISONS:
+                    raise ValueError(f"Unsupported filter operator '{operator}'")
+                if not _COMPARISONS[operator](value, expected):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+class NumpyCollection:
+    """A collection of documents and their embeddings kept in a float32 matrix.
+
+    Vectors are L2-normalised on insert, so a query is one matrix product
+    followed by a top-k selection, and filtered queries only score the rows
+    whose metadata match. With a ``path`` the matrix is saved as ``.npy``
+    (and memory-mapped when loaded) next to a JSON file of ids, documents
+    and metadata. Writes are appended to a journal, so their cost does not
+    grow with the collection; the journal is folded into those files once it
+    outgrows them, and on :meth:`compact` or :meth:`close`.
+    Collections of ``hnsw_threshold`` rows
+    or more are searched through an HNSW index when ``hnswlib`` is
+    installed. The method names and result shapes follow Chroma's
+    collections, so storages can use either.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        hnsw_threshold: Optional[int] = DEFAULT_HNSW_THRESHOLD,
+    ):
+        self.path = Path(path) if path else None
+        self.hnsw_threshold = hnsw_threshold
+        self._lock = threading.RLock()
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._documents: List[str] = []
+        self._metadatas: List[Optional[Dict[str, Any]]] = []
+        self._vectors: Optional[np.ndarray] = None
+        # Preallocated rows ``_vectors`` is a view of, so appends do not copy
+        # the whole matrix; None while ``_vectors`` is not such a view.
+        self._buffer: Optional[np.ndarray] = None
+        self._hnsw: Any = None
+        self._hnsw_size = 0
+        self._journal_size = 0
+        self._snapshot_rows = 0
+        self._load()
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._ids)
+
+    def add(
+        self,
+        ids: List[str],
+        documents: List[str],
+        embeddings: Sequence[Sequence[float]],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        self.upsert(ids, documents, embeddings, metadatas)
+
+    def upsert(
+        self,
+        ids: List[str],
+        documents: List[str],
+        embeddings: Sequence[Sequence[float]],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Insert new ids and replace the documents of existing ones."""
+        if not ids:
+            return
+        vectors = self._normalize(np.asarray(embeddings, dtype=np.float32))
+        if metadatas is None or isinstance(metadatas, dict):
+            metadatas = [metadatas] * len(ids)  # type: ignore[list-item]
+        with self._lock:
+            if self._vectors is not None and vectors.shape[1] != self._vectors.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension mismatch: collection holds {self._vectors.shape[1]}, got {vectors.shape[1]}"
+                )
+            # The last occurrence of an id repeated within the call wins.
+            rows = list({doc_id: row for row, doc_id in enumerate(ids)}.values())
+            ids = [ids[row] for row in rows]
+            documents = [documents[row] for row in rows]
+            metadatas = [metadatas[row] for row in rows]
+            vectors = vectors[rows]
+            self._upsert_rows(ids, documents, vectors, metadatas)
+            self._append_journal(
+                {
+                    "op": "upsert",
+                    "ids": ids,
+                    "documents": documents,
+                    "metadatas": metadatas,
+                    "dim": vectors.shape[1],
+                },
+                vectors,
+            )
+
+    def delete(self, ids: List[str]) -> None:
+        with self._lock:
+            deleted = self._delete_rows(ids)
+            if deleted:
+                self._append_journal({"op": "delete", "ids": deleted})
+
+    def compact(self) -> None:
+        """Fold the journal into the ``.npy`` and records files."""
+        with self._lock:
+            if self.path is None or not self.path.exists():
+                return
+            self._write_snapshot()
+            for name in (JOURNAL_FILE, JOURNAL_VECTORS_FILE):
+                (self.path / name).unlink(missing_ok=True)
+            self._journal_size = 0
+            self._snapshot_rows = len(self._ids)
+
+    def close(self) -> None:
+        """Compact the files of the collection."""
+        self.compact()
+
+    def query(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, List[List[Any]]]:
+        """Return the nearest documents of every query by cosine distance."""
+        queries = self._normalize(np.asarray(query_embeddings, dtype=np.float32))
+        results: Dict[str, List[List[Any]]] = {
+            "ids": [],
+            "documents": [],
+            "metadatas": [],
+            "distances": [],
+        }
+        with self._lock:
+            if self._vectors is None or n_results <= 0:
+                for key in results:
+                    results[key] = [[] for _ in range(len(queries))]
+                return results
+            if where:
+                candidates = np.array(
+                    [
+                        p
+                        for p, metadata in enumerate(self._metadatas)
+                        if matches_filter(metadata, where)
+                    ],
+                    dtype=np.int64,
+                )
+                neighbours = self._exact_search(queries, n_results, candidates)
+            elif self._use_hnsw():
+                neighbours = self._hnsw_search(queries, n_results)
+            else:
+                neighbours = self._exact_search(queries, n_results, None)
+            for positions, distances in neighbours:
+                results["ids"].append([self._ids[p] for p in positions])
+                results["documents"].append([self._documents[p] for p in positions])
+                results["metadatas"].append([self._metadatas[p] for p in positions])
+                results["distances"].append([float(d) for d in distances])
+        return results
+
+    def reset(self) -> None:
+        """Drop every document, on disk too."""
+        with self._lock:
+            self._ids, self._documents, self._metadatas = [], [], []
+            self._positions = {}
+            self._vectors = None
+            self._buffer = None
+            self._hnsw = None
+            self._journal_size = 0
+            self._snapshot_rows = 0
+            if self.path is not None and self.path.exists():
+                shutil.rmtree(self.path)
+
+    def _exact_search(
+        self, queries: np.ndarray, n_results: int, candidates: Optional[np.ndarray]
+    ) -> List[Any]:
+        vectors = self._vectors if candidates is None else self._vectors[candidates]  # type: ignore[index]
+        if len(vectors) == 0:  # type: ignore[arg-type]
+            return [([], []) for _ in queries]
+        similarities = queries @ vectors.T  # type: ignore[union-attr]
+        k = min(n_results, similarities.shape[1])
+        neighbours = []
+        for scores in similarities:
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            positions = top if candidates is None else candidates[top]
+            neighbours.append((positions.tolist(), 1.0 - scores[top]))
+        return neighbours
+
+    def _use_hnsw(self) -> bool:
+        if self.hnsw_threshold is None or len(self._ids) < self.hnsw_threshold:
+            return False
+        try:
+            import hnswlib  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _hnsw_search(self, queries: np.ndarray, n_results: int) -> List[Any]:
+        import hnswlib
+
+        if self._hnsw is None:
+            index = hnswlib.Index(space="cosine", dim=self._vectors.shape[1])  # type: ignore[union-attr]
+            index.init_index(max_elements=len(self._ids), ef_construction=200, M=16)
+            index.add_items(self._vectors, np.arange(len(self._ids)))
+            self._hnsw, self._hnsw_size = index, len(self._ids)
+        elif self._hnsw_size < len(self._ids):
+            # Appended rows keep their positions, so they can be added in place.
+            self._hnsw.resize_index(len(self._ids))
+            self._hnsw.add_items(
+                self._vectors[self._hnsw_size :],  # type: ignore[index]
+                np.arange(self._hnsw_size, len(self._ids)),
+            )
+            self._hnsw_size = len(self._ids)
+        k = min(n_results, len(self._ids))
+        self._hnsw.set_ef(max(50, k))
+        labels, distances = self._hnsw.knn_query(queries, k=k)
+        return [(row.tolist(), dist) for row, dist in zip(labels, distances)]
+
+    def _upsert_rows(
+        self,
+        ids: List[str],
+        documents: List[str],
+        vectors: np.ndarray,
+        metadatas: Sequence[Optional[Dict[str, Any]]],
+    ) -> None:
+        new_rows = []
+        for row, doc_id in enumerate(ids):
+            position = self._positions.get(doc_id)
+            if position is None:
+                new_rows.append(row)
+                self._positions[doc_id] = len(self._ids)
+                self._ids.append(doc_id)
+                self._documents.append(documents[row])
+                self._metadatas.append(metadatas[row])
+            else:
+                self._writable_vectors()[position] = vectors[row]
+                self._documents[position] = documents[row]
+                self._metadatas[position] = metadatas[row]
+                self._hnsw = None
+        if new_rows:
+            self._append_vectors(vectors[new_rows])
+
+    def _append_vectors(self, added: np.ndarray) -> None:
+        count = 0 if self._vectors is None else len(self._vectors)
+        needed = count + len(added)
+        if self._buffer is None or len(self._buffer) < needed:
+            buffer = np.empty((max(needed, 2 * count), added.shape[1]), dtype=np.float32)
+            if count:
+                buffer[:count] = self._vectors
+            self._buffer = buffer
+        self._buffer[count:needed] = added
+        self._vectors = self._buffer[:needed]
+
+    def _delete_rows(self, ids: List[str]) -> List[str]:
+        deleted = [doc_id for doc_id in dict.fromkeys(ids) if doc_id in self._positions]
+        if not deleted:
+            return []
+        doomed = {self._positions[doc_id] for doc_id in deleted}
+        keep = [p for p in range(len(self._ids)) if p not in doomed]
+        self._ids = [self._ids[p] for p in keep]
+        self._documents = [self._documents[p] for p in keep]
+        self._metadatas = [self._metadatas[p] for p in keep]
+        self._positions = {doc_id: p for p, doc_id in enumerate(self._ids)}
+        self._vectors = self._vectors[keep] if keep else None  # type: ignore[index]
+        self._buffer = None
+        self._hnsw = None
+        return deleted
+
+    def _writable_vectors(self) -> np.ndarray:
+        if isinstance(self._vectors, np.memmap):
+            self._vectors = self._buffer = np.array(self._vectors)
+        return self._vectors  # type: ignore[return-value]
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        records_path = self.path / RECORDS_FILE
+        if records_path.exists():
+            try:
+                with open(records_path, "r", encoding="utf-8") as f:
+                    records = json.load(f)
+                vectors_path = self.path / records.get("vectors", VECTORS_FILE)
+                vectors = np.load(vectors_path, mmap_mode="r")
+            except (OSError, ValueError) as e:
+                logging.warning(
+                    f"Ignoring unreadable vector collection {self.path}: {e}"
+                )
+                return
+            if len(vectors) != len(records["ids"]):
+                logging.warning(f"Ignoring inconsistent vector collection {self.path}")
+                return
+            self._ids = records["ids"]
+            self._documents = records["documents"]
+            self._metadatas = records["metadatas"]
+            self._positions = {doc_id: p for p, doc_id in enumerate(self._ids)}
+            self._vectors = vectors if len(vectors) else None
+            self._snapshot_rows = len(self._ids)
+        if not self._replay_journal():
+            # Drop the torn end of the journal before appending to it again.
+            self.compact()
+
+    def _replay_journal(self) -> bool:
+        """Apply the journal to the loaded snapshot; False if it ends in a torn write."""
+        journal_path = self.path / JOURNAL_FILE  # type: ignore[operator]
+        vectors_path = self.path / JOURNAL_VECTORS_FILE  # type: ignore[operator]
+        if not journal_path.exists():
+            return not vectors_path.exists()
+        journal_vectors = (
+            np.fromfile(vectors_path, dtype=np.float32)
+            if vectors_path.exists()
+            else np.zeros(0, dtype=np.float32)
+        )
+        offset = 0
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    return False
+                if entry["op"] == "delete":
+                    self._delete_rows(entry["ids"])
+                    self._journal_size += len(entry["ids"])
+                    continue
+                size = len(entry["ids"]) * entry["dim"]
+                if offset + size > len(journal_vectors):
+                    return False
+                vectors = journal_vectors[offset : offset + size].reshape(
+                    len(entry["ids"]), entry["dim"]
+                )
+                offset += size
+                self._upsert_rows(
+                    entry["ids"], entry["documents"], vectors, entry["metadatas"]
+                )
+                self._journal_size += len(entry["ids"])
+        return offset == len(journal_vectors)
+
+    def _append_journal(
+        self, entry: Dict[str, Any], vectors: Optional[np.ndarray] = None
+    ) -> None:
+        if self.path is None:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Vectors first: a journal line is only replayed if its vectors exist.
+        if vectors is not None:
+            with open(self.path / JOURNAL_VECTORS_FILE, "ab") as f:
+                f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        with open(self.path / JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._journal_size += len(entry["ids"])
+        if self._journal_size > max(MIN_COMPACTION_ROWS, self._snapshot_rows):
+            self.compact()
+
+    def _write_snapshot(self) -> None:
+        """Save the collection, committing vectors and records in one rename.
+
+        Until the records file is replaced the previous snapshot, and the
+        journal written since, are left intact; a crash before then leaves at
+        most an unreferenced vectors file, removed by the next snapshot.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)  # type: ignore[union-attr]
+        vectors_name = VECTORS_FILE_PATTERN.format(uuid.uuid4().hex)
+        with open(self.path / vectors_name, "wb") as f:  # type: ignore[operator]
+            np.save(
+                f,
+                self._vectors
+                if self._vectors is not None
+                else np.zeros((0, 0), dtype=np.float32),
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        records_tmp = self.path / f"{RECORDS_FILE}.tmp"  # type: ignore[operator]
+        with open(records_tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "ids": self._ids,
+                    "documents": self._documents,
+                    "metadatas": self._metadatas,
+                    "vectors": vectors_name,
+                },
+                f,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(records_tmp, self.path / RECORDS_FILE)  # type: ignore[operator]
+        for stale in self.path.glob("embeddings*.npy"):  # type: ignore[union-attr]
+            if stale.name != vectors_name:
+                try:
+                    stale.unlink()
+                except OSError:
+                    # Still mapped on some platforms; the next snapshot retries.
+                    pass
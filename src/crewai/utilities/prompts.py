@@ -14,17 +14,22 @@ class Prompts(BaseModel):
     prompt_template: Optional[str] = None
     response_template: Optional[str] = None
     use_system_prompt: Optional[bool] = False
+    native_tool_calling: bool = False
     agent: Any
 
     def task_execution(self) -> dict[str, str]:
         """Generate a standard prompt for task execution."""
         slices = ["role_playing"]
-        if len(self.tools) > 0:
+        if len(self.tools) > 0 and self.native_tool_calling:
+            # Tool schemas travel with the request, so no ReAct scaffolding.
+            slices.append("native_tools")
+        elif len(self.tools) > 0:
             slices.append("tools")
         else:
             slices.append("no_tools")
         system = self._build_prompt(slices)
-        slices.append("task")
+        task_slice = "native_task" if slices[-1] == "native_tools" else "task"
+        slices.append(task_slice)
 
         if (
             not self.system_template
@@ -33,7 +38,7 @@ class Prompts(BaseModel):
         ):
             return {
                 "system": system,
-                "user": self._build_prompt(["task"]),
+                "user": self._build_prompt([task_slice]),
                 "prompt": self._build_prompt(slices),
             }
         else:
@@ -58,14 +63,15 @@ class Prompts(BaseModel):
             prompt_parts = [self.i18n.slice(component) for component in components]
             prompt = "".join(prompt_parts)
         else:
+            task_slice = "native_task" if "native_task" in components else "task"
             prompt_parts = [
                 self.i18n.slice(component)
                 for component in components
-                if component != "task"
+                if component != task_slice
             ]
             system = system_template.replace("{{ .System }}", "".join(prompt_parts))
             prompt = prompt_template.replace(
-                "{{ .Prompt }}", "".join(self.i18n.slice("task"))
+                "{{ .Prompt }}", "".join(self.i18n.slice(task_slice))
             )
             response = response_template.split("{{ .Response }}")[0]
             prompt = f"{system}\n{prompt}\n{response}"
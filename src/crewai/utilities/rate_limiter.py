@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+"""Process-wide token-bucket rate limiting for requests and tokens."""
+
+
+class TokenBucket:
+    """Token bucket with continuous refill.
+
+    Reservations are taken immediately and may drive the bucket negative; the
+    returned delay is how long the caller has to wait before its reservation
+    is covered. Callers therefore sleep outside of the lock and are served in
+    the order they reserved.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be positive")
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+    @classmethod
+    def per_minute(cls, limit: int) -> "TokenBucket":
+        return cls(capacity=limit, refill_per_second=limit / 60.0)
+
+    def with_limit(self, limit: int) -> "TokenBucket":
+        """Return a per-minute bucket for ``limit`` that keeps the tokens used so far."""
+        bucket = TokenBucket.per_minute(limit)
+        bucket._tokens = bucket.capacity - (self.capacity - self.tokens)
+        return bucket
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` from the bucket and return the seconds to wait."""
+        self._refill()
+        self._tokens -= amount
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.refill_per_second
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(
+            self.capacity, self._tokens + elapsed * self.refill_per_second
+        )
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budget shared by its callers.
+
+    Request budgets are reserved up front by :meth:`acquire` / :meth:`aacquire`.
+    Token usage is usually only known once a response arrives, so it is
+    debited afterwards with :meth:`record_tokens`; an overdrawn token budget
+    delays the next acquisition until it has refilled.
+    """
+
+    def __init__(self, max_rpm: Optional[int] = None, max_tpm: Optional[int] = None):
+        self._lock = threading.Lock()
+        self.max_rpm: Optional[int] = None
+        self.max_tpm: Optional[int] = None
+        self._requests: Optional[TokenBucket] = None
+        self._tokens: Optional[TokenBucket] = None
+        self.configure(max_rpm=max_rpm, max_tpm=max_tpm)
+
+    def configure(
+        self, max_rpm: Optional[int] = None, max_tpm: Optional[int] = None
+    ) -> None:
+        """Change the limits; a limit that is not given is left as it is.
+
+        The budget already used under the previous limit is carried over, so
+        a new limit never hands out a full bucket.
+        """
+        with self._lock:
+            if max_rpm and max_rpm != self.max_rpm:
+                self.max_rpm = max_rpm
+                self._requests = (
+                    self._requests.with_limit(max_rpm)
+                    if self._requests is not None
+                    else TokenBucket.per_minute(max_rpm)
+                )
+            if max_tpm and max_tpm != self.max_tpm:
+                self.max_tpm = max_tpm
+                self._tokens = (
+                    self._tokens.with_limit(max_tpm)
+                    if self._tokens is not None
+                    else TokenBucket.per_minute(max_tpm)
+                )
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve one request (and ``tokens`` tokens) and return the wait time."""
+        with self._lock:
+            wait = 0.0
+            if self._requests is not None:
+                wait = self._requests.reserve(1)
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.reserve(tokens))
+            return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until a request fits in the budget. Returns the time waited."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Asynchronous counterpart of :meth:`acquire`."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_tokens(self, tokens: int) -> None:
+        """Debit tokens actually consumed by a completed request."""
+        if self._tokens is None or tokens <= 0:
+            return
+        with self._lock:
+            self._tokens.reserve(tokens)
+
+
+_rate_limiters: Dict[Tuple[str, Optional[int], Optional[int]], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str, max_rpm: Optional[int] = None, max_tpm: Optional[int] = None
+) -> RateLimiter:
+    """Return the process-wide limiter for ``key`` (e.g. ``"openai/gpt-4o"``).
+
+    Callers with the same key and limits share one budget. A caller with
+    other limits gets a budget of its own, so a low limit only throttles the
+    callers that set it.
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get((key, max_rpm, max_tpm))
+        if limiter is None:
+            limiter = _rate_limiters[(key, max_rpm, max_tpm)] = RateLimiter(
+                max_rpm=max_rpm, max_tpm=max_tpm
+            )
+    return limiter
+
+
+def rate_limit_key(llm: Any) -> Optional[str]:
+    """Return the ``provider/model`` key of an ``LLM`` or a model name.
+
+    Model names without a provider prefix are OpenAI models. Returns ``None``
+    when ``llm`` has no model name.
+    """
+    model = llm if isinstance(llm, str) else getattr(llm, "model", None)
+    if not isinstance(model, str) or not model:
+        return None
+    return model if "/" in model else f"openai/{model}"
+
+
+def reset_rate_limiters() -> None:
+    """Drop every registered limiter."""
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
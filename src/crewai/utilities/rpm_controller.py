@@ -1,77 +1,74 @@
-import threading
 import time
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from crewai.utilities.logger import Logger
+from crewai.utilities.rate_limiter import (
+    RateLimiter,
+    get_rate_limiter,
+    rate_limit_key,
+)
 
 """Controls request rate limiting for API calls."""
 
 
 class RPMController(BaseModel):
-    """Manages requests per minute limiting."""
+    """Manages requests per minute limiting.
+
+    Requests are admitted from a token bucket that refills continuously, so
+    once the budget is spent a caller only waits until the next request slot
+    frees up instead of for the rest of the minute. Controllers created with
+    the same ``key`` and ``max_rpm`` share one process-wide budget; agents
+    and crews use :meth:`key_for` so that all their controllers for one
+    ``provider/model`` with the same limit do.
+    """
 
     max_rpm: Optional[int] = Field(default=None)
+    key: Optional[str] = Field(
+        default=None,
+        description="Share the budget with every controller using this key and limit.",
+    )
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: Optional[threading.Timer] = PrivateAttr(default=None)
-    _lock: Optional[threading.Lock] = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
+    _limiter: Optional[RateLimiter] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
-    def reset_counter(self):
+    def create_limiter(self):
         if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
+            if self.key:
+                self._limiter = get_rate_limiter(self.key, max_rpm=self.max_rpm)
+            else:
+                self._limiter = RateLimiter(max_rpm=self.max_rpm)
         return self
 
-    def check_or_wait(self):
-        if self.max_rpm is None:
-            return True
+    @staticmethod
+    def key_for(scope: str, llms: Iterable[Any]) -> Optional[str]:
+        """Return the ``scope`` budget key of ``llms`` if they share a ``provider/model``.
+
+        Agents and crews use separate scopes, so an agent's own ``max_rpm``
+        is not tightened by the crew's, and neither shares the limiter of the
+        ``LLM`` itself, which would count every call twice.
+        """
+        keys = {rate_limit_key(llm) for llm in llms}
+        if len(keys) != 1 or None in keys:
+            return None
+        return f"{scope}:{keys.pop()}"
 
-        def _check_and_increment():
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            elif self.max_rpm is not None:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
-                )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
+    def check_or_wait(self):
+        if self._limiter is None:
             return True
 
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
-        else:
-            return _check_and_increment()
+        wait = self._limiter.reserve()
+        if wait > 0:
+            self.logger.log(
+                "info", f"Max RPM reached, waiting {wait:.2f}s for the next slot."
+            )
+            self._wait(wait)
+        return True
 
     def stop_rpm_counter(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self):
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self):
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.start()
+        """Kept for compatibility; the token bucket needs no background timer."""
 
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
+    def _wait(self, seconds: float):
+        time.sleep(seconds)
 
-        if self._timer:
-            self._shutdown_flag = True
-            self._timer.cancel()
@@ -23,6 +23,10 @@ class TokenCalcHandler(CustomLogger):
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", UserWarning)
+            if isinstance(response_obj, dict) and response_obj.get("cache_hit"):
+                # Cached responses cost no provider tokens; only count the hit.
+                self.token_cost_process.sum_cached_responses(1)
+                return
             if isinstance(response_obj, dict) and "usage" in response_obj:
                 usage: Usage = response_obj["usage"]
                 if usage:
@@ -564,7 +564,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         allow_delegation=False,
     )
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         task = Task(
             description="Use tool logic for `get_final_answer` but fon't give you final answer yet, instead keep using it unless you're told to give your final answer",
@@ -576,7 +576,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         )
         assert output == "The final answer is 42."
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting" in captured.out
         moveon.assert_called()
 
 
@@ -610,11 +610,11 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." not in captured.out
+        assert "Max RPM reached, waiting" not in captured.out
         moveon.assert_not_called()
 
 
@@ -669,12 +669,12 @@ def test_agent_without_max_rpm_respects_crew_rpm(capsys):
     # Set crew's max_rpm to 1 to trigger RPM limit
     crew = Crew(agents=[agent1, agent2], tasks=tasks, max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
         assert "get_final_answer" in captured.out
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting" in captured.out
         moveon.assert_called_once()
 
 
@@ -1798,3 +1798,212 @@ def test_litellm_anthropic_error_handling():
 
     # Verify the LLM call was only made once (no retries)
     mock_llm_call.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_agent_aexecute_task_awaits_llm_and_uses_tools():
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="What is 3 times 4?",
+        agent=agent,
+        expected_output="The result of the multiplication.",
+    )
+
+    responses = iter(
+        [
+            'Thought: I need to multiply.\nAction: multiplier\nAction Input: {"first_number": 3, "second_number": 4}',
+            "Thought: I now know the final answer\nFinal Answer: The result of the multiplication is 12.",
+        ]
+    )
+
+    async def fake_acall(messages, callbacks=None, **kwargs):
+        return next(responses)
+
+    with (
+        patch.object(LLM, "acall", side_effect=fake_acall) as acall,
+        patch.object(LLM, "call") as call,
+    ):
+        output = await agent.aexecute_task(task)
+
+    assert output == "The result of the multiplication is 12."
+    assert acall.call_count == 2
+    call.assert_not_called()
+    assert "Observation: 12" in agent.agent_executor.messages[-2]["content"]
+
+
+def test_agent_streamed_step_is_cut_before_a_hallucinated_observation():
+    @tool
+    def get_weather(city: str) -> str:
+        """Useful for when you need the weather in a city."""
+        return "72F"
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm=LLM(model="gpt-4o-mini", stream=True),
+        tools=[get_weather],
+        allow_delegation=False,
+    )
+    task = Task(
+        description="What is the weather in SF?",
+        agent=agent,
+        expected_output="The weather.",
+    )
+
+    streams = iter(
+        [
+            [
+                'Thought: I need the weather\nAction: get_weather\nAction Input: {"city": "SF"}\nObserv',
+                "ation: sun",
+                "ny all week",
+            ],
+            ["Thought: I know it\nFinal Answer: 72F"],
+        ]
+    )
+
+    def fake_call(messages, callbacks=None, stop_condition=None, **kwargs):
+        received = ""
+        for chunk in next(streams):
+            received += chunk
+            if stop_condition(chunk):
+                break
+        return received
+
+    with patch.object(LLM, "call", side_effect=fake_call):
+        output = agent.execute_task(task)
+
+    assert output == "72F"
+    step = agent.agent_executor.messages[-2]["content"]
+    assert 'Action Input: {"city": "SF"}\nObservation: 72F' in step
+    assert "sun" not in step
+
+
+def test_agent_native_tool_calling_reads_structured_tool_calls():
+    from crewai.types.tool_call_result import ToolCallResult
+
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm="gpt-4o-mini",
+        tools=[multiplier],
+        allow_delegation=False,
+        native_tool_calling=True,
+    )
+
+    task = Task(
+        description="What is 3 times 4 and 5 times 6?",
+        agent=agent,
+        expected_output="The results of the multiplications.",
+    )
+
+    responses = iter(
+        [
+            [
+                ToolCallResult(
+                    tool_call_id="call_1",
+                    function_name="multiplier",
+                    arguments={"first_number": 3, "second_number": 4},
+                ),
+                ToolCallResult(
+                    tool_call_id="call_2",
+                    function_name="multiplier",
+                    arguments={"first_number": 5, "second_number": 6},
+                ),
+            ],
+            "3 times 4 is 12 and 5 times 6 is 30.",
+        ]
+    )
+    call_kwargs = []
+
+    def fake_call(messages, callbacks=None, **kwargs):
+        call_kwargs.append(kwargs)
+        return next(responses)
+
+    with patch.object(LLM, "call", side_effect=fake_call):
+        output = agent.execute_task(task)
+
+    assert output == "3 times 4 is 12 and 5 times 6 is 30."
+    assert call_kwargs[0]["execute_tools"] is False
+    schema = call_kwargs[0]["tools"][0]["function"]
+    assert schema["name"] == "multiplier"
+    assert set(schema["parameters"]["properties"]) == {
+        "first_number",
+        "second_number",
+    }
+
+    messages = agent.agent_executor.messages
+    # No ReAct scaffolding in the prompt.
+    assert all("Action Input:" not in message["content"] for message in messages)
+    assert [call["id"] for call in messages[-4]["tool_calls"]] == ["call_1", "call_2"]
+    assert messages[-3] == {"role": "tool", "tool_call_id": "call_1", "content": "12"}
+    assert messages[-2] == {"role": "tool", "tool_call_id": "call_2", "content": "30"}
+    assert messages[-1]["content"] == "3 times 4 is 12 and 5 times 6 is 30."
+
+
+def test_agent_native_tool_calling_falls_back_to_react_without_support():
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        native_tool_calling=True,
+    )
+
+    with patch.object(LLM, "supports_function_calling", return_value=False):
+        agent.create_agent_executor()
+
+    assert agent.agent_executor.native_tool_calling is False
+    assert "Action Input:" in agent.agent_executor.prompt["prompt"]
+
+
+def test_agent_native_tool_calling_disambiguates_colliding_function_names():
+    @tool("get weather")
+    def spaced() -> str:
+        """Weather from the first service."""
+        return "sunny"
+
+    @tool("get_weather")
+    def underscored() -> str:
+        """Weather from the second service."""
+        return "rainy"
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm="gpt-4o-mini",
+        tools=[spaced, underscored],
+        native_tool_calling=True,
+    )
+    agent.create_agent_executor()
+
+    executor = agent.agent_executor
+    names = [schema["function"]["name"] for schema in executor.tool_schemas]
+    assert names == ["get_weather", "get_weather_2"]
+    assert [
+        executor.function_name_to_tool_map[name].name for name in names
+    ] == ["get weather", "get_weather"]
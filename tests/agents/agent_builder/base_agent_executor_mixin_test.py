@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai.agents.agent_builder.base_agent_executor_mixin import (
+    CrewAgentExecutorMixin,
+)
+from crewai.memory.memory_job_queue import MemoryJobQueue
+from crewai.utilities.evaluators.task_evaluator import Entity, TaskEvaluation
+
+
+class Executor(CrewAgentExecutorMixin):
+    def __init__(self, crew, agent, task):
+        self.crew = crew
+        self.agent = agent
+        self.task = task
+
+
+@pytest.fixture
+def evaluation():
+    return TaskEvaluation(
+        suggestions=["Cite sources"],
+        quality=8.0,
+        entities=[
+            Entity(
+                name="CrewAI",
+                type="Company",
+                description="Builds agent frameworks",
+                relationships=["Employs researchers"],
+            )
+        ],
+    )
+
+
+def _executor(sample_rate=1.0, memory_jobs=None, memory_llm=None):
+    crew = SimpleNamespace(
+        memory=True,
+        memory_sample_rate=sample_rate,
+        memory_llm=memory_llm,
+        _memory_jobs=memory_jobs,
+        _long_term_memory=MagicMock(),
+        _entity_memory=MagicMock(),
+    )
+    agent = SimpleNamespace(role="Researcher", llm=MagicMock(name="agent_llm"))
+    task = SimpleNamespace(
+        description="Research AI agents", expected_output="A short report"
+    )
+    return Executor(crew, agent, task)
+
+
+def test_evaluation_runs_on_the_memory_job_queue(evaluation):
+    memory_jobs = MemoryJobQueue(max_concurrency=1)
+    executor = _executor(memory_jobs=memory_jobs)
+
+    with patch(
+        "crewai.agents.agent_builder.base_agent_executor_mixin.TaskEvaluator"
+    ) as evaluator:
+        evaluator.return_value.evaluate.return_value = evaluation
+        executor._create_long_term_memory(SimpleNamespace(text="The report"))
+        memory_jobs.drain()
+
+    evaluator.return_value.evaluate.assert_called_once_with(
+        executor.task, "The report"
+    )
+    executor.crew._long_term_memory.save.assert_called_once()
+    saved = executor.crew._long_term_memory.save.call_args.args[0]
+    assert saved.task == "Research AI agents"
+    assert saved.quality == 8.0
+    executor.crew._entity_memory.save.assert_called_once()
+
+
+def test_evaluation_uses_the_memory_llm(evaluation):
+    memory_llm = MagicMock(name="memory_llm")
+    executor = _executor(memory_llm=memory_llm)
+
+    with patch(
+        "crewai.agents.agent_builder.base_agent_executor_mixin.TaskEvaluator"
+    ) as evaluator:
+        evaluator.return_value.evaluate.return_value = evaluation
+        executor._create_long_term_memory(SimpleNamespace(text="The report"))
+
+    evaluator.assert_called_once_with(executor.agent, llm=memory_llm)
+
+
+def test_unsampled_tasks_are_not_evaluated():
+    executor = _executor(sample_rate=0.25)
+
+    with (
+        patch(
+            "crewai.agents.agent_builder.base_agent_executor_mixin.TaskEvaluator"
+        ) as evaluator,
+        patch(
+            "crewai.agents.agent_builder.base_agent_executor_mixin.random.random",
+            return_value=0.5,
+        ),
+    ):
+        executor._create_long_term_memory(SimpleNamespace(text="The report"))
+
+    evaluator.assert_not_called()
+    executor.crew._long_term_memory.save.assert_not_called()
+
+
+def test_task_evaluator_defaults_to_the_agent_llm():
+    from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
+
+    agent = SimpleNamespace(llm=MagicMock(name="agent_llm"))
+    memory_llm = MagicMock(name="memory_llm")
+
+    assert TaskEvaluator(agent).llm is agent.llm
+    assert TaskEvaluator(agent, llm=memory_llm).llm is memory_llm
+
+
+def test_evaluation_failures_are_logged(caplog):
+    executor = _executor()
+
+    with patch(
+        "crewai.agents.agent_builder.base_agent_executor_mixin.TaskEvaluator"
+    ) as evaluator:
+        evaluator.return_value.evaluate.side_effect = RuntimeError("LLM down")
+        executor._create_long_term_memory(SimpleNamespace(text="The report"))
+
+    assert "Failed to add to long term memory: LLM down" in caplog.text
+    executor.crew._long_term_memory.save.assert_not_called()
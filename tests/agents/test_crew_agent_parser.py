@@ -378,3 +378,52 @@ class MockAgent:
 
 
 # TODO: ADD TEST TO MAKE SURE ** REMOVAL DOESN'T MESS UP ANYTHING
+
+
+def _feed_all(incremental_parser, text, size=3):
+    for start in range(0, len(text), size):
+        if incremental_parser.feed(text[start : start + size]):
+            return start + size
+    return None
+
+
+def test_incremental_parser_stops_at_hallucinated_observation():
+    from crewai.agents.parser import IncrementalCrewAgentParser
+
+    incremental_parser = IncrementalCrewAgentParser(MockAgent())
+    text = (
+        "Thought: I should search\nAction: search\nAction Input: weather in SF\n"
+        "Observation: It is sunny\nThought: I now know the final answer"
+    )
+    consumed = _feed_all(incremental_parser, text)
+
+    assert consumed is not None and consumed < len(text)
+    assert "Observation" not in incremental_parser.text
+    result = incremental_parser.parse()
+    assert isinstance(result, AgentAction)
+    assert result.tool == "search"
+    assert incremental_parser.text.endswith("Action Input: weather in SF")
+
+
+def test_incremental_parser_stops_when_json_action_input_is_complete():
+    from crewai.agents.parser import IncrementalCrewAgentParser
+
+    incremental_parser = IncrementalCrewAgentParser(MockAgent())
+    text = 'Thought: Multiply\nAction: multiplier\nAction Input: {"a": 3, "b": {"c": 4}}\nmore'
+
+    consumed = _feed_all(incremental_parser, text, size=1)
+
+    assert consumed == text.index("}}") + 2
+    assert isinstance(incremental_parser.parse(), AgentAction)
+
+
+def test_incremental_parser_never_stops_on_final_answer():
+    from crewai.agents.parser import IncrementalCrewAgentParser
+
+    incremental_parser = IncrementalCrewAgentParser(MockAgent())
+    text = "Thought: Done\nFinal Answer: Action Input: {} is literally the answer"
+
+    assert _feed_all(incremental_parser, text) is None
+    assert incremental_parser.has_final_answer
+    result = incremental_parser.parse()
+    assert isinstance(result, AgentFinish)
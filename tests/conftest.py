@@ -35,3 +35,13 @@ def setup_test_environment():
         yield
         
         # Cleanup is handled automatically when tempfile context exits
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_rate_limiters():
+    """Keep the process-wide rate limit budgets from leaking between tests."""
+    from crewai.utilities.rate_limiter import reset_rate_limiters
+
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
@@ -1,5 +1,6 @@
 """Test Agent creation and execution basic functionality."""
 
+import asyncio
 import hashlib
 import json
 from concurrent.futures import Future
@@ -940,11 +941,11 @@ def test_api_calls_throttling(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting" in captured.out
         moveon.assert_called()
 
 
@@ -1376,6 +1377,153 @@ async def test_kickoff_async_basic_functionality_and_output():
         mock_kickoff.assert_called_once_with(inputs)
 
 
+def _topic_crew():
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="1 bullet point about {topic} that's under 15 words.",
+        agent=agent,
+    )
+    return Crew(agents=[agent], tasks=[task])
+
+
+def test_kickoff_for_each_concurrent_keeps_input_order_and_aggregates_usage():
+    import threading
+    import time
+
+    inputs = [{"topic": "dog"}, {"topic": "cat"}, {"topic": "apple"}]
+    delays = {"dog": 0.2, "cat": 0.1, "apple": 0.0}
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_kickoff(self, inputs=None):
+        with lock:
+            running.append(inputs["topic"])
+            peak.append(len(running))
+        time.sleep(delays[inputs["topic"]])
+        with lock:
+            running.remove(inputs["topic"])
+        self.usage_metrics = UsageMetrics(total_tokens=10, successful_requests=1)
+        return inputs["topic"]
+
+    crew = _topic_crew()
+    with patch.object(Crew, "kickoff", autospec=True, side_effect=fake_kickoff):
+        results = crew.kickoff_for_each(inputs=inputs, max_concurrency=2)
+        completion_order = [
+            result
+            for _, result in crew.kickoff_for_each_iter(
+                inputs=inputs, max_concurrency=3, ordered=False
+            )
+        ]
+
+    assert results == ["dog", "cat", "apple"]
+    assert completion_order == ["apple", "cat", "dog"]
+    assert max(peak) <= 3
+    assert crew.usage_metrics.total_tokens == 30
+    assert crew.usage_metrics.successful_requests == 3
+
+
+def test_kickoff_for_each_isolates_failures_with_return_exceptions():
+    def fake_kickoff(self, inputs=None):
+        if inputs["topic"] == "cat":
+            raise ValueError("cat failed")
+        return inputs["topic"]
+
+    crew = _topic_crew()
+    inputs = [{"topic": "dog"}, {"topic": "cat"}, {"topic": "apple"}]
+    with patch.object(Crew, "kickoff", autospec=True, side_effect=fake_kickoff):
+        results = crew.kickoff_for_each(
+            inputs=inputs, max_concurrency=2, return_exceptions=True
+        )
+        with pytest.raises(ValueError, match="cat failed"):
+            crew.kickoff_for_each(inputs=inputs, max_concurrency=2)
+
+    assert results[0] == "dog"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == "apple"
+
+
+def test_kickoff_for_each_with_async_tasks_does_not_exhaust_the_shared_pool():
+    from crewai.utilities.concurrency import DEFAULT_MAX_WORKERS, set_max_workers
+
+    agent = Agent(role="{topic} Researcher", goal="Research {topic}.", backstory="x")
+    crew = Crew(
+        agents=[agent],
+        tasks=[
+            Task(
+                description="Research {topic}.",
+                expected_output="Notes",
+                agent=agent,
+                async_execution=True,
+            ),
+            Task(description="Summarize {topic}.", expected_output="Summary", agent=agent),
+        ],
+    )
+
+    set_max_workers(2)
+    try:
+        with patch.object(Agent, "execute_task", return_value="done"):
+            results = crew.kickoff_for_each(
+                inputs=[{"topic": "dog"}, {"topic": "cat"}], max_concurrency=2
+            )
+    finally:
+        set_max_workers(DEFAULT_MAX_WORKERS)
+
+    assert [result.raw for result in results] == ["done", "done"]
+
+
+def test_kickoff_for_each_async_backend():
+    async def fake_kickoff_async(self, inputs=None):
+        return inputs["topic"]
+
+    crew = _topic_crew()
+    with patch.object(
+        Crew, "kickoff_async", autospec=True, side_effect=fake_kickoff_async
+    ):
+        results = crew.kickoff_for_each(
+            inputs=[{"topic": "dog"}, {"topic": "cat"}],
+            max_concurrency=2,
+            backend="async",
+        )
+
+    assert results == ["dog", "cat"]
+
+
+def test_kickoff_for_each_process_backend_requires_crew_base():
+    crew = _topic_crew()
+    with pytest.raises(ValueError, match="@CrewBase"):
+        crew.kickoff_for_each(inputs=[{"topic": "dog"}], backend="process")
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_async_limits_concurrency():
+    running = 0
+    peak = 0
+
+    async def fake_kickoff_async(self, inputs=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return inputs["topic"]
+
+    crew = _topic_crew()
+    inputs = [{"topic": str(i)} for i in range(6)]
+    with patch.object(
+        Crew, "kickoff_async", autospec=True, side_effect=fake_kickoff_async
+    ):
+        results = await crew.kickoff_for_each_async(inputs, max_concurrency=2)
+
+    assert results == [str(i) for i in range(6)]
+    assert peak == 2
+
+
 @pytest.mark.asyncio
 async def test_async_kickoff_for_each_async_basic_functionality_and_output():
     """Tests the basic functionality and output of kickoff_for_each_async."""
@@ -2347,6 +2495,87 @@ def test_using_contextual_memory():
         contextual_mem.assert_called_once()
 
 
+def test_memory_evaluation_settings():
+    researcher = Agent(
+        role="Researcher",
+        goal="You research about math.",
+        backstory="You're an expert in research and you love to learn new things.",
+    )
+    task = Task(
+        description="Research a topic to teach a kid aged 6 about math.",
+        expected_output="A topic, explanation, angle, and examples.",
+        agent=researcher,
+    )
+
+    crew = Crew(
+        agents=[researcher],
+        tasks=[task],
+        memory=True,
+        memory_llm="gpt-4o-mini",
+        memory_max_concurrency=3,
+    )
+
+    assert isinstance(crew.memory_llm, LLM)
+    assert crew.memory_llm.model == "gpt-4o-mini"
+    assert crew._memory_jobs.max_concurrency == 3
+    assert Crew(agents=[researcher], tasks=[task])._memory_jobs is None
+
+
+def test_memory_context_cache_is_cleared_when_a_task_ends():
+    researcher = Agent(
+        role="Researcher",
+        goal="You research about math.",
+        backstory="You're an expert in research and you love to learn new things.",
+    )
+    task = Task(
+        description="Research a topic to teach a kid aged 6 about math.",
+        expected_output="A topic, explanation, angle, and examples.",
+        agent=researcher,
+    )
+    crew = Crew(agents=[researcher], tasks=[task])
+    crew._memory_context_cache[("_fetch_stm_context", "math")] = "Recent Insights"
+
+    crew._process_task_result(
+        task, TaskOutput(description=task.description, raw="done", agent="Researcher")
+    )
+
+    assert crew._memory_context_cache == {}
+
+
+@pytest.mark.parametrize("drain_on_exit", [False, True])
+def test_kickoff_drains_pending_memory_jobs(drain_on_exit):
+    import threading
+
+    researcher = Agent(
+        role="Researcher",
+        goal="You research about math.",
+        backstory="You're an expert in research and you love to learn new things.",
+    )
+    task = Task(
+        description="Research a topic to teach a kid aged 6 about math.",
+        expected_output="A topic, explanation, angle, and examples.",
+        agent=researcher,
+    )
+    crew = Crew(
+        agents=[researcher],
+        tasks=[task],
+        memory=True,
+        memory_drain_on_exit=drain_on_exit,
+    )
+    release = threading.Event()
+
+    def run_process():
+        crew._memory_jobs.submit(release.wait, 0.2)
+        return "done"
+
+    with patch.object(Crew, "_run_sequential_process", side_effect=run_process):
+        crew.kickoff()
+
+    assert crew._memory_jobs.pending == (1 if drain_on_exit else 0)
+    release.set()
+    crew._memory_jobs.drain()
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_disabled_memory_using_contextual_memory():
     from unittest.mock import patch
@@ -3973,3 +4202,129 @@ def test_crew_with_knowledge_sources_works_with_copy():
     assert crew_copy.knowledge_sources == crew.knowledge_sources
     assert len(crew_copy.agents) == len(crew.agents)
     assert len(crew_copy.tasks) == len(crew.tasks)
+
+
+def test_graph_process_runs_ready_tasks_concurrently_along_context_edges():
+    import threading
+
+    editor = Agent(role="Editor", goal="Edit", backstory="Editor", allow_delegation=False)
+    first = Task(description="First", expected_output="First", agent=researcher)
+    second = Task(description="Second", expected_output="Second", agent=writer)
+    third = Task(
+        description="Third", expected_output="Third", agent=editor, context=[first]
+    )
+    final = Task(
+        description="Final",
+        expected_output="Final",
+        agent=writer,
+        context=[second, third],
+    )
+
+    # Both root tasks must be running at the same time to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    contexts = {}
+
+    def execute_task(task, context=None, tools=None):
+        contexts[task.description] = context
+        if task.description in ("First", "Second"):
+            barrier.wait()
+        return f"{task.description} output"
+
+    crew = Crew(
+        agents=[researcher, writer, editor],
+        tasks=[first, second, third, final],
+        process=Process.graph,
+    )
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        result = crew.kickoff()
+
+    assert result.raw == "Final output"
+    assert [output.raw for output in result.tasks_output] == [
+        "First output",
+        "Second output",
+        "Third output",
+        "Final output",
+    ]
+    assert contexts["First"] == ""
+    assert contexts["Third"] == "First output"
+    assert contexts["Final"] == "Second output\n\n----------\n\nThird output"
+    stored = crew._task_output_handler.load()
+    assert [log["task_index"] for log in stored] == [0, 1, 2, 3]
+
+
+def test_graph_process_runs_one_task_at_a_time_per_agent():
+    import threading
+
+    first = Task(description="First", expected_output="First", agent=researcher)
+    second = Task(description="Second", expected_output="Second", agent=researcher)
+
+    active = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def execute_task(task, context=None, tools=None):
+        with lock:
+            active.append(task.description)
+            overlaps.append(len(active))
+        threading.Event().wait(0.05)
+        with lock:
+            active.remove(task.description)
+        return f"{task.description} output"
+
+    crew = Crew(agents=[researcher], tasks=[first, second], process=Process.graph)
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        result = crew.kickoff()
+
+    assert max(overlaps) == 1
+    assert result.raw == "Second output"
+
+
+def test_graph_process_skips_conditional_task_based_on_its_context():
+    first = Task(description="First", expected_output="First", agent=researcher)
+    conditional = ConditionalTask(
+        description="Conditional",
+        expected_output="Conditional",
+        agent=writer,
+        context=[first],
+        condition=lambda output: "go" in output.raw,
+    )
+
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=[first, conditional],
+        process=Process.graph,
+    )
+
+    with patch.object(Agent, "execute_task", return_value="stop") as execute_task:
+        result = crew.kickoff()
+
+    assert execute_task.call_count == 1
+    assert result.tasks_output[1].raw == ""
+    assert result.raw == "stop"
+
+
+def test_async_task_failure_propagates_from_kickoff():
+    failing = Task(
+        description="Failing",
+        expected_output="Failing",
+        agent=researcher,
+        async_execution=True,
+    )
+    final = Task(description="Final", expected_output="Final", agent=writer)
+
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=[failing, final],
+        max_parallel_tasks=2,
+    )
+
+    def execute_task(task, context=None, tools=None):
+        if task.description == "Failing":
+            raise RuntimeError("async task failed")
+        return "done"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        with pytest.raises(RuntimeError, match="async task failed"):
+            crew.kickoff()
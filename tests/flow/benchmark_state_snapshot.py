@@ -0,0 +1,82 @@
+"""Per-method overhead of flow state snapshots against state size.
+
+Runs a twenty-step flow whose state holds ``N`` documents with 384-dimension
+embeddings and reports the time spent per method with no event handlers,
+with a handler using the structurally shared snapshots, and with the
+``copy.deepcopy`` snapshots flows used to take. The first shared snapshot
+copies the whole state; later ones only copy the ``step`` counter:
+
+    python tests/flow/benchmark_state_snapshot.py
+"""
+
+import copy
+import time
+from typing import List
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from crewai.flow.flow import Flow, listen, start
+from crewai.utilities.events import (
+    MethodExecutionFinishedEvent,
+    MethodExecutionStartedEvent,
+)
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+
+STEPS = 20
+DIMENSIONS = 384
+
+
+class BenchmarkState(BaseModel):
+    documents: List[str] = []
+    embeddings: List[List[float]] = []
+    step: int = 0
+
+
+def make_step(index):
+    def step(self):
+        self.state.step += 1
+
+    step.__name__ = f"step_{index}"
+    return step
+
+
+def make_flow_class():
+    methods = {"step_0": start()(make_step(0))}
+    for i in range(1, STEPS):
+        methods[f"step_{i}"] = listen(f"step_{i - 1}")(make_step(i))
+    return type("BenchmarkFlow", (Flow[BenchmarkState],), methods)
+
+
+def per_method_ms(flow_class, size: int) -> float:
+    flow = flow_class()
+    flow.state.documents = [f"document {i} " * 20 for i in range(size)]
+    flow.state.embeddings = [[float(i)] * DIMENSIONS for i in range(size)]
+    started = time.perf_counter()
+    flow.kickoff()
+    return (time.perf_counter() - started) * 1000 / STEPS
+
+
+def main() -> None:
+    flow_class = make_flow_class()
+    print(f"{'documents':>10} {'no handlers':>12} {'shared':>10} {'deepcopy':>10}")
+    for size in (0, 100, 1_000, 2_000):
+        with crewai_event_bus.scoped_handlers():
+            quiet = per_method_ms(flow_class, size)
+
+            crewai_event_bus.register_handler(
+                MethodExecutionStartedEvent, lambda source, event: None
+            )
+            crewai_event_bus.register_handler(
+                MethodExecutionFinishedEvent, lambda source, event: None
+            )
+            shared = per_method_ms(flow_class, size)
+            with patch.object(
+                flow_class, "_copy_state", lambda self: copy.deepcopy(self._state)
+            ):
+                deep = per_method_ms(flow_class, size)
+        print(f"{size:>10} {quiet:>10.2f}ms {shared:>8.2f}ms {deep:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
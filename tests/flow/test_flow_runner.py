@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from crewai.flow.flow import Flow, and_, listen, start
+from crewai.flow.runner import FlowRunner
+
+
+class TopicFlow(Flow):
+    @start()
+    def fetch(self):
+        time.sleep(0.1 * self.state.get("delay", 1))
+        self.state["fetched"] = self.state["topic"]
+        return threading.current_thread().name
+
+    @listen(fetch)
+    def outline(self):
+        return f"outline of {self.state['fetched']}"
+
+    @listen(and_(fetch, outline))
+    def report(self):
+        return {"topic": self.state["topic"], "outputs": len(self.method_outputs)}
+
+
+class FailingFlow(Flow):
+    @start()
+    def begin(self):
+        if self.state["fail"]:
+            raise ValueError("failed run")
+        return "ok"
+
+
+def test_kickoff_many_isolates_instances_and_keeps_input_order():
+    topics = [f"topic {i}" for i in range(8)]
+
+    started = time.perf_counter()
+    results = TopicFlow.kickoff_many([{"topic": topic} for topic in topics])
+
+    assert time.perf_counter() - started < 0.6
+    assert [result["topic"] for result in results] == topics
+    assert all(result["outputs"] == 2 for result in results)
+
+
+def test_kickoff_many_respects_max_concurrency():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    class CountingFlow(Flow):
+        @start()
+        def work(self):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+    CountingFlow.kickoff_many([{}] * 6, max_concurrency=2)
+
+    assert max(peak) == 2
+
+
+def test_runner_yields_results_as_they_complete():
+    with FlowRunner(TopicFlow) as runner:
+        order = [
+            index
+            for index, _ in runner.as_completed(
+                [{"topic": "slow", "delay": 3}, {"topic": "fast", "delay": 0}]
+            )
+        ]
+
+    assert order == [1, 0]
+
+
+def test_runner_reuses_one_loop_and_a_shared_executor():
+    loops = set()
+
+    class LoopFlow(Flow):
+        @start()
+        async def begin(self):
+            loops.add(id(asyncio.get_running_loop()))
+
+        @listen(begin)
+        def sync_step(self):
+            return self._method_executor
+
+    with FlowRunner(LoopFlow, max_parallel_methods=2) as runner:
+        executors = {id(runner.kickoff()) for _ in range(3)}
+        executors |= {id(result) for result in runner.kickoff_many([{}, {}])}
+
+    assert len(loops) == 1
+    assert len(executors) == 1
+    assert runner._executor._max_workers == 2
+    with pytest.raises(RuntimeError):
+        runner.submit({})
+
+
+def test_runner_returns_or_raises_failures():
+    with FlowRunner(FailingFlow) as runner:
+        results = runner.kickoff_many(
+            [{"fail": False}, {"fail": True}], return_exceptions=True
+        )
+        with pytest.raises(ValueError, match="failed run"):
+            runner.kickoff_many([{"fail": True}])
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_runner_and_kickoff_work_inside_a_running_loop():
+    with FlowRunner(TopicFlow) as runner:
+        result = await runner.kickoff_async({"topic": "api", "delay": 0})
+    assert result["topic"] == "api"
+
+    flow = TopicFlow()
+    assert flow.kickoff({"topic": "nested", "delay": 0})["topic"] == "nested"
+
+    results = await TopicFlow.kickoff_many_async(
+        [{"topic": "a", "delay": 0}, {"topic": "b", "delay": 0}], max_concurrency=1
+    )
+    assert [result["topic"] for result in results] == ["a", "b"]
+
+
+def test_kickoff_on_the_background_loop_raises_instead_of_hanging():
+    class Inner(Flow):
+        @start()
+        def begin(self):
+            return "inner"
+
+    class Outer(Flow):
+        @start()
+        async def begin(self):
+            return Inner().kickoff()
+
+    async def main():
+        # The outer flow runs on the background loop; the nested blocking
+        # kickoff would wait on that same loop forever.
+        return Outer().kickoff()
+
+    with pytest.raises(RuntimeError, match="kickoff_async"):
+        asyncio.run(asyncio.wait_for(main(), timeout=10))
@@ -0,0 +1,128 @@
+from typing import List
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from crewai.flow.flow import Flow, listen, start
+from crewai.flow.state_snapshot import StateSnapshotter
+from crewai.utilities.events import MethodExecutionFinishedEvent
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+
+
+class DocumentState(BaseModel):
+    id: str = "flow"
+    documents: List[str] = []
+    embeddings: List[List[float]] = []
+    step: int = 0
+
+
+def test_unchanged_fields_are_shared_between_snapshots():
+    snapshotter = StateSnapshotter()
+    state = {"documents": ["a", "b"], "embeddings": [[0.1, 0.2]], "step": 0}
+
+    first = snapshotter.snapshot(state)
+    state["step"] = 1
+    second = snapshotter.snapshot(state)
+
+    assert second == {"documents": ["a", "b"], "embeddings": [[0.1, 0.2]], "step": 1}
+    assert second["embeddings"] is first["embeddings"]
+    assert second["documents"] is not state["documents"]
+    assert first["step"] == 0
+
+
+def test_fields_mutated_in_place_are_copied_again():
+    snapshotter = StateSnapshotter()
+    state = {"documents": ["a"]}
+
+    first = snapshotter.snapshot(state)
+    state["documents"].append("b")
+    second = snapshotter.snapshot(state)
+
+    assert first["documents"] == ["a"]
+    assert second["documents"] == ["a", "b"]
+    assert second["documents"] is not first["documents"]
+
+
+def test_model_snapshots_keep_the_model_type():
+    snapshotter = StateSnapshotter()
+    state = DocumentState(documents=["a"], embeddings=[[1.0]])
+
+    first = snapshotter.snapshot(state)
+    state.step = 2
+    state.documents.append("b")
+    second = snapshotter.snapshot(state)
+
+    assert isinstance(second, DocumentState)
+    assert first.step == 0 and first.documents == ["a"]
+    assert second.step == 2 and second.documents == ["a", "b"]
+    assert second.embeddings is first.embeddings
+    assert second.model_fields_set == state.model_fields_set
+
+
+def test_values_that_cannot_be_compared_are_always_copied():
+    class Matrix:
+        def __eq__(self, other):
+            raise ValueError("ambiguous")
+
+    snapshotter = StateSnapshotter()
+    state = {"matrix": Matrix()}
+
+    first = snapshotter.snapshot(state)
+    second = snapshotter.snapshot(state)
+
+    assert second["matrix"] is not first["matrix"]
+
+
+def test_flow_skips_snapshots_without_handlers():
+    class QuietFlow(Flow):
+        @start()
+        def begin(self):
+            self.state["value"] = 1
+
+    flow = QuietFlow()
+    with crewai_event_bus.scoped_handlers():
+        with patch.object(StateSnapshotter, "snapshot") as snapshot:
+            flow.kickoff()
+
+    snapshot.assert_not_called()
+
+
+def test_flow_events_receive_snapshots_of_the_state():
+    class DocumentFlow(Flow[DocumentState]):
+        @start()
+        def load(self):
+            self.state.documents = ["doc"] * 100
+            self.state.embeddings = [[0.5] * 8] * 100
+
+        @listen(load)
+        def count(self):
+            self.state.step = len(self.state.documents)
+
+    received = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def handle(source, event):
+            received.append(event.state)
+
+        flow = DocumentFlow()
+        flow.kickoff()
+
+    assert [state.step for state in received] == [0, 100]
+    assert received[1].embeddings is received[0].embeddings
+    assert received[1].embeddings is not flow.state.embeddings
+    assert received[1] is not flow.state
+
+
+def test_nested_changes_between_equal_numbers_and_bools_are_copied():
+    snapshotter = StateSnapshotter()
+    state = {"flags": [0, 1.0], "nested": {"count": 1}}
+
+    first = snapshotter.snapshot(state)
+    state["flags"][0] = False
+    state["nested"]["count"] = True
+    second = snapshotter.snapshot(state)
+
+    assert type(second["flags"][0]) is bool and type(second["flags"][1]) is float
+    assert second["nested"]["count"] is True
+    assert first["flags"][0] == 0 and type(first["flags"][0]) is int
@@ -6,7 +6,7 @@ from datetime import datetime
 import pytest
 from pydantic import BaseModel
 
-from crewai.flow.flow import Flow, and_, listen, or_, router, start
+from crewai.flow.flow import Flow, and_, concurrency, listen, or_, router, start
 from crewai.utilities.events import (
     FlowFinishedEvent,
     FlowStartedEvent,
@@ -755,3 +755,230 @@ def test_multiple_routers_from_same_trigger():
     assert execution_order.index("anemia_analysis") > execution_order.index(
         "anemia_router"
     )
+
+
+def test_flow_meta_indexes_listeners_by_trigger():
+    """Test that FlowMeta precomputes the trigger index and listener arity."""
+
+    class IndexedFlow(Flow):
+        @start()
+        def begin(self):
+            return "begun"
+
+        @listen(begin)
+        def takes_result(self, result):
+            return result
+
+        @listen(and_(begin, takes_result))
+        def after_both(self):
+            pass
+
+        @router(begin)
+        def route(self):
+            return "done"
+
+    assert IndexedFlow._trigger_index["begin"] == (
+        ["route"],
+        ["takes_result", "after_both"],
+    )
+    assert IndexedFlow._trigger_index["takes_result"] == ([], ["after_both"])
+    assert IndexedFlow._listener_params == {
+        "takes_result": 1,
+        "after_both": 0,
+        "route": 0,
+    }
+
+
+def test_large_generated_flow_dispatches_without_inspecting_signatures():
+    """Test a 300-method chain runs from the precomputed index."""
+    from unittest.mock import patch
+
+    def make_step(index):
+        def step(self, previous=None):
+            return index
+
+        step.__name__ = f"step_{index}"
+        return step
+
+    methods = {"step_0": start()(make_step(0))}
+    for i in range(1, 300):
+        methods[f"step_{i}"] = listen(f"step_{i - 1}")(make_step(i))
+    ChainFlow = type("ChainFlow", (Flow,), methods)
+
+    flow = ChainFlow()
+    with patch("crewai.flow.flow.inspect.signature") as signature:
+        result = flow.kickoff()
+
+    signature.assert_not_called()
+    assert result == 299
+    assert len(flow.method_outputs) == 300
+
+
+def test_sync_listeners_run_in_parallel_on_the_flow_executor():
+    """Test that sync listeners of one trigger overlap instead of queueing."""
+    import threading
+    import time
+
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def work(self):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.2)
+        with lock:
+            active.pop()
+        return threading.current_thread().name
+
+    methods = {"begin": start()(lambda self: "begun")}
+    for i in range(5):
+        methods[f"worker_{i}"] = listen("begin")(work)
+    ParallelFlow = type("ParallelFlow", (Flow,), methods)
+
+    flow = ParallelFlow()
+    started = time.perf_counter()
+    flow.kickoff()
+
+    assert time.perf_counter() - started < 0.8
+    assert max(peak) == 5
+    assert all(name.startswith("crewai-flow") for name in flow.method_outputs[1:])
+    assert flow._method_executor is None
+
+
+def test_max_parallel_methods_and_per_method_limits():
+    """Test the flow-wide and per-method limits on parallel sync methods."""
+    import threading
+    import time
+
+    peaks = {"flow": [], "limited": []}
+    active = {"flow": 0, "limited": 0}
+    lock = threading.Lock()
+
+    def track(*keys):
+        with lock:
+            for key in keys:
+                active[key] += 1
+                peaks[key].append(active[key])
+        time.sleep(0.05)
+        with lock:
+            for key in keys:
+                active[key] -= 1
+
+    class LimitedFlow(Flow):
+        max_parallel_methods = 2
+
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin)
+        def first(self):
+            track("flow")
+
+        @listen(begin)
+        def second(self):
+            track("flow")
+
+        @listen(begin)
+        def third(self):
+            track("flow")
+
+    class SerialFlow(Flow):
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin)
+        @concurrency(max_parallel=1)
+        def limited(self):
+            track("limited")
+
+        @listen(begin)
+        def other(self):
+            pass
+
+    LimitedFlow().kickoff()
+    assert max(peaks["flow"]) == 2
+
+    flow = SerialFlow()
+    flow.kickoff()
+    assert SerialFlow._method_concurrency == {"limited": (1, True)}
+    assert max(peaks["limited"]) == 1
+
+
+def test_concurrency_offload_false_runs_on_the_event_loop_thread():
+    """Test that offload=False keeps a sync method on the loop thread."""
+    import threading
+
+    class InlineFlow(Flow):
+        @start()
+        @concurrency(offload=False)
+        def begin(self):
+            return threading.current_thread().name
+
+        @listen(begin)
+        def offloaded(self):
+            return threading.current_thread().name
+
+    flow = InlineFlow()
+    flow.kickoff()
+
+    assert not flow.method_outputs[0].startswith("crewai-flow")
+    assert flow.method_outputs[1].startswith("crewai-flow")
+    with pytest.raises(ValueError):
+        concurrency(max_parallel=0)
+
+
+def test_parallel_outputs_keep_the_order_methods_started_in():
+    """Test that a slow listener keeps its output position and the final output."""
+    import time
+
+    class OrderedFlow(Flow):
+        @start()
+        def begin(self):
+            return "begin"
+
+        @listen(begin)
+        def slow(self):
+            time.sleep(0.1)
+            return "slow"
+
+        @listen(begin)
+        def fast(self):
+            return "fast"
+
+    flow = OrderedFlow()
+    result = flow.kickoff()
+
+    assert flow.method_outputs == ["begin", "slow", "fast"]
+    assert result == "fast"
+
+
+def test_router_path_comes_from_the_router_not_the_last_output():
+    """Test routing with parallel siblings appending outputs meanwhile."""
+    import time
+
+    class RacingFlow(Flow):
+        @start()
+        def begin(self):
+            pass
+
+        @router(begin)
+        def route(self):
+            return "chosen"
+
+        @listen(begin)
+        def slow_sibling(self):
+            time.sleep(0.05)
+            return "sibling"
+
+        @listen("chosen")
+        def on_chosen(self):
+            return "routed"
+
+    flow = RacingFlow()
+    flow.kickoff()
+
+    assert "routed" in flow.method_outputs
@@ -0,0 +1,285 @@
+"""Test incremental and streaming knowledge ingestion."""
+
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
+from crewai.knowledge.source.streaming_file_knowledge_source import (
+    StreamingFileKnowledgeSource,
+)
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.embedding_cache import get_embedding_cache
+
+
+class CountingEmbeddingFunction(EmbeddingFunction):
+    def __init__(self):
+        self.embedded: List[str] = []
+        self.batches: List[int] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.embedded.extend(input)
+        self.batches.append(len(input))
+        return [[float(len(text)), 1.0, 0.0] for text in input]
+
+
+@pytest.fixture(autouse=True)
+def clean_embedding_cache():
+    get_embedding_cache().clear()
+    yield
+    get_embedding_cache().clear()
+
+
+@pytest.fixture
+def storage_dir(tmp_path):
+    with patch(
+        "crewai.knowledge.storage.knowledge_storage.db_storage_path",
+        return_value=str(tmp_path),
+    ):
+        yield tmp_path
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbeddingFunction()
+
+
+def build_knowledge(embedder, sources):
+    return Knowledge(
+        collection_name="manifest_test",
+        sources=sources,
+        embedder={"provider": "custom", "config": {"embedder": embedder}},
+    )
+
+
+def write(path: Path, content: str) -> Path:
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_unchanged_sources_are_not_embedded_again(storage_dir, embedder, tmp_path):
+    file_path = write(tmp_path / "facts.txt", "Brandon likes basketball.")
+
+    build_knowledge(
+        embedder,
+        [
+            TextFileKnowledgeSource(file_paths=[file_path]),
+            StringKnowledgeSource(content="Brandon is 30 years old."),
+        ],
+    )
+    assert len(embedder.embedded) == 2
+
+    knowledge = build_knowledge(
+        embedder,
+        [
+            TextFileKnowledgeSource(file_paths=[file_path]),
+            StringKnowledgeSource(content="Brandon is 30 years old."),
+        ],
+    )
+    assert len(embedder.embedded) == 2
+    assert knowledge.storage.collection.count() == 2
+    assert all(source.chunks == [] for source in knowledge.sources)
+
+
+def test_changed_file_only_replaces_its_new_chunks(storage_dir, embedder, tmp_path):
+    file_path = write(tmp_path / "facts.txt", "a" * 10 + "b" * 10)
+    other_path = write(tmp_path / "other.txt", "Unrelated.")
+    source_kwargs = {"chunk_size": 10, "chunk_overlap": 0}
+
+    build_knowledge(
+        embedder,
+        [TextFileKnowledgeSource(file_paths=[file_path, other_path], **source_kwargs)],
+    )
+    assert embedder.embedded == ["a" * 10, "b" * 10, "Unrelated."]
+
+    write(file_path, "a" * 10 + "c" * 10)
+    knowledge = build_knowledge(
+        embedder,
+        [TextFileKnowledgeSource(file_paths=[file_path, other_path], **source_kwargs)],
+    )
+
+    assert embedder.embedded[3:] == ["c" * 10]
+    stored = knowledge.storage.collection.get()["documents"]
+    assert sorted(stored) == sorted(["a" * 10, "c" * 10, "Unrelated."])
+
+
+def test_deleted_sources_are_removed(storage_dir, embedder, tmp_path):
+    kept = write(tmp_path / "kept.txt", "Kept fact.")
+    dropped = write(tmp_path / "dropped.txt", "Dropped fact.")
+
+    build_knowledge(embedder, [TextFileKnowledgeSource(file_paths=[kept, dropped])])
+    knowledge = build_knowledge(embedder, [TextFileKnowledgeSource(file_paths=[kept])])
+
+    assert knowledge.storage.collection.get()["documents"] == ["Kept fact."]
+    assert len(knowledge.storage.manifest.entries) == 1
+
+
+def test_touched_file_with_same_content_is_skipped(storage_dir, embedder, tmp_path):
+    import os
+
+    file_path = write(tmp_path / "facts.txt", "Brandon likes basketball.")
+    build_knowledge(embedder, [TextFileKnowledgeSource(file_paths=[file_path])])
+
+    stat = file_path.stat()
+    os.utime(file_path, (stat.st_atime, stat.st_mtime + 10))
+    build_knowledge(embedder, [TextFileKnowledgeSource(file_paths=[file_path])])
+
+    assert len(embedder.embedded) == 1
+
+
+def test_changing_embedder_rebuilds_collection(storage_dir, embedder, tmp_path):
+    class OtherEmbeddingFunction(CountingEmbeddingFunction):
+        pass
+
+    file_path = write(tmp_path / "facts.txt", "Brandon likes basketball.")
+    build_knowledge(embedder, [TextFileKnowledgeSource(file_paths=[file_path])])
+
+    other = OtherEmbeddingFunction()
+    knowledge = build_knowledge(other, [TextFileKnowledgeSource(file_paths=[file_path])])
+
+    assert other.embedded == ["Brandon likes basketball."]
+    assert knowledge.storage.collection.count() == 1
+
+
+def test_collection_without_manifest_is_rebuilt(storage_dir, embedder, tmp_path):
+    import hashlib
+
+    file_path = write(tmp_path / "facts.txt", "Brandon likes basketball.")
+    knowledge = build_knowledge(embedder, [TextFileKnowledgeSource(file_paths=[file_path])])
+    # A chunk stored before manifests existed, keyed by its content only.
+    legacy_chunk = "Brandon likes basketball."
+    knowledge.storage.collection.upsert(
+        ids=[hashlib.sha256(legacy_chunk.encode("utf-8")).hexdigest()],
+        documents=[legacy_chunk],
+        embeddings=[[1.0, 1.0, 0.0]],
+    )
+    knowledge.storage.manifest.path.unlink()
+
+    knowledge = build_knowledge(embedder, [TextFileKnowledgeSource(file_paths=[file_path])])
+
+    assert knowledge.storage.collection.get()["documents"] == [legacy_chunk]
+    assert knowledge.storage.manifest.path.exists()
+
+
+def test_manifest_is_stored_next_to_the_collection(storage_dir, embedder):
+    knowledge = build_knowledge(embedder, [StringKnowledgeSource(content="A fact.")])
+
+    assert isinstance(knowledge.storage, KnowledgeStorage)
+    assert knowledge.storage.manifest.path == (
+        storage_dir / "knowledge" / "knowledge_manifest_test.manifest.json"
+    )
+    assert knowledge.storage.manifest.path.exists()
+
+
+@pytest.mark.parametrize("chunk_size,chunk_overlap", [(4, 1), (10, 8), (5, 0)])
+def test_chunk_stream_matches_chunk_text(chunk_size, chunk_overlap):
+    source = StringKnowledgeSource(
+        content="x", chunk_size=chunk_size, chunk_overlap=chunk_overlap
+    )
+    text = "The quick brown fox jumps over the lazy dog."
+
+    for pieces in ([text], list(text), [text[i : i + 3] for i in range(0, 44, 3)]):
+        assert list(source._chunk_stream(pieces)) == source._chunk_text(text)
+
+
+def test_csv_source_streams_rows_into_batches(storage_dir, embedder, tmp_path):
+    file_path = write(
+        tmp_path / "people.csv", "name,age\n" + "".join(f"p{i},{i}\n" for i in range(50))
+    )
+    source = CSVKnowledgeSource(file_paths=[file_path], chunk_size=20, chunk_overlap=0)
+    assert source.content == {}
+
+    with patch.object(KnowledgeStorage, "batch_size", 4):
+        knowledge = build_knowledge(embedder, [source])
+
+    expected = source._chunk_text(
+        "name age\n" + "".join(f"p{i} {i}\n" for i in range(50))
+    )
+    assert embedder.embedded == expected
+    assert max(embedder.batches) == 4
+    assert source.chunks == []
+    assert knowledge.storage.collection.count() == len(expected)
+
+
+def test_file_source_load_content_still_reads_files(tmp_path):
+    file_path = write(tmp_path / "facts.txt", "Brandon likes basketball.")
+
+    source = TextFileKnowledgeSource(file_paths=[file_path])
+
+    assert source.load_content() == {file_path: "Brandon likes basketball."}
+
+
+def test_file_sources_must_implement_how_they_read_files(tmp_path):
+    file_path = write(tmp_path / "facts.txt", "Brandon likes basketball.")
+
+    class NoContentSource(BaseFileKnowledgeSource):
+        def add(self) -> None:
+            pass
+
+    class NoStreamSource(StreamingFileKnowledgeSource):
+        def add(self) -> None:
+            self._add_files()
+
+    for source_class in (NoContentSource, NoStreamSource):
+        with pytest.raises(TypeError, match="abstract"):
+            source_class(file_paths=[file_path])
+
+
+def test_parallel_pdf_ingestion_matches_sequential(tmp_path, embedder):
+    pdf_path = Path(__file__).parent / "crewai_quickstart.pdf"
+
+    def ingest(directory, **kwargs):
+        with patch(
+            "crewai.knowledge.storage.knowledge_storage.db_storage_path",
+            return_value=str(tmp_path / directory),
+        ):
+            knowledge = build_knowledge(
+                embedder, [PDFKnowledgeSource(file_paths=[pdf_path], **kwargs)]
+            )
+        return knowledge.storage.collection.get()
+
+    sequential = ingest("sequential", chunk_size=200, chunk_overlap=20)
+    parallel = ingest(
+        "parallel", chunk_size=200, chunk_overlap=20, parallel=True, pages_per_task=1
+    )
+
+    assert sorted(parallel["ids"]) == sorted(sequential["ids"])
+    assert len(sequential["ids"]) > 1
+
+
+def test_numpy_vector_store_ingests_incrementally_and_searches(
+    tmp_path, embedder, monkeypatch
+):
+    from crewai.knowledge.storage.numpy_knowledge_storage import (
+        NumpyKnowledgeStorage,
+    )
+
+    monkeypatch.setenv("CREWAI_VECTOR_STORE", "numpy")
+    with patch(
+        "crewai.knowledge.storage.numpy_knowledge_storage.db_storage_path",
+        return_value=str(tmp_path),
+    ):
+        sources = [StringKnowledgeSource(content="Brandon likes basketball.")]
+        knowledge = build_knowledge(embedder, sources)
+        assert isinstance(knowledge.storage, NumpyKnowledgeStorage)
+        assert (tmp_path / "knowledge" / "numpy").is_dir()
+
+        build_knowledge(
+            embedder, [StringKnowledgeSource(content="Brandon likes basketball.")]
+        )
+        assert len(embedder.embedded) == 1
+
+        results = knowledge.storage.search(
+            ["Brandon likes basketball."], limit=1, score_threshold=0.99
+        )
+        assert [result["context"] for result in results] == [
+            "Brandon likes basketball."
+        ]
@@ -442,3 +442,430 @@ def test_tool_execution_error_event():
     assert event.tool_args == {"param": "test"}
     assert event.tool_class == failing_tool
     assert "Tool execution failed!" in event.error
+
+
+def _mock_completion_response(content: str = "Paris"):
+    from litellm.types.utils import ModelResponse
+
+    return ModelResponse(
+        model="gpt-4o-mini",
+        choices=[
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        usage={"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+    )
+
+
+def test_llm_response_cache_replays_identical_calls():
+    from crewai.utilities.events.llm_events import LLMCallCompletedEvent
+    from crewai.utilities.llm_response_cache import LLMResponseCache
+
+    llm = LLM(model="gpt-4o-mini", cache=LLMResponseCache(persist=False))
+    calc_handler = TokenCalcHandler(token_cost_process=TokenProcess())
+    received_events = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(LLMCallCompletedEvent)
+        def handle_completed(source, event):
+            received_events.append(event)
+
+        with patch(
+            "litellm.completion", return_value=_mock_completion_response()
+        ) as mock_completion:
+            first = llm.call("What is the capital of France?", callbacks=[calc_handler])
+            second = llm.call(
+                "What is the capital of France?", callbacks=[calc_handler]
+            )
+
+    assert first == second == "Paris"
+    assert mock_completion.call_count == 1
+    assert [event.cached for event in received_events] == [False, True]
+
+    usage = calc_handler.token_cost_process.get_summary()
+    assert usage.successful_requests == 1
+    assert usage.total_tokens == 12
+    assert usage.cached_responses == 1
+
+
+def test_llm_response_cache_key_depends_on_params():
+    from crewai.utilities.llm_response_cache import LLMResponseCache
+
+    cache = LLMResponseCache(persist=False)
+    llm_cold = LLM(model="gpt-4o-mini", temperature=0.0, cache=cache)
+    llm_hot = LLM(model="gpt-4o-mini", temperature=1.0, cache=cache)
+
+    with patch(
+        "litellm.completion", return_value=_mock_completion_response()
+    ) as mock_completion:
+        llm_cold.call("Hello")
+        llm_hot.call("Hello")
+        llm_cold.call("Hello")
+
+    assert mock_completion.call_count == 2
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_llm_response_cache_skips_calls_it_cannot_key():
+    from crewai.utilities.llm_response_cache import LLMResponseCache
+
+    cache = LLMResponseCache(persist=False)
+    llm = LLM(model="gpt-4o-mini", cache=cache, http_client=object())
+
+    with patch(
+        "litellm.completion", return_value=_mock_completion_response()
+    ) as mock_completion:
+        llm.call("Hello")
+        llm.call("Hello")
+
+    assert mock_completion.call_count == 2
+    assert cache.hits == cache.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_uses_acompletion():
+    from unittest.mock import AsyncMock
+
+    llm = LLM(model="gpt-4o-mini")
+    calc_handler = TokenCalcHandler(token_cost_process=TokenProcess())
+
+    with (
+        patch(
+            "litellm.acompletion",
+            new_callable=AsyncMock,
+            return_value=_mock_completion_response("Paris"),
+        ) as mock_acompletion,
+        patch("litellm.completion") as mock_completion,
+    ):
+        result = await llm.acall(
+            "What is the capital of France?", callbacks=[calc_handler]
+        )
+
+    assert result == "Paris"
+    mock_acompletion.assert_awaited_once()
+    mock_completion.assert_not_called()
+    assert calc_handler.token_cost_process.get_summary().successful_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_awaits_coroutine_tools():
+    from unittest.mock import AsyncMock
+
+    from litellm.types.utils import ModelResponse
+
+    async def get_city(country: str) -> str:
+        return {"France": "Paris"}[country]
+
+    response = ModelResponse(
+        model="gpt-4o-mini",
+        choices=[
+            {
+                "index": 0,
+                "finish_reason": "tool_calls",
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {
+                                "name": "get_city",
+                                "arguments": '{"country": "France"}',
+                            },
+                        }
+                    ],
+                },
+            }
+        ],
+    )
+
+    llm = LLM(model="gpt-4o-mini")
+    with patch("litellm.acompletion", new_callable=AsyncMock, return_value=response):
+        result = await llm.acall(
+            "Capital of France?",
+            tools=[{"type": "function", "function": {"name": "get_city"}}],
+            available_functions={"get_city": get_city},
+        )
+
+    assert result == "Paris"
+
+
+def _mock_stream_chunks(text: str, size: int = 4):
+    from litellm.types.utils import ModelResponse
+
+    return [
+        ModelResponse(
+            stream=True,
+            model="gpt-4o-mini",
+            choices=[
+                {"index": 0, "delta": {"role": "assistant", "content": text[i : i + size]}}
+            ],
+        )
+        for i in range(0, len(text), size)
+    ]
+
+
+def test_llm_streaming_emits_chunks_and_stops_at_stop_words():
+    from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+
+    llm = LLM(model="gpt-4o-mini", stream=True, stop=["\nObservation:"])
+    text = "Thought: search\nAction: search\nAction Input: SF\nObservation: sunny and more tokens"
+    chunks = _mock_stream_chunks(text)
+    received_chunks = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def handle_chunk(source, event):
+            received_chunks.append(event.chunk)
+
+        with patch("litellm.completion", return_value=iter(chunks)) as mock_completion:
+            result = llm.call("Search the weather")
+
+    assert mock_completion.call_args.kwargs["stream"] is True
+    assert result == "Thought: search\nAction: search\nAction Input: SF"
+    # The stream was cancelled right after the stop word arrived.
+    assert len(received_chunks) < len(chunks)
+    assert "".join(received_chunks).startswith(result)
+
+
+def test_llm_streaming_honours_stop_condition():
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    chunks = _mock_stream_chunks("one two three four five six")
+    seen = []
+
+    def stop_condition(chunk):
+        seen.append(chunk)
+        return len(seen) == 2
+
+    with patch("litellm.completion", return_value=iter(chunks)):
+        result = llm.call("Count", stop_condition=stop_condition)
+
+    assert result == "one two "
+
+
+def _mock_tool_calls_response(*calls):
+    from litellm.types.utils import ModelResponse
+
+    return ModelResponse(
+        model="gpt-4o-mini",
+        choices=[
+            {
+                "index": 0,
+                "finish_reason": "tool_calls",
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": f"call_{index}",
+                            "type": "function",
+                            "function": {"name": name, "arguments": arguments},
+                        }
+                        for index, (name, arguments) in enumerate(calls)
+                    ],
+                },
+            }
+        ],
+    )
+
+
+def test_llm_executes_all_tool_calls_in_parallel_and_keeps_order():
+    import threading
+
+    from crewai.types.tool_call_result import ToolCallResult
+    from crewai.utilities.events.tool_usage_events import (
+        ToolUsageFinishedEvent,
+        ToolUsageStartedEvent,
+    )
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def search(query: str) -> str:
+        # All three searches must be running at the same time to pass the barrier.
+        barrier.wait()
+        return f"results for {query}"
+
+    response = _mock_tool_calls_response(
+        ("search", '{"query": "a"}'),
+        ("search", '{"query": "b"}'),
+        ("search", '{"query": "c"}'),
+    )
+    received_events = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(ToolUsageStartedEvent)
+        def handle_started(source, event):
+            received_events.append(event)
+
+        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        def handle_finished(source, event):
+            received_events.append(event)
+
+        with patch("litellm.completion", return_value=response):
+            results = LLM(model="gpt-4o-mini").call(
+                "Search a, b and c",
+                tools=[{"type": "function", "function": {"name": "search"}}],
+                available_functions={"search": search},
+            )
+
+    assert [type(result) for result in results] == [ToolCallResult] * 3
+    assert [result.result for result in results] == [
+        "results for a",
+        "results for b",
+        "results for c",
+    ]
+    assert [result.tool_call_id for result in results] == ["call_0", "call_1", "call_2"]
+    assert len(received_events) == 6
+
+
+def test_llm_tool_events_identify_the_calling_agent():
+    from types import SimpleNamespace
+
+    from crewai.utilities.events.tool_usage_events import ToolUsageFinishedEvent
+
+    response = _mock_tool_calls_response(("search", '{"query": "a"}'))
+    received_events = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        def handle_finished(source, event):
+            received_events.append(event)
+
+        llm = LLM(model="gpt-4o-mini")
+        with patch("litellm.completion", return_value=response):
+            llm.call(
+                "Search a",
+                available_functions={"search": lambda query: query},
+                from_agent=SimpleNamespace(key="agent-key", role="Researcher"),
+            )
+            llm.call("Search a", available_functions={"search": lambda query: query})
+
+    assert [(e.agent_key, e.agent_role) for e in received_events] == [
+        ("agent-key", "Researcher"),
+        ("openai/gpt-4o-mini", "gpt-4o-mini"),
+    ]
+
+
+def test_llm_multiple_tool_calls_isolate_failures():
+    def ok(value: int) -> int:
+        return value * 2
+
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    response = _mock_tool_calls_response(
+        ("ok", '{"value": 2}'),
+        ("boom", "{}"),
+        ("missing", "{}"),
+    )
+
+    with patch("litellm.completion", return_value=response):
+        results = LLM(model="gpt-4o-mini").call(
+            "Run the tools",
+            tools=[{"type": "function", "function": {"name": "ok"}}],
+            available_functions={"ok": ok, "boom": boom},
+        )
+
+    assert results[0].result == 4 and results[0].error is None
+    assert results[1].error == "boom"
+    assert results[2].error == "Unknown function 'missing'"
+
+
+def test_llm_single_failing_tool_call_returns_the_text_response():
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    for available_functions in ({"boom": boom}, {"other": boom}):
+        with patch(
+            "litellm.completion",
+            return_value=_mock_tool_calls_response(("boom", "{}")),
+        ):
+            result = LLM(model="gpt-4o-mini").call(
+                "Run the tool", available_functions=available_functions
+            )
+
+        # As before parallel tool calls: the (empty) text of the response.
+        assert result == ""
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_runs_coroutine_and_sync_tools_concurrently():
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    async def slow_lookup(key: str) -> str:
+        await asyncio.sleep(0.05)
+        return key.upper()
+
+    def sync_lookup(key: str) -> str:
+        return key * 2
+
+    response = _mock_tool_calls_response(
+        ("slow_lookup", '{"key": "a"}'),
+        ("sync_lookup", '{"key": "b"}'),
+        ("slow_lookup", '{"key": "c"}'),
+    )
+
+    with patch("litellm.acompletion", new_callable=AsyncMock, return_value=response):
+        results = await LLM(model="gpt-4o-mini").acall(
+            "Lookup",
+            tools=[{"type": "function", "function": {"name": "slow_lookup"}}],
+            available_functions={"slow_lookup": slow_lookup, "sync_lookup": sync_lookup},
+        )
+
+    assert [result.result for result in results] == ["A", "bb", "C"]
+
+
+def test_llm_rate_limiter_is_shared_per_model_and_tracks_usage_tokens():
+    from crewai.utilities.rate_limiter import get_rate_limiter, reset_rate_limiters
+
+    reset_rate_limiters()
+    llm = LLM(model="gpt-4o-mini", max_rpm=100, max_tpm=10)
+    other = LLM(model="openai/gpt-4o-mini", max_rpm=100, max_tpm=10)
+    looser = LLM(model="gpt-4o-mini", max_rpm=100)
+    assert llm._rate_limiter is other._rate_limiter
+    assert llm._rate_limiter is get_rate_limiter(
+        "openai/gpt-4o-mini", max_rpm=100, max_tpm=10
+    )
+    assert looser._rate_limiter is not llm._rate_limiter
+
+    with patch("litellm.completion", return_value=_mock_completion_response()):
+        assert llm.call("What is the capital of France?") == "Paris"
+
+    # The 12 tokens reported in the usage overdraw the per-minute token budget.
+    assert llm._rate_limiter.reserve() > 0
+    reset_rate_limiters()
+
+
+def test_llm_returns_tool_calls_without_executing_them():
+    from crewai.types.tool_call_result import ToolCallResult
+
+    llm = LLM(model="gpt-4o-mini")
+    tool = MagicMock()
+    response = _mock_tool_calls_response(
+        ("get_weather", '{"city": "Paris"}'), ("get_weather", "{not json")
+    )
+
+    with patch("litellm.completion", return_value=response):
+        result = llm.call(
+            "What's the weather in Paris?",
+            tools=[{"type": "function", "function": {"name": "get_weather"}}],
+            available_functions={"get_weather": tool},
+            execute_tools=False,
+        )
+
+    tool.assert_not_called()
+    assert [type(call) for call in result] == [ToolCallResult, ToolCallResult]
+    assert result[0].tool_call_id == "call_0"
+    assert result[0].arguments == {"city": "Paris"}
+    assert result[0].result is None
+    assert result[1].error.startswith("Failed to parse function arguments")
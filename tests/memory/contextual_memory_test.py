@@ -0,0 +1,66 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from crewai.memory.contextual.contextual_memory import ContextualMemory
+
+
+def _memories(barrier=None):
+    def search_with(results):
+        def search(*args, **kwargs):
+            if barrier is not None:
+                barrier.wait()
+            return results
+
+        return MagicMock(side_effect=search)
+
+    ltm = MagicMock()
+    ltm.search = search_with([{"metadata": {"suggestions": ["Cite sources"]}}])
+    stm = MagicMock()
+    stm.search = search_with([{"context": "The launch moved to Friday"}])
+    em = MagicMock()
+    em.search = search_with([{"context": "Acme(Company): the client"}])
+    return stm, ltm, em
+
+
+TASK = SimpleNamespace(description="Write the launch announcement")
+
+
+def test_memories_are_searched_concurrently_and_kept_in_order():
+    # Every search waits for the other two, so a serial build would time out.
+    stm, ltm, em = _memories(barrier=threading.Barrier(3, timeout=5))
+    contextual_memory = ContextualMemory(None, stm, ltm, em, None)
+
+    context = contextual_memory.build_context_for_task(TASK, "")
+
+    assert context == (
+        "Historical Data:\n- Cite sources\n"
+        "Recent Insights:\n- The launch moved to Friday\n"
+        "Entities:\n- Acme(Company): the client"
+    )
+
+
+def test_cache_reuses_searches_for_the_same_query():
+    stm, ltm, em = _memories()
+    cache = {}
+
+    first = ContextualMemory(None, stm, ltm, em, None, cache=cache)
+    second = ContextualMemory(None, stm, ltm, em, None, cache=cache)
+    assert first.build_context_for_task(TASK, "") == second.build_context_for_task(
+        TASK, ""
+    )
+    second.build_context_for_task(TASK, "with more context")
+
+    assert ltm.search.call_count == 1
+    assert stm.search.call_count == 2
+    assert em.search.call_count == 2
+
+
+def test_without_cache_every_build_searches():
+    stm, ltm, em = _memories()
+    contextual_memory = ContextualMemory(None, stm, ltm, em, None)
+
+    contextual_memory.build_context_for_task(TASK, "")
+    contextual_memory.build_context_for_task(TASK, "")
+
+    assert stm.search.call_count == 2
@@ -1,7 +1,11 @@
+import sqlite3
+import time
+
 import pytest
 
 from crewai.memory.long_term.long_term_memory import LongTermMemory
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
 
 
 @pytest.fixture
@@ -27,3 +31,125 @@ def test_save_and_search(long_term_memory):
     assert find["metadata"]["quality"] == 0.5
     assert find["metadata"]["task"] == "test_task"
     assert find["metadata"]["expected_output"] == "test_output"
+
+
+def _row(task="test_task", datetime="1.0", score=0.5):
+    return (task, {"task": task, "quality": score}, datetime, score)
+
+
+def test_load_orders_by_numeric_timestamp(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    # Lexically "9.0" sorts after "10.0".
+    storage.save_many([_row(datetime="9.0"), _row(datetime="10.0")])
+
+    results = storage.load("test_task", latest_n=2)
+
+    assert [result["datetime"] for result in results] == ["10.0", "9.0"]
+
+
+def test_uses_wal_and_indexes_task_lookups(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    conn = storage._connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT metadata FROM long_term_memories "
+        "WHERE task_description = ? ORDER BY timestamp DESC",
+        ("test_task",),
+    ).fetchall()
+    assert "idx_long_term_memories_task_timestamp" in str(plan)
+
+
+def test_compact_keeps_the_latest_rows_per_task(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"), max_rows_per_task=2)
+    storage.save_many(
+        [_row(datetime=str(float(i))) for i in range(5)]
+        + [_row(task="other_task", datetime="1.0")]
+    )
+
+    assert storage.compact() == 3
+    assert [r["datetime"] for r in storage.load("test_task", latest_n=5)] == [
+        "4.0",
+        "3.0",
+    ]
+    assert len(storage.load("other_task", latest_n=5)) == 1
+
+
+def test_compact_drops_rows_older_than_max_age(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"), max_age=60)
+    now = time.time()
+    storage.save_many([_row(datetime=str(now - 120)), _row(datetime=str(now))])
+
+    storage.compact(vacuum=True)
+
+    assert [r["datetime"] for r in storage.load("test_task", latest_n=5)] == [
+        str(now)
+    ]
+
+
+def test_migrates_databases_without_timestamp_column(tmp_path):
+    db_path = tmp_path / "ltm.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE long_term_memories (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "task_description TEXT, metadata TEXT, datetime TEXT, score REAL)"
+        )
+        conn.executemany(
+            "INSERT INTO long_term_memories (task_description, metadata, datetime, score) "
+            "VALUES (?, ?, ?, ?)",
+            [("test_task", "{}", "9.0", 1.0), ("test_task", "{}", "10.0", 1.0)],
+        )
+
+    storage = LTMSQLiteStorage(db_path=str(db_path))
+
+    assert [r["datetime"] for r in storage.load("test_task", latest_n=2)] == [
+        "10.0",
+        "9.0",
+    ]
+
+
+def test_long_term_memory_passes_retention_to_its_storage(tmp_path):
+    memory = LongTermMemory(path=str(tmp_path / "ltm.db"), max_rows_per_task=2)
+    memory.save_many(
+        LongTermMemoryItem(
+            agent="test_agent",
+            task="test_task",
+            expected_output="test_output",
+            datetime=str(float(i)),
+            quality=0.5,
+            metadata={"quality": 0.5},
+        )
+        for i in range(3)
+    )
+
+    assert memory.storage.max_rows_per_task == 2
+    memory.storage.compact()
+    assert [r["datetime"] for r in memory.search("test_task", latest_n=5)] == [
+        "2.0",
+        "1.0",
+    ]
+
+
+def test_crew_reads_long_term_memory_retention_from_memory_config(tmp_path):
+    from crewai import Agent, Crew, Task
+
+    agent = Agent(role="Researcher", goal="Research", backstory="Curious")
+    crew = Crew(
+        agents=[agent],
+        tasks=[Task(description="Research", expected_output="Notes", agent=agent)],
+        memory=True,
+        memory_config={
+            "long_term_memory": {"path": str(tmp_path / "ltm.db"), "max_age": 3600}
+        },
+    )
+
+    assert crew._long_term_memory.storage.db_path == str(tmp_path / "ltm.db")
+    assert crew._long_term_memory.storage.max_age == 3600
+
+
+def test_timestamps_accept_iso_datetimes_and_warn_otherwise(caplog):
+    assert LTMSQLiteStorage._timestamp("1970-01-01T00:01:00+00:00") == 60.0
+
+    before = time.time()
+    assert LTMSQLiteStorage._timestamp("yesterday") >= before
+    assert "'yesterday' is not a timestamp" in caplog.text
@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from crewai.memory.memory_job_queue import MemoryJobQueue
+
+
+def test_drain_waits_for_every_job():
+    job_queue = MemoryJobQueue(max_concurrency=2)
+    done = []
+
+    for i in range(5):
+        job_queue.submit(lambda i=i: (time.sleep(0.01), done.append(i)))
+    job_queue.drain()
+
+    assert sorted(done) == [0, 1, 2, 3, 4]
+    assert job_queue.pending == 0
+
+
+def test_runs_at_most_max_concurrency_jobs_at_once():
+    job_queue = MemoryJobQueue(max_concurrency=2)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def job():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    for _ in range(6):
+        job_queue.submit(job)
+    job_queue.drain()
+
+    assert peak == 2
+
+
+def test_failing_job_is_logged_and_does_not_stop_the_queue(caplog):
+    job_queue = MemoryJobQueue(max_concurrency=1)
+    done = []
+
+    def failing_job():
+        raise RuntimeError("evaluation failed")
+
+    job_queue.submit(failing_job)
+    job_queue.submit(done.append, "after")
+    job_queue.drain()
+
+    assert done == ["after"]
+    assert "evaluation failed" in caplog.text
+
+
+def test_drain_times_out_while_a_job_is_running():
+    job_queue = MemoryJobQueue(max_concurrency=1)
+    release = threading.Event()
+
+    job_queue.submit(release.wait)
+
+    assert job_queue.drain(timeout=0.05) is False
+    release.set()
+    assert job_queue.drain(timeout=5) is True
+
+
+def test_workers_exit_once_the_queue_is_empty():
+    job_queue = MemoryJobQueue(max_concurrency=2)
+
+    job_queue.submit(lambda: None)
+    job_queue.drain()
+    deadline = time.monotonic() + 5
+    while job_queue._workers and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert job_queue._workers == []
+
+
+def test_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        MemoryJobQueue(max_concurrency=0)
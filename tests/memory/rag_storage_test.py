@@ -0,0 +1,165 @@
+import threading
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.memory.short_term.short_term_memory import ShortTermMemory
+from crewai.memory.storage.numpy_rag_storage import NumpyRAGStorage
+from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.utilities.embedding_cache import get_embedding_cache
+
+
+class RecordingEmbeddingFunction(EmbeddingFunction):
+    def __init__(self):
+        self.batches: List[List[str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        with self._lock:
+            self.batches.append(list(input))
+        return [[float(len(text)), 1.0] for text in input]
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    get_embedding_cache().clear()
+    yield
+    get_embedding_cache().clear()
+
+
+@pytest.fixture
+def embedding_function():
+    return RecordingEmbeddingFunction()
+
+
+def _storage(tmp_path, embedding_function, **kwargs) -> RAGStorage:
+    return RAGStorage(
+        type="short_term",
+        embedder_config={
+            "provider": "custom",
+            "config": {"embedder": embedding_function},
+        },
+        path=str(tmp_path),
+        **kwargs,
+    )
+
+
+def test_saves_are_buffered_and_flushed_as_one_batch(tmp_path, embedding_function):
+    storage = _storage(tmp_path, embedding_function, flush_interval=None)
+
+    for i in range(3):
+        storage.save(f"memory {i}", {"agent": "researcher"})
+
+    assert storage.collection.count() == 0
+    assert embedding_function.batches == []
+
+    storage.flush()
+
+    assert storage.collection.count() == 3
+    assert embedding_function.batches == [["memory 0", "memory 1", "memory 2"]]
+
+
+def test_search_reads_its_own_buffered_writes(tmp_path, embedding_function):
+    storage = _storage(tmp_path, embedding_function, flush_interval=None)
+    storage.save("the launch moved to friday", {"agent": "researcher"})
+
+    results = storage.search("the launch moved to friday", score_threshold=0)
+
+    assert [result["context"] for result in results] == ["the launch moved to friday"]
+
+
+def test_full_buffer_flushes_in_the_background(tmp_path, embedding_function):
+    storage = _storage(
+        tmp_path, embedding_function, write_buffer_size=2, flush_interval=None
+    )
+
+    storage.save("first", {"agent": "researcher"})
+    storage.save("second", {"agent": "researcher"})
+    storage.flush()
+
+    assert storage.collection.count() == 2
+    assert embedding_function.batches == [["first", "second"]]
+
+
+def test_buffer_is_flushed_after_the_interval(tmp_path, embedding_function):
+    storage = _storage(tmp_path, embedding_function, flush_interval=0.05)
+    flushed = threading.Event()
+    flush = storage.flush
+
+    def flush_and_signal():
+        flush()
+        flushed.set()
+
+    storage.flush = flush_and_signal  # type: ignore[method-assign]
+    storage.save("remember this", {"agent": "researcher"})
+
+    assert flushed.wait(timeout=5)
+    assert storage.collection.count() == 1
+
+
+def test_zero_buffer_size_writes_immediately(tmp_path, embedding_function):
+    storage = _storage(tmp_path, embedding_function, write_buffer_size=0)
+
+    storage.save("written now", {"agent": "researcher"})
+
+    assert storage.collection.count() == 1
+
+
+def test_reset_drops_buffered_saves(tmp_path, embedding_function):
+    storage = _storage(tmp_path, embedding_function, flush_interval=None)
+    storage.save("discarded", {"agent": "researcher"})
+
+    with patch("crewai.memory.storage.rag_storage.shutil.rmtree"):
+        storage.reset()
+    storage.flush()
+
+    assert embedding_function.batches == []
+
+
+def test_memory_flush_delegates_to_storage():
+    storage = MagicMock()
+    memory = ShortTermMemory(storage=storage)
+
+    memory.flush()
+
+    storage.flush.assert_called_once_with()
+
+
+def test_numpy_storage_buffers_and_searches_by_similarity(
+    tmp_path, embedding_function
+):
+    storage = NumpyRAGStorage(
+        type="short_term",
+        embedder_config={
+            "provider": "custom",
+            "config": {"embedder": embedding_function},
+        },
+        path=str(tmp_path),
+        flush_interval=None,
+    )
+    storage.save("short", {"agent": "researcher"})
+    storage.save("a much longer memory", {"agent": "writer"})
+
+    results = storage.search("a much longer memory", limit=1, score_threshold=0.99)
+    filtered = storage.search(
+        "a much longer memory", filter={"agent": "researcher"}, score_threshold=0
+    )
+
+    assert [result["context"] for result in results] == ["a much longer memory"]
+    assert results[0]["score"] == pytest.approx(1.0)
+    assert [result["context"] for result in filtered] == ["short"]
+    storage.reset()
+    assert storage.search("short", score_threshold=0) == []
+
+
+def test_memory_config_selects_the_numpy_vector_store(tmp_path):
+    crew = MagicMock(memory_config={"vector_store": "numpy"}, agents=[])
+
+    with patch(
+        "crewai.memory.storage.rag_storage.db_storage_path", return_value=str(tmp_path)
+    ):
+        memory = ShortTermMemory(crew=crew)
+
+    assert isinstance(memory.storage, NumpyRAGStorage)
@@ -93,6 +93,22 @@ def test_crew_memoization():
     ), "Crew references should point to the same object"
 
 
+def test_crew_records_factory_for_worker_processes():
+    crew = InternalCrew().crew()
+
+    factory = crew._factory
+    assert factory.module == __name__
+    assert factory.class_name == "InternalCrew"
+    assert factory.method_name == "crew"
+
+    rebuilt = factory.build()
+    assert rebuilt is not crew
+    assert [task.description for task in rebuilt.tasks] == [
+        task.description for task in crew.tasks
+    ]
+    assert crew.copy()._factory == factory
+
+
 def test_task_name():
     simple_task = SimpleCrew().simple_task()
     assert (
@@ -202,6 +202,61 @@ def test_async_execution():
         execute.assert_called_once_with(task=task, context=None, tools=[])
 
 
+def test_async_execution_propagates_exceptions_to_the_future():
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    with patch.object(Agent, "execute_task", side_effect=RuntimeError("boom")):
+        execution = task.execute_async(agent=researcher)
+        with pytest.raises(RuntimeError, match="boom"):
+            execution.result(timeout=5)
+
+
+def test_async_execution_on_asyncio_executor_awaits_agent():
+    from crewai.utilities.concurrency import AsyncioTaskExecutor
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    async def aexecute_task(task, context=None, tools=None):
+        return "ok"
+
+    with (
+        patch.object(Agent, "aexecute_task", side_effect=aexecute_task) as aexecute,
+        patch.object(Agent, "execute_task") as execute,
+    ):
+        execution = task.execute_async(
+            agent=researcher, executor=AsyncioTaskExecutor()
+        )
+        assert execution.result(timeout=5).raw == "ok"
+
+    aexecute.assert_called_once_with(task=task, context=None, tools=[])
+    execute.assert_not_called()
+    assert task.output.raw == "ok"
+
+
 def test_multiple_output_type_error():
     class Output(BaseModel):
         field: str
@@ -18,6 +18,11 @@ class TestState(FlowState):
     message: str = ""
 
 
+class Findings(BaseModel):
+    topic: str
+    sources: int
+
+
 def test_persist_decorator_saves_state(tmp_path, caplog):
     """Test that @persist decorator saves state in SQLite."""
     db_path = os.path.join(tmp_path, "test_flows.db")
@@ -208,3 +213,305 @@ def test_persist_decorator_verbose_logging(tmp_path, caplog):
     flow = VerboseFlow(persistence=persistence)
     flow.kickoff()
     assert "Saving flow state" in caplog.text
+
+
+def _rows(db_path):
+    import sqlite3
+
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT flow_uuid, method_name, is_delta FROM flow_states ORDER BY id"
+        ).fetchall()
+
+
+def test_states_between_checkpoints_are_stored_as_deltas(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, checkpoint_every=3)
+
+    documents = []
+    for step in range(7):
+        documents.append(f"document {step}")
+        persistence.save_state(
+            "flow-1", f"step_{step}", {"id": "flow-1", "documents": documents}
+        )
+
+    assert persistence.load_state("flow-1") == {
+        "id": "flow-1",
+        "documents": [f"document {step}" for step in range(7)],
+    }
+    assert [row[2] for row in _rows(db_path)] == [0, 1, 1, 0, 1, 1, 0]
+    assert SQLiteFlowPersistence(db_path).load_state("flow-1")["documents"][-1] == (
+        "document 6"
+    )
+
+
+def test_keep_last_prunes_old_states_but_keeps_their_checkpoint(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, checkpoint_every=4, keep_last=3)
+
+    for step in range(10):
+        persistence.save_state("flow-1", f"step_{step}", {"id": "flow-1", "step": step})
+        persistence.save_state("flow-2", f"step_{step}", {"id": "flow-2", "step": step})
+    persistence.flush()
+
+    flow_1_rows = [row for row in _rows(db_path) if row[0] == "flow-1"]
+    # The oldest kept state, step_7, is a delta on the step_4 checkpoint.
+    assert [row[1] for row in flow_1_rows] == [f"step_{step}" for step in range(4, 10)]
+    assert flow_1_rows[0][2] == 0
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "step": 9}
+    assert persistence.load_state("flow-2") == {"id": "flow-2", "step": 9}
+
+
+def test_write_behind_groups_queued_states_into_one_transaction(tmp_path):
+    from unittest.mock import patch
+
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path)
+    writes = []
+    original_write = persistence._write
+
+    with patch.object(persistence, "_start_writer"):
+        for step in range(5):
+            persistence.save_state("flow-1", "step", {"id": "flow-1", "step": step})
+    assert _rows(db_path) == []
+
+    def record_write(batch):
+        writes.append(len(batch))
+        original_write(batch)
+
+    with patch.object(persistence, "_write", side_effect=record_write):
+        persistence._start_writer()
+        persistence.flush()
+
+    assert writes == [5]
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "step": 4}
+
+
+def test_failed_writes_restart_the_flow_from_a_checkpoint(tmp_path):
+    import sqlite3
+    from unittest.mock import patch
+
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, write_behind=False, keep_last=10)
+    persistence.save_state("flow-1", "first", {"id": "flow-1", "step": 1})
+
+    with patch.object(
+        persistence, "_apply_retention", side_effect=sqlite3.OperationalError("locked")
+    ):
+        with pytest.raises(sqlite3.OperationalError):
+            persistence.save_state("flow-1", "second", {"id": "flow-1", "step": 2})
+    persistence.save_state("flow-1", "third", {"id": "flow-1", "step": 3})
+
+    assert [row[1:] for row in _rows(db_path)] == [("first", 0), ("third", 0)]
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "step": 3}
+
+
+def test_deltas_are_based_on_the_latest_stored_state_of_the_flow(tmp_path):
+    """Test that a state written by another instance is not patched over."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    first = SQLiteFlowPersistence(db_path, write_behind=False)
+    second = SQLiteFlowPersistence(db_path, write_behind=False)
+
+    first.save_state("flow-1", "one", {"id": "flow-1", "items": ["a"]})
+    second.save_state("flow-1", "two", {"id": "flow-1", "items": ["a", "b"]})
+    first.save_state("flow-1", "three", {"id": "flow-1", "items": ["a", "b", "a"]})
+    first.save_state("flow-1", "four", {"id": "flow-1", "items": ["a", "b", "a", "c"]})
+
+    assert [row[1:] for row in _rows(db_path)] == [
+        ("one", 0),
+        ("two", 0),
+        ("three", 0),
+        ("four", 1),
+    ]
+    assert second.load_state("flow-1") == {"id": "flow-1", "items": ["a", "b", "a", "c"]}
+
+
+def test_existing_databases_are_migrated(tmp_path):
+    import sqlite3
+
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE flow_states (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flow_uuid TEXT NOT NULL,
+                method_name TEXT NOT NULL,
+                timestamp DATETIME NOT NULL,
+                state_json TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO flow_states (flow_uuid, method_name, timestamp, state_json) "
+            "VALUES ('old', 'step', '2025-01-01', '{\"id\": \"old\", \"counter\": 5}')"
+        )
+
+    persistence = SQLiteFlowPersistence(db_path)
+    persistence.save_state("old", "next", {"id": "old", "counter": 6})
+
+    assert persistence.load_state("old") == {"id": "old", "counter": 6}
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": 1, "b": [1, 2]}, {"a": 2, "b": [1, 2, 3, 4]}),
+        ({"a": {"b/c": 1, "d~e": 2}}, {"a": {"b/c": 3}}),
+        ({"items": [1, 2, 3]}, {"items": [3]}),
+        ({"nested": {"list": [{"x": 1}]}}, {"nested": {"list": [{"x": 2}], "new": None}}),
+        ({"a": 1}, {"a": "1"}),
+        ({"a": 1}, {"a": True}),
+        ({"a": 0.0}, {"a": 0}),
+        ({"a": [0]}, {"a": [False, 1]}),
+        ({"a": {"b": [1, 2.0]}}, {"a": {"b": [1.0, 2.0, 3]}}),
+    ],
+)
+def test_json_patch_round_trip(old, new):
+    import copy
+    import json
+
+    from crewai.flow.persistence.json_patch import apply_patch, make_patch
+
+    patch = make_patch(old, new)
+
+    # Compare the JSON text too: ``==`` treats 1, 1.0 and True as equal.
+    assert json.dumps(apply_patch(copy.deepcopy(old), patch)) == json.dumps(new)
+
+
+def test_resumed_flow_only_runs_the_methods_that_did_not_complete(tmp_path):
+    """Test that a failed flow resumes after its last persisted method."""
+    from crewai.flow.flow import and_, router
+
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path)
+    calls = []
+    fail = {"summarize": True}
+
+    @persist(persistence)
+    class ResearchFlow(Flow[TestState]):
+        @start()
+        def research(self):
+            calls.append("research")
+            self.state.counter += 1
+            return "findings"
+
+        @router(research)
+        def route(self):
+            calls.append("route")
+            return "write"
+
+        @listen("write")
+        def draft(self, findings=None):
+            calls.append("draft")
+            self.state.message = "draft"
+            return "draft text"
+
+        @listen(draft)
+        def summarize(self, draft_text):
+            calls.append("summarize")
+            if fail["summarize"]:
+                raise RuntimeError("LLM unavailable")
+            self.state.message = f"summary of {draft_text}"
+            return "summary"
+
+        @listen(and_(research, summarize))
+        def publish(self):
+            calls.append("publish")
+            return self.state.message
+
+    flow = ResearchFlow()
+    flow.kickoff()
+    assert calls == ["research", "route", "draft", "summarize"]
+    assert persistence.load_progress(flow.state.id)["method_results"] == {
+        "research": ["findings"],
+        "route": ["write"],
+        "draft": ["draft text"],
+    }
+
+    calls.clear()
+    fail["summarize"] = False
+    resumed = ResearchFlow()
+    result = resumed.kickoff(inputs={"id": flow.state.id})
+
+    assert calls == ["summarize", "publish"]
+    assert result == "summary of draft text"
+    assert resumed.state.counter == 1
+    assert resumed.method_outputs[:3] == ["findings", "write", "draft text"]
+    assert persistence.load_progress(flow.state.id) is None
+
+    # A finished flow kicked off again with its id restarts from its start methods.
+    calls.clear()
+    ResearchFlow().kickoff(inputs={"id": flow.state.id})
+    assert calls[0] == "research"
+
+
+def test_resumed_flow_restores_model_outputs_and_reruns_lossy_ones(tmp_path):
+    """Test that model outputs keep their class and lossy outputs run again."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path)
+    calls = []
+    fail = {"summarize": True}
+
+    @persist(persistence)
+    class ModelFlow(Flow[TestState]):
+        @start()
+        def research(self):
+            calls.append("research")
+            return Findings(topic="ai", sources=3)
+
+        @listen(research)
+        def tags(self, findings):
+            calls.append(("tags", type(findings).__name__))
+            return {findings.topic, "llm"}
+
+        @listen(tags)
+        def summarize(self, tags):
+            calls.append("summarize")
+            if fail["summarize"]:
+                raise RuntimeError("LLM unavailable")
+            return sorted(tags)
+
+    flow = ModelFlow()
+    flow.kickoff()
+    progress = persistence.load_progress(flow.state.id)
+    assert progress["result_models"] == {
+        "research": {"0": f"{__name__}:Findings"}
+    }
+    assert progress["rerun"] == {"tags": [0]}
+
+    calls.clear()
+    fail["summarize"] = False
+    resumed = ModelFlow()
+    result = resumed.kickoff(inputs={"id": flow.state.id})
+
+    assert calls == [("tags", "Findings"), "summarize"]
+    assert resumed.method_outputs[0] == Findings(topic="ai", sources=3)
+    assert result == ["ai", "llm"]
+
+
+def test_progress_is_recorded_for_unpersisted_methods_that_ran_before(tmp_path):
+    """Test that the progress covers every method completed before a save."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, write_behind=False)
+
+    class SavingFlow(Flow[TestState]):
+        @start()
+        def load(self):
+            return {"rows": [1, 2]}
+
+        @listen(load)
+        @persist(persistence)
+        def transform(self, data):
+            self.state.counter = sum(data["rows"])
+
+        @listen(transform)
+        def fail(self):
+            raise RuntimeError("crash")
+
+    flow = SavingFlow(persistence=persistence)
+    flow.kickoff()
+
+    assert persistence.load_progress(flow.state.id) == {
+        "method_results": {"load": [{"rows": [1, 2]}], "transform": [None]}
+    }
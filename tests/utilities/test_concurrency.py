@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from crewai.utilities.concurrency import (
+    DEFAULT_MAX_WORKERS,
+    AsyncioTaskExecutor,
+    ProcessTaskExecutor,
+    TaskExecutor,
+    ThreadTaskExecutor,
+    create_task_executor,
+    ordered_map,
+    set_max_workers,
+)
+
+
+def _square(value):
+    return value * value
+
+
+def test_thread_executor_respects_max_concurrency():
+    executor = ThreadTaskExecutor(max_concurrency=2)
+    lock = threading.Lock()
+    active = []
+    peaks = []
+
+    def work(index):
+        with lock:
+            active.append(index)
+            peaks.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(index)
+        return index
+
+    futures = [executor.submit(work, index) for index in range(8)]
+
+    assert [future.result(timeout=5) for future in futures] == list(range(8))
+    assert max(peaks) == 2
+
+
+def test_thread_executor_propagates_exceptions():
+    executor = ThreadTaskExecutor(max_concurrency=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    failed = executor.submit(fail)
+    following = executor.submit(_square, 3)
+
+    with pytest.raises(ValueError, match="boom"):
+        failed.result(timeout=5)
+    # A failure releases its slot for the queued work.
+    assert following.result(timeout=5) == 9
+
+
+def test_queued_work_can_be_cancelled():
+    executor = ThreadTaskExecutor(max_concurrency=1)
+    release = threading.Event()
+    ran = []
+
+    blocker = executor.submit(release.wait, 5)
+    cancelled = executor.submit(ran.append, "cancelled")
+    pending = executor.submit(ran.append, "pending")
+
+    assert cancelled.cancel()
+    executor.cancel_pending()
+    release.set()
+
+    assert blocker.result(timeout=5) is True
+    assert pending.cancelled()
+    with pytest.raises(CancelledError):
+        cancelled.result()
+    assert ran == []
+    # The slot is free again once the queue is drained.
+    assert executor.submit(_square, 4).result(timeout=5) == 16
+
+
+def test_asyncio_executor_runs_coroutines_on_one_loop():
+    executor = AsyncioTaskExecutor(max_concurrency=4)
+    loops = []
+
+    async def work(value):
+        loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0.01)
+        return value
+
+    futures = [executor.submit(work, index) for index in range(4)]
+
+    assert [future.result(timeout=5) for future in futures] == list(range(4))
+    assert len(set(map(id, loops))) == 1
+    assert executor.submit(_square, 5).result(timeout=5) == 25
+
+
+def test_process_executor_runs_picklable_work():
+    executor = ProcessTaskExecutor(max_concurrency=2)
+
+    futures = [executor.submit(_square, value) for value in range(4)]
+
+    assert [future.result(timeout=30) for future in futures] == [0, 1, 4, 9]
+
+
+def test_task_executor_requires_a_dispatch_implementation():
+    with pytest.raises(TypeError):
+        TaskExecutor()
+
+
+def test_nested_thread_work_does_not_deadlock_the_shared_pool():
+    set_max_workers(1)
+    try:
+        executor = ThreadTaskExecutor()
+
+        def inner(value):
+            return executor.submit(_square, value).result(timeout=5)
+
+        def outer(value):
+            return executor.submit(inner, value).result(timeout=5)
+
+        futures = [executor.submit(outer, value) for value in range(3)]
+
+        assert [future.result(timeout=10) for future in futures] == [0, 1, 4]
+    finally:
+        set_max_workers(DEFAULT_MAX_WORKERS)
+
+
+def test_create_task_executor_rejects_unknown_backend():
+    assert isinstance(create_task_executor("async"), AsyncioTaskExecutor)
+    with pytest.raises(ValueError):
+        create_task_executor("fiber")  # type: ignore[arg-type]
+
+
+def test_ordered_map_yields_in_item_order_with_bounded_lookahead():
+    submitted = []
+
+    def items():
+        for value in range(10):
+            submitted.append(value)
+            yield (value,)
+
+    def slow_first(value):
+        if value == 0:
+            time.sleep(0.1)
+        return value * value
+
+    results = ordered_map(slow_first, items(), backend="thread", max_concurrency=2)
+
+    assert next(results) == 0
+    # Two workers run at most four items ahead of the consumer.
+    assert len(submitted) <= 5
+    assert list(results) == [value * value for value in range(1, 10)]
+
+
+def test_ordered_map_runs_in_processes():
+    assert list(ordered_map(_square, [(value,) for value in range(5)])) == [
+        0,
+        1,
+        4,
+        9,
+        16,
+    ]
@@ -0,0 +1,61 @@
+import numpy as np
+
+from crewai.utilities.embedding_cache import EmbeddingCache
+
+
+def embed_lengths(calls):
+    def compute(texts):
+        calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+    return compute
+
+
+def test_embeds_unique_misses_once_and_counts_hits():
+    cache = EmbeddingCache()
+    calls = []
+
+    first = cache.embed("model", ["a", "bb", "a"], embed_lengths(calls))
+    second = cache.embed("model", ["bb", "ccc"], embed_lengths(calls))
+
+    assert calls == [["a", "bb"], ["ccc"]]
+    assert [vector.tolist() for vector in first] == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert second[0].dtype == np.float32
+    assert cache.stats() == {"hits": 1, "misses": 4, "entries": 3}
+
+
+def test_fingerprints_do_not_share_vectors():
+    cache = EmbeddingCache()
+    calls = []
+
+    cache.embed("model-a", ["text"], embed_lengths(calls))
+    cache.embed("model-b", ["text"], embed_lengths(calls))
+
+    assert calls == [["text"], ["text"]]
+
+
+def test_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2)
+    calls = []
+
+    cache.embed("model", ["a", "b"], embed_lengths(calls))
+    cache.embed("model", ["a"], embed_lengths(calls))  # "b" is now least recent
+    cache.embed("model", ["c"], embed_lengths(calls))
+    cache.embed("model", ["a", "b"], embed_lengths(calls))
+
+    assert calls == [["a", "b"], ["c"], ["b"]]
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    calls = []
+    first = EmbeddingCache(path=path)
+    first.embed("model", ["persisted"], embed_lengths(calls))
+    first.close()
+
+    second = EmbeddingCache(path=path)
+    vectors = second.embed("model", ["persisted"], embed_lengths(calls))
+
+    assert calls == [["persisted"]]
+    assert vectors[0].tolist() == [9.0, 0.5]
+    assert second.stats()["hits"] == 1
@@ -0,0 +1,190 @@
+import threading
+import time
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities.concurrency import (
+    DEFAULT_MAX_WORKERS,
+    get_shared_pool,
+    set_max_workers,
+)
+from crewai.utilities.embedding_cache import get_embedding_cache
+from crewai.utilities.embeddings import (
+    MAX_BATCH_CHARACTERS,
+    BatchEmbedder,
+    embedder_fingerprint,
+)
+from crewai.utilities.rate_limiter import reset_rate_limiters
+
+
+class RecordingEmbeddingFunction(EmbeddingFunction):
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.batches: List[List[str]] = []
+        self.failures = failures
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        with self._lock:
+            self.batches.append(list(input))
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("rate limited")
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return [[float(text.split("-")[-1])] for text in input]
+
+
+def test_batches_by_size_and_returns_vectors_in_input_order():
+    function = RecordingEmbeddingFunction(delay=0.01)
+    embedder = BatchEmbedder(function, batch_size=3, max_concurrency=2)
+    texts = [f"text-{i}" for i in range(10)]
+
+    vectors = embedder.embed(texts)
+
+    assert vectors == [[float(i)] for i in range(10)]
+    assert sorted(len(batch) for batch in function.batches) == [1, 3, 3, 3]
+    assert function.peak == 2
+
+
+def test_embedding_from_shared_pool_workers_does_not_deadlock():
+    function = RecordingEmbeddingFunction(delay=0.01)
+    embedder = BatchEmbedder(function, batch_size=1, max_concurrency=2, cache=False)
+    texts = [f"text-{i}" for i in range(4)]
+
+    set_max_workers(1)
+    try:
+        future = get_shared_pool("thread").submit(embedder.embed, texts)
+        assert future.result(timeout=5) == [[float(i)] for i in range(4)]
+    finally:
+        set_max_workers(DEFAULT_MAX_WORKERS)
+
+
+def test_splits_batches_that_exceed_the_character_budget():
+    function = RecordingEmbeddingFunction()
+    embedder = BatchEmbedder(function, batch_size=100, max_concurrency=1)
+    long_text = "x" * (MAX_BATCH_CHARACTERS // 2 + 1)
+
+    embedder.embed([f"{long_text}-1", f"{long_text}-2"])
+
+    assert [len(batch) for batch in function.batches] == [1, 1]
+
+
+def test_empty_input_embeds_nothing():
+    function = RecordingEmbeddingFunction()
+    embedder = BatchEmbedder(function, cache=False)
+
+    assert embedder.embed([]) == []
+    assert function.batches == []
+
+
+def test_retries_failed_batches():
+    function = RecordingEmbeddingFunction(failures=2)
+    embedder = BatchEmbedder(function, max_retries=2, retry_delay=0)
+
+    assert embedder.embed(["text-1"]) == [[1.0]]
+    assert len(function.batches) == 3
+
+
+def test_gives_up_after_max_retries():
+    function = RecordingEmbeddingFunction(failures=5)
+    embedder = BatchEmbedder(function, max_retries=1, retry_delay=0)
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        embedder.embed(["text-1"])
+
+
+def test_from_config_uses_provider_batch_size_and_options():
+    function = RecordingEmbeddingFunction()
+
+    cohere = BatchEmbedder.from_config(
+        function, {"provider": "cohere", "config": {"model": "embed-english-v3.0"}}
+    )
+    tuned = BatchEmbedder.from_config(
+        function,
+        {"provider": "openai", "config": {}, "batch_size": 10, "max_concurrency": 8},
+    )
+
+    assert cohere.batch_size == 96
+    assert cohere.fingerprint == "cohere/embed-english-v3.0"
+    assert (tuned.batch_size, tuned.max_concurrency) == (10, 8)
+
+
+@pytest.fixture(autouse=True)
+def clean_rate_limiters_and_cache():
+    reset_rate_limiters()
+    get_embedding_cache().clear()
+    yield
+    reset_rate_limiters()
+    get_embedding_cache().clear()
+
+
+def test_max_rpm_waits_for_the_shared_limiter():
+    function = RecordingEmbeddingFunction()
+    embedder = BatchEmbedder(function, fingerprint="test/rpm", max_rpm=60)
+
+    with patch("crewai.utilities.rate_limiter.time.sleep") as sleep:
+        for i in range(61):
+            embedder.embed([f"text-{i}"])
+
+    sleep.assert_called_once()
+
+
+def test_embedder_fingerprint_ignores_credentials():
+    first = {"provider": "openai", "config": {"model": "m", "api_key": "a"}}
+    second = {"provider": "openai", "config": {"model": "m", "api_key": "b"}}
+
+    assert embedder_fingerprint(first) == embedder_fingerprint(second) == "openai/m"
+    assert embedder_fingerprint(None) == "openai/text-embedding-3-small"
+
+
+def test_embedder_fingerprint_includes_model_options():
+    default = {"provider": "openai", "config": {"model": "text-embedding-3-small"}}
+    reduced = {
+        "provider": "openai",
+        "config": {"model": "text-embedding-3-small", "dimensions": 256},
+    }
+    first_endpoint = {
+        "provider": "huggingface",
+        "config": {"api_url": "https://a.example/embed", "api_key": "x"},
+    }
+    second_endpoint = {
+        "provider": "huggingface",
+        "config": {"api_url": "https://b.example/embed", "api_key": "x"},
+    }
+
+    assert embedder_fingerprint(reduced) != embedder_fingerprint(default)
+    assert embedder_fingerprint(first_endpoint) != embedder_fingerprint(
+        second_endpoint
+    )
+    assert embedder_fingerprint(first_endpoint).startswith("huggingface/")
+
+
+def test_cached_texts_are_not_embedded_again():
+    function = RecordingEmbeddingFunction()
+    embedder = BatchEmbedder(function, fingerprint="test/cache")
+
+    embedder.embed(["text-1", "text-2"])
+    vectors = embedder.embed(["text-2", "text-3", "text-3"])
+
+    assert [list(vector) for vector in vectors] == [[2.0], [3.0], [3.0]]
+    assert function.batches == [["text-1", "text-2"], ["text-3"]]
+
+
+def test_cache_can_be_disabled():
+    function = RecordingEmbeddingFunction()
+    embedder = BatchEmbedder(function, fingerprint="test/cache", cache=False)
+
+    embedder.embed(["text-1"])
+    embedder.embed(["text-1"])
+
+    assert len(function.batches) == 2
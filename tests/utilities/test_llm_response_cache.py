@@ -0,0 +1,74 @@
+import time
+
+from crewai.utilities.llm_response_cache import LLMResponseCache
+
+
+def _response(content: str):
+    return {"content": content, "tool_calls": [], "usage": None}
+
+
+def test_make_key_is_canonical_and_ignores_credentials():
+    first = LLMResponseCache.make_key(
+        {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}], "api_key": "a"}
+    )
+    second = LLMResponseCache.make_key(
+        {"api_key": "b", "messages": [{"content": "hi", "role": "user"}], "model": "gpt-4o"}
+    )
+    different = LLMResponseCache.make_key(
+        {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]}
+    )
+
+    assert first == second
+    assert first != different
+
+
+def test_make_key_skips_params_without_a_stable_encoding():
+    class Opaque:
+        pass
+
+    assert LLMResponseCache.make_key({"model": "gpt-4o", "client": Opaque()}) is None
+    assert LLMResponseCache.make_key({"model": "gpt-4o", "stop": {"b", "a"}}) == (
+        LLMResponseCache.make_key({"model": "gpt-4o", "stop": {"a", "b"}})
+    )
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = LLMResponseCache(max_memory_entries=2, persist=False)
+    cache.set("a", _response("a"))
+    cache.set("b", _response("b"))
+    assert cache.get("a") is not None
+    cache.set("c", _response("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a")["content"] == "a"
+    assert cache.get("c")["content"] == "c"
+
+
+def test_disk_tier_survives_new_instances(tmp_path):
+    db_path = str(tmp_path / "llm_cache.db")
+    LLMResponseCache(db_path=db_path).set("key", _response("persisted"))
+
+    fresh = LLMResponseCache(db_path=db_path)
+    assert fresh.get("key")["content"] == "persisted"
+    assert fresh.hits == 1
+
+
+def test_disk_tier_respects_size_limit(tmp_path):
+    db_path = str(tmp_path / "llm_cache.db")
+    cache = LLMResponseCache(db_path=db_path, max_disk_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, _response(key))
+        time.sleep(0.01)
+
+    fresh = LLMResponseCache(db_path=db_path)
+    assert fresh.get("a") is None
+    assert fresh.get("c")["content"] == "c"
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"), ttl=0.05)
+    cache.set("key", _response("stale"))
+    time.sleep(0.1)
+
+    assert cache.get("key") is None
+    assert LLMResponseCache(db_path=str(tmp_path / "llm_cache.db")).get("key") is None
@@ -0,0 +1,212 @@
+import numpy as np
+import pytest
+
+from crewai.utilities.numpy_vector_store import (
+    NumpyCollection,
+    matches_filter,
+    vector_store_backend,
+)
+
+
+def _collection(path=None) -> NumpyCollection:
+    collection = NumpyCollection(str(path) if path else None)
+    collection.add(
+        ids=["north", "east", "south"],
+        documents=["north doc", "east doc", "south doc"],
+        embeddings=[[0.0, 2.0], [3.0, 0.0], [0.0, -1.0]],
+        metadatas=[{"source": "a"}, {"source": "b"}, {"source": "a"}],
+    )
+    return collection
+
+
+def test_query_returns_nearest_documents_by_cosine_distance():
+    collection = _collection()
+
+    results = collection.query(query_embeddings=[[0.1, 1.0]], n_results=2)
+
+    assert results["ids"] == [["north", "east"]]
+    assert results["documents"] == [["north doc", "east doc"]]
+    assert results["distances"][0][0] == pytest.approx(
+        1 - 1 / np.sqrt(1.01), abs=1e-6
+    )
+
+
+def test_query_applies_metadata_filters():
+    collection = _collection()
+
+    results = collection.query(
+        query_embeddings=[[1.0, 0.0]], n_results=3, where={"source": "a"}
+    )
+
+    assert sorted(results["ids"][0]) == ["north", "south"]
+
+
+def test_upsert_replaces_existing_ids_and_delete_removes_them():
+    collection = _collection()
+
+    collection.upsert(
+        ids=["north"], documents=["moved west"], embeddings=[[-1.0, 0.0]]
+    )
+    collection.delete(ids=["east"])
+
+    results = collection.query(query_embeddings=[[-1.0, 0.0]], n_results=1)
+    assert results["documents"] == [["moved west"]]
+    assert collection.count() == 2
+
+
+def test_persists_and_memory_maps_the_matrix(tmp_path):
+    _collection(tmp_path / "collection").close()
+
+    reopened = NumpyCollection(str(tmp_path / "collection"))
+
+    assert reopened.count() == 3
+    assert isinstance(reopened._vectors, np.memmap)
+    assert reopened.query(query_embeddings=[[1.0, 0.0]], n_results=1)["ids"] == [
+        ["east"]
+    ]
+    reopened.add(ids=["west"], documents=["west doc"], embeddings=[[-1.0, 0.0]])
+    assert NumpyCollection(str(tmp_path / "collection")).count() == 4
+
+
+def test_writes_are_journaled_until_compaction(tmp_path):
+    path = tmp_path / "collection"
+    collection = _collection(path)
+    collection.upsert(ids=["north"], documents=["moved"], embeddings=[[-1.0, 0.0]])
+    collection.delete(ids=["east"])
+
+    assert not (path / "records.json").exists()
+    reopened = NumpyCollection(str(path))
+    assert reopened.count() == 2
+    assert reopened.query(query_embeddings=[[-1.0, 0.0]], n_results=1)[
+        "documents"
+    ] == [["moved"]]
+
+    reopened.close()
+    assert (path / "records.json").exists()
+    assert not (path / "journal.jsonl").exists()
+    assert NumpyCollection(str(path)).count() == 2
+
+
+def test_journal_is_compacted_once_it_outgrows_the_snapshot(tmp_path):
+    from unittest.mock import patch
+
+    path = tmp_path / "collection"
+    with patch("crewai.utilities.numpy_vector_store.MIN_COMPACTION_ROWS", 2):
+        collection = _collection(path)
+        assert (path / "records.json").exists()
+        assert not (path / "journal.jsonl").exists()
+
+        collection.add(ids=["west"], documents=["west doc"], embeddings=[[-1.0, 0.0]])
+
+    assert (path / "journal.jsonl").exists()
+    assert NumpyCollection(str(path)).count() == 4
+
+
+def test_torn_journal_writes_are_dropped(tmp_path):
+    path = tmp_path / "collection"
+    _collection(path)
+    with open(path / "journal.f32", "ab") as f:
+        f.write(np.zeros(2, dtype=np.float32).tobytes())
+
+    reopened = NumpyCollection(str(path))
+    reopened.add(ids=["west"], documents=["west doc"], embeddings=[[-1.0, 0.0]])
+
+    assert NumpyCollection(str(path)).count() == 4
+
+
+def test_snapshot_interrupted_before_its_commit_keeps_the_data(tmp_path):
+    import os
+    from unittest.mock import patch
+
+    path = tmp_path / "collection"
+    collection = _collection(path)
+    collection.compact()
+    collection.add(ids=["west"], documents=["west doc"], embeddings=[[-1.0, 0.0]])
+
+    replace = os.replace
+    calls = []
+
+    def crash_after_first_replace(src, dst):
+        calls.append(dst)
+        if len(calls) > 1:
+            raise OSError("crashed")
+        replace(src, dst)
+
+    with patch(
+        "crewai.utilities.numpy_vector_store.os.replace",
+        side_effect=crash_after_first_replace,
+    ):
+        try:
+            collection.compact()
+        except OSError:
+            pass
+
+    reopened = NumpyCollection(str(path))
+    assert reopened.count() == 4
+    assert reopened.query(query_embeddings=[[-1.0, 0.0]], n_results=1)["ids"] == [
+        ["west"]
+    ]
+    reopened.close()
+    assert len(list(path.glob("embeddings*.npy"))) == 1
+    assert NumpyCollection(str(path)).count() == 4
+
+
+def test_loads_snapshots_that_keep_their_vectors_in_embeddings_npy(tmp_path):
+    import json
+
+    path = tmp_path / "collection"
+    path.mkdir()
+    np.save(path / "embeddings.npy", np.array([[1.0, 0.0]], dtype=np.float32))
+    (path / "records.json").write_text(
+        json.dumps({"ids": ["east"], "documents": ["east doc"], "metadatas": [None]})
+    )
+
+    collection = NumpyCollection(str(path))
+    assert collection.count() == 1
+    collection.add(ids=["west"], documents=["west doc"], embeddings=[[-1.0, 0.0]])
+    collection.close()
+
+    assert not (path / "embeddings.npy").exists()
+    assert NumpyCollection(str(path)).count() == 2
+
+
+def test_reset_removes_the_files(tmp_path):
+    collection = _collection(tmp_path / "collection")
+
+    collection.reset()
+
+    assert collection.count() == 0
+    assert not (tmp_path / "collection").exists()
+    assert collection.query(query_embeddings=[[1.0, 0.0]])["ids"] == [[]]
+
+
+def test_rejects_embeddings_of_another_dimension():
+    collection = _collection()
+
+    with pytest.raises(ValueError, match="dimension"):
+        collection.add(ids=["3d"], documents=["3d"], embeddings=[[1.0, 0.0, 0.0]])
+
+
+@pytest.mark.parametrize(
+    "where, expected",
+    [
+        ({"source": "a"}, True),
+        ({"source": {"$ne": "a"}}, False),
+        ({"rank": {"$gte": 2, "$lt": 5}}, True),
+        ({"source": {"$in": ["b", "c"]}}, False),
+        ({"$or": [{"source": "b"}, {"rank": 3}]}, True),
+        ({"$and": [{"source": "a"}, {"rank": {"$gt": 3}}]}, False),
+    ],
+)
+def test_matches_filter(where, expected):
+    assert matches_filter({"source": "a", "rank": 3}, where) is expected
+
+
+def test_vector_store_backend(monkeypatch):
+    monkeypatch.delenv("CREWAI_VECTOR_STORE", raising=False)
+    assert vector_store_backend() == "chroma"
+    monkeypatch.setenv("CREWAI_VECTOR_STORE", "numpy")
+    assert vector_store_backend() == "numpy"
+    assert vector_store_backend({"vector_store": "chroma"}) == "chroma"
+    with pytest.raises(ValueError):
+        vector_store_backend({"vector_store": "faiss"})
@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from crewai.utilities.rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    reset_rate_limiters,
+)
+from crewai.utilities.rpm_controller import RPMController
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+def test_token_bucket_waits_only_for_the_missing_fraction():
+    bucket = TokenBucket.per_minute(60)
+
+    assert bucket.reserve(60) == 0
+    # One request per second refill: the next one needs about a second.
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+    # Reservations queue up behind each other instead of all waiting a minute.
+    assert bucket.reserve(1) == pytest.approx(2.0, abs=0.05)
+
+
+def test_token_bucket_refills_over_time():
+    with patch("crewai.utilities.rate_limiter.time.monotonic", return_value=100.0):
+        bucket = TokenBucket.per_minute(60)
+        bucket.reserve(60)
+    with patch("crewai.utilities.rate_limiter.time.monotonic", return_value=130.0):
+        assert bucket.tokens == pytest.approx(30.0)
+    with patch("crewai.utilities.rate_limiter.time.monotonic", return_value=1000.0):
+        assert bucket.tokens == pytest.approx(60.0)
+
+
+def test_rate_limiter_delays_after_token_budget_is_overdrawn():
+    limiter = RateLimiter(max_tpm=600)
+
+    assert limiter.reserve() == 0
+    limiter.record_tokens(1200)
+    # 600 tokens overdrawn at 10 tokens per second.
+    assert limiter.reserve() == pytest.approx(60.0, abs=0.1)
+
+
+def test_rate_limiter_acquire_sleeps_for_the_reserved_delay():
+    limiter = RateLimiter(max_rpm=60)
+    for _ in range(60):
+        limiter.reserve()
+
+    with patch("crewai.utilities.rate_limiter.time.sleep") as sleep:
+        limiter.acquire()
+    sleep.assert_called_once()
+    assert sleep.call_args[0][0] == pytest.approx(1.0, abs=0.05)
+
+
+def test_rate_limiter_aacquire_does_not_block_the_loop():
+    limiter = RateLimiter(max_rpm=60)
+    for _ in range(60):
+        limiter.reserve()
+
+    async def run():
+        with patch(
+            "crewai.utilities.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            return await limiter.aacquire(), sleep
+
+    waited, sleep = asyncio.run(run())
+    assert waited == pytest.approx(1.0, abs=0.05)
+    sleep.assert_called_once()
+
+
+def test_get_rate_limiter_is_shared_per_key_and_limits():
+    first = get_rate_limiter("openai/gpt-4o", max_rpm=100)
+    second = get_rate_limiter("openai/gpt-4o", max_rpm=100)
+    stricter = get_rate_limiter("openai/gpt-4o", max_rpm=10, max_tpm=1000)
+    other = get_rate_limiter("anthropic/claude-3", max_rpm=100)
+
+    assert first is second
+    assert stricter is not first and other is not first
+    # A stricter caller does not throttle the ones that set a higher limit.
+    assert first.max_rpm == 100 and first.max_tpm is None
+    assert (stricter.max_rpm, stricter.max_tpm) == (10, 1000)
+
+
+def test_rpm_controller_with_key_shares_budget():
+    first = RPMController(max_rpm=1, key="crew")
+    second = RPMController(max_rpm=1, key="crew")
+
+    with patch.object(RPMController, "_wait") as wait:
+        first.check_or_wait()
+        wait.assert_not_called()
+        second.check_or_wait()
+        wait.assert_called_once()
+
+
+
+def test_reconfigured_limit_keeps_the_budget_already_used():
+    limiter = RateLimiter(max_rpm=100)
+    for _ in range(95):
+        limiter.reserve()
+
+    limiter.configure(max_rpm=10)
+    # 95 of the requests are still in the window, so the next one waits.
+    assert limiter.reserve() > 0
+
+    limiter.configure(max_rpm=1000)
+    # A higher limit is applied too, with the same requests already used.
+    assert limiter.max_rpm == 1000
+    assert limiter.reserve() == 0
+
+
+def test_rpm_controllers_of_one_model_share_a_budget_per_scope():
+    first = RPMController(max_rpm=1, key=RPMController.key_for("agent", ["gpt-4o"]))
+    second = RPMController(
+        max_rpm=1, key=RPMController.key_for("agent", ["openai/gpt-4o"])
+    )
+    crew = RPMController(max_rpm=1, key=RPMController.key_for("crew", ["gpt-4o"]))
+
+    with patch.object(RPMController, "_wait") as wait:
+        first.check_or_wait()
+        crew.check_or_wait()
+        wait.assert_not_called()
+        second.check_or_wait()
+        wait.assert_called_once()
+
+
+def test_rpm_controller_key_needs_a_single_model():
+    assert RPMController.key_for("crew", ["gpt-4o", "anthropic/claude-3"]) is None
+    assert RPMController.key_for("crew", []) is None
+    assert RPMController.key_for("agent", [None]) is None
+
+
+def test_agents_default_to_a_budget_per_model():
+    from crewai import Agent
+
+    agents = [
+        Agent(role=f"r{i}", goal="g", backstory="b", llm="gpt-4o", max_rpm=5)
+        for i in range(2)
+    ]
+
+    assert agents[0]._rpm_controller.key == "agent:openai/gpt-4o"
+    assert agents[0]._rpm_controller._limiter is agents[1]._rpm_controller._limiter